@@ -0,0 +1,39 @@
+"""Add user is_celebrity
+
+Revision ID: 0b7d3e9c5a21
+Revises: f31205fedca0
+Create Date: 2026-10-18 19:12:07.402815
+
+"""
+import os
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0b7d3e9c5a21"
+down_revision = "f31205fedca0"
+branch_labels = None
+depends_on = None
+
+# Порог из окружения приложения, чтобы в режиме hybrid лента не теряла
+# твиты знаменитостей до пересчёта rebuild-timelines
+CELEBRITY_THRESHOLD = int(os.environ.get("CELEBRITY_THRESHOLD", 10000))
+
+
+def upgrade() -> None:
+    op.add_column(
+        "user",
+        sa.Column(
+            "is_celebrity", sa.Boolean(), server_default=sa.false(), nullable=False
+        ),
+    )
+    op.execute(
+        sa.text(
+            'UPDATE "user" SET is_celebrity = true WHERE follower_count >= :threshold'
+        ).bindparams(threshold=CELEBRITY_THRESHOLD)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("user", "is_celebrity")
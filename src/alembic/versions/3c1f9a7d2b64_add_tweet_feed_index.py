@@ -0,0 +1,26 @@
+"""Add tweet feed index
+
+Revision ID: 3c1f9a7d2b64
+Revises: 8604d393e55a
+Create Date: 2026-10-18 10:12:41.503127
+
+"""
+from alembic import op
+
+revision = "3c1f9a7d2b64"
+down_revision = "8604d393e55a"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_tweet_user_id_datetime_id",
+        "tweet",
+        ["user_id", "datetime", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tweet_user_id_datetime_id", table_name="tweet")
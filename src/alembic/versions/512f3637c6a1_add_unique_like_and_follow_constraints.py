@@ -0,0 +1,87 @@
+"""Add unique like and follow constraints
+
+Revision ID: 512f3637c6a1
+Revises: b051f66ff1d2
+Create Date: 2026-10-18 17:12:40.118203
+
+"""
+from alembic import op
+
+revision = "512f3637c6a1"
+down_revision = "b051f66ff1d2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Дубликаты, созданные гонкой проверки и вставки, удаляются с поправкой
+    # денормализованных счётчиков, остаётся самая ранняя строка
+    op.execute(
+        """
+        UPDATE tweet SET like_count = like_count - duplicates.extra
+        FROM (
+            SELECT tweet_id, count(*) - count(DISTINCT user_id) AS extra
+            FROM "like" GROUP BY tweet_id
+            HAVING count(*) > count(DISTINCT user_id)
+        ) AS duplicates
+        WHERE tweet.id = duplicates.tweet_id
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM "like" a USING "like" b
+        WHERE a.user_id = b.user_id AND a.tweet_id = b.tweet_id AND a.id > b.id
+        """
+    )
+    op.execute(
+        """
+        UPDATE "user" SET
+            following_count = following_count - coalesce(
+                (
+                    SELECT count(*) - count(DISTINCT followed_user_id) FROM follow
+                    WHERE follow.following_user_id = "user".id
+                ),
+                0
+            ),
+            follower_count = follower_count - coalesce(
+                (
+                    SELECT count(*) - count(DISTINCT following_user_id) FROM follow
+                    WHERE follow.followed_user_id = "user".id
+                ),
+                0
+            )
+        WHERE id IN (
+            SELECT following_user_id FROM follow
+            GROUP BY following_user_id, followed_user_id HAVING count(*) > 1
+            UNION
+            SELECT followed_user_id FROM follow
+            GROUP BY following_user_id, followed_user_id HAVING count(*) > 1
+        )
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM follow a USING follow b
+        WHERE a.following_user_id = b.following_user_id
+            AND a.followed_user_id = b.followed_user_id
+            AND a.id > b.id
+        """
+    )
+    op.create_unique_constraint(
+        "uq_like_user_id_tweet_id", "like", ["user_id", "tweet_id"]
+    )
+    op.create_unique_constraint(
+        "uq_follow_following_user_id_followed_user_id",
+        "follow",
+        ["following_user_id", "followed_user_id"],
+    )
+    # Уникальный индекс (user_id, tweet_id) покрывает поиск по user_id
+    op.drop_index("ix_like_user_id", table_name="like")
+
+
+def downgrade() -> None:
+    op.create_index("ix_like_user_id", "like", ["user_id"], unique=False)
+    op.drop_constraint(
+        "uq_follow_following_user_id_followed_user_id", "follow", type_="unique"
+    )
+    op.drop_constraint("uq_like_user_id_tweet_id", "like", type_="unique")
@@ -0,0 +1,39 @@
+"""Add media processing claims
+
+Revision ID: 5e2a9c4f7b18
+Revises: 0b7d3e9c5a21
+Create Date: 2026-10-18 20:03:51.227140
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "5e2a9c4f7b18"
+down_revision = "0b7d3e9c5a21"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "media",
+        sa.Column("processing_started_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "media",
+        sa.Column(
+            "processing_attempts", sa.Integer(), server_default="0", nullable=False
+        ),
+    )
+    # {} означало "захвачено или не удалось": такие записи снова ждут обработки
+    op.execute("UPDATE media SET variants = NULL WHERE variants = '{}'::jsonb")
+
+
+def downgrade() -> None:
+    op.execute(
+        "UPDATE media SET variants = '{}'::jsonb "
+        "WHERE variants IS NULL AND processing_attempts > 0"
+    )
+    op.drop_column("media", "processing_attempts")
+    op.drop_column("media", "processing_started_at")
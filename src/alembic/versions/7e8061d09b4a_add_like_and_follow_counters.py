@@ -0,0 +1,66 @@
+"""Add like and follow counters
+
+Revision ID: 7e8061d09b4a
+Revises: a9e4c2d71f03
+Create Date: 2026-10-18 17:00:56.629532
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "7e8061d09b4a"
+down_revision = "a9e4c2d71f03"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_like_tweet_id_id", "like", ["tweet_id", "id"], unique=False)
+    op.add_column(
+        "tweet",
+        sa.Column("like_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "user",
+        sa.Column("follower_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "user",
+        sa.Column("following_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.execute(
+        """
+        UPDATE tweet SET like_count = counts.total
+        FROM (SELECT tweet_id, count(*) AS total FROM "like" GROUP BY tweet_id)
+            AS counts
+        WHERE tweet.id = counts.tweet_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE "user" SET follower_count = counts.total
+        FROM (
+            SELECT followed_user_id, count(*) AS total
+            FROM follow GROUP BY followed_user_id
+        ) AS counts
+        WHERE "user".id = counts.followed_user_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE "user" SET following_count = counts.total
+        FROM (
+            SELECT following_user_id, count(*) AS total
+            FROM follow GROUP BY following_user_id
+        ) AS counts
+        WHERE "user".id = counts.following_user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("user", "following_count")
+    op.drop_column("user", "follower_count")
+    op.drop_column("tweet", "like_count")
+    op.drop_index("ix_like_tweet_id_id", table_name="like")
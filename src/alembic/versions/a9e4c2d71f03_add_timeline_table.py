@@ -0,0 +1,53 @@
+"""Add timeline table
+
+Revision ID: a9e4c2d71f03
+Revises: 3c1f9a7d2b64
+Create Date: 2026-10-18 11:02:17.884310
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "a9e4c2d71f03"
+down_revision = "3c1f9a7d2b64"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "timeline",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("tweet_id", sa.Integer(), nullable=False),
+        sa.Column("author_id", sa.Integer(), nullable=False),
+        sa.Column("datetime", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["author_id"],
+            ["user.id"],
+        ),
+        sa.ForeignKeyConstraint(["tweet_id"], ["tweet.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["user.id"],
+        ),
+        sa.PrimaryKeyConstraint("user_id", "tweet_id"),
+    )
+    op.create_index(
+        "ix_timeline_user_id_datetime_tweet_id",
+        "timeline",
+        ["user_id", "datetime", "tweet_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_timeline_user_id_author_id",
+        "timeline",
+        ["user_id", "author_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_timeline_user_id_author_id", table_name="timeline")
+    op.drop_index("ix_timeline_user_id_datetime_tweet_id", table_name="timeline")
+    op.drop_table("timeline")
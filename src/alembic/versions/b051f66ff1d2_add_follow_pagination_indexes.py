@@ -0,0 +1,44 @@
+"""Add follow pagination indexes
+
+Revision ID: b051f66ff1d2
+Revises: 7e8061d09b4a
+Create Date: 2026-10-18 17:04:03.768965
+
+"""
+from alembic import op
+
+revision = "b051f66ff1d2"
+down_revision = "7e8061d09b4a"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_follow_followed_user_id_id",
+        "follow",
+        ["followed_user_id", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_follow_following_user_id_id",
+        "follow",
+        ["following_user_id", "id"],
+        unique=False,
+    )
+    op.drop_index("ix_follow_followed_user_id", table_name="follow")
+    op.drop_index("ix_follow_following_user_id", table_name="follow")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_follow_following_user_id",
+        "follow",
+        ["following_user_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_follow_followed_user_id", "follow", ["followed_user_id"], unique=False
+    )
+    op.drop_index("ix_follow_following_user_id_id", table_name="follow")
+    op.drop_index("ix_follow_followed_user_id_id", table_name="follow")
@@ -0,0 +1,39 @@
+"""Add content addressed media
+
+Revision ID: ce70a50c4587
+Revises: 512f3637c6a1
+Create Date: 2026-10-18 17:21:05.402117
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "ce70a50c4587"
+down_revision = "512f3637c6a1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Для уже загруженных файлов hash остаётся NULL, они хранятся по старым
+    # ссылкам и удаляются сборщиком мусора, когда на них не ссылаются твиты
+    op.add_column("media", sa.Column("hash", sa.String(length=64), nullable=True))
+    op.add_column(
+        "media",
+        sa.Column(
+            "uploaded_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+    op.create_unique_constraint("uq_media_hash", "media", ["hash"])
+    op.drop_index("ix_media_link", table_name="media")
+
+
+def downgrade() -> None:
+    op.create_index("ix_media_link", "media", ["link"], unique=False)
+    op.drop_constraint("uq_media_hash", "media", type_="unique")
+    op.drop_column("media", "uploaded_at")
+    op.drop_column("media", "hash")
@@ -0,0 +1,47 @@
+"""Add tweet full text search
+
+Revision ID: cf297092a79d
+Revises: d3b8e1f5a7c2
+Create Date: 2026-10-18 17:24:13.361184
+
+"""
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision = "cf297092a79d"
+down_revision = "d3b8e1f5a7c2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # B-tree по тексту не помогает искать слова и замедляет каждую вставку
+    op.drop_index("ix_tweet_text", table_name="tweet")
+    # Вычисляемый столбец заполняется для существующих строк при добавлении
+    op.add_column(
+        "tweet",
+        sa.Column(
+            "text_search",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "to_tsvector('simple'::regconfig, coalesce(text, ''))",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_tweet_text_search",
+        "tweet",
+        ["text_search"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tweet_text_search", table_name="tweet", postgresql_using="gin")
+    op.drop_column("tweet", "text_search")
+    op.create_index("ix_tweet_text", "tweet", ["text"], unique=False)
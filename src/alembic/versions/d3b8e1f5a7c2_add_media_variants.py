@@ -0,0 +1,28 @@
+"""Add media variants
+
+Revision ID: d3b8e1f5a7c2
+Revises: ce70a50c4587
+Create Date: 2026-10-18 17:34:51.220914
+
+"""
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision = "d3b8e1f5a7c2"
+down_revision = "ce70a50c4587"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Варианты для уже загруженных файлов создаются командой process-media
+    op.add_column(
+        "media",
+        sa.Column("variants", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("media", "variants")
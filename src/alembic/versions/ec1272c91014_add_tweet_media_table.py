@@ -0,0 +1,66 @@
+"""Add tweet media table
+
+Revision ID: ec1272c91014
+Revises: f341225dd983
+Create Date: 2026-10-18 17:34:15.409190
+
+"""
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision = "ec1272c91014"
+down_revision = "f341225dd983"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tweet_media",
+        sa.Column("tweet_id", sa.Integer(), nullable=False),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.Column("media_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["media_id"], ["media.id"]),
+        sa.ForeignKeyConstraint(["tweet_id"], ["tweet.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("tweet_id", "position"),
+    )
+    # Порядок вложений переносится из позиции в массиве, id удалённых
+    # медиа, которые раньше отдавались как null, пропускаются
+    op.execute(
+        """
+        INSERT INTO tweet_media (tweet_id, position, media_id)
+        SELECT tweet.id, row_number() OVER (
+            PARTITION BY tweet.id ORDER BY attached.position
+        ), attached.media_id
+        FROM tweet
+        CROSS JOIN unnest(tweet.data) WITH ORDINALITY
+            AS attached (media_id, position)
+        JOIN media ON media.id = attached.media_id
+        """
+    )
+    op.create_index(
+        "ix_tweet_media_media_id", "tweet_media", ["media_id"], unique=False
+    )
+    op.drop_column("tweet", "data")
+
+
+def downgrade() -> None:
+    op.add_column(
+        "tweet",
+        sa.Column("data", postgresql.ARRAY(sa.INTEGER()), nullable=True),
+    )
+    op.execute(
+        """
+        UPDATE tweet SET data = attached.media_ids
+        FROM (
+            SELECT tweet_id, array_agg(media_id ORDER BY position) AS media_ids
+            FROM tweet_media
+            GROUP BY tweet_id
+        ) AS attached
+        WHERE tweet.id = attached.tweet_id
+        """
+    )
+    op.drop_index("ix_tweet_media_media_id", table_name="tweet_media")
+    op.drop_table("tweet_media")
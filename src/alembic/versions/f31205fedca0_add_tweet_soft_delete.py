@@ -0,0 +1,53 @@
+"""Add tweet soft delete
+
+Revision ID: f31205fedca0
+Revises: ec1272c91014
+Create Date: 2026-10-18 18:02:41.118532
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "f31205fedca0"
+down_revision = "ec1272c91014"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "tweet", sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True)
+    )
+    op.drop_index("ix_tweet_user_id_datetime_id", table_name="tweet")
+    op.create_index(
+        "ix_tweet_user_id_datetime_id",
+        "tweet",
+        ["user_id", "datetime", "id"],
+        unique=False,
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+    op.create_index(
+        "ix_tweet_deleted_at",
+        "tweet",
+        ["deleted_at"],
+        unique=False,
+        postgresql_where=sa.text("deleted_at IS NOT NULL"),
+    )
+    op.create_index("ix_timeline_tweet_id", "timeline", ["tweet_id"], unique=False)
+
+
+def downgrade() -> None:
+    # Твиты, удалённые, но ещё не очищенные, удаляются окончательно
+    # вместе с лайками и записями лент каскадом
+    op.execute("DELETE FROM tweet WHERE deleted_at IS NOT NULL")
+    op.drop_index("ix_timeline_tweet_id", table_name="timeline")
+    op.drop_index("ix_tweet_deleted_at", table_name="tweet")
+    op.drop_index("ix_tweet_user_id_datetime_id", table_name="tweet")
+    op.create_index(
+        "ix_tweet_user_id_datetime_id",
+        "tweet",
+        ["user_id", "datetime", "id"],
+        unique=False,
+    )
+    op.drop_column("tweet", "deleted_at")
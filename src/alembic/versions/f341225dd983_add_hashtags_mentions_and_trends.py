@@ -0,0 +1,71 @@
+"""Add hashtags mentions and trends
+
+Revision ID: f341225dd983
+Revises: cf297092a79d
+Create Date: 2026-10-18 17:28:36.585670
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "f341225dd983"
+down_revision = "cf297092a79d"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Хештеги и упоминания существующих твитов заполняются командой
+    # rebuild-tags
+    op.create_table(
+        "hashtag",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("name"),
+    )
+    op.create_table(
+        "hashtag_bucket",
+        sa.Column("bucket", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("hashtag_id", sa.Integer(), nullable=False),
+        sa.Column("count", sa.Integer(), server_default="0", nullable=False),
+        sa.ForeignKeyConstraint(["hashtag_id"], ["hashtag.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("bucket", "hashtag_id"),
+    )
+    op.create_table(
+        "mention",
+        sa.Column("tweet_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["tweet_id"], ["tweet.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("tweet_id", "user_id"),
+    )
+    op.create_index(
+        "ix_mention_user_id_tweet_id", "mention", ["user_id", "tweet_id"], unique=False
+    )
+    op.create_table(
+        "tweet_hashtag",
+        sa.Column("tweet_id", sa.Integer(), nullable=False),
+        sa.Column("hashtag_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["hashtag_id"], ["hashtag.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["tweet_id"], ["tweet.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("tweet_id", "hashtag_id"),
+    )
+    op.create_index(
+        "ix_tweet_hashtag_hashtag_id_tweet_id",
+        "tweet_hashtag",
+        ["hashtag_id", "tweet_id"],
+        unique=False,
+    )
+    op.create_index("ix_user_name", "user", ["name"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_name", table_name="user")
+    op.drop_index("ix_tweet_hashtag_hashtag_id_tweet_id", table_name="tweet_hashtag")
+    op.drop_table("tweet_hashtag")
+    op.drop_index("ix_mention_user_id_tweet_id", table_name="mention")
+    op.drop_table("mention")
+    op.drop_table("hashtag_bucket")
+    op.drop_table("hashtag")
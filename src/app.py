@@ -1,25 +1,68 @@
 import logging
 import logging.config
 import os
+import time
+from typing import Optional, Tuple
 
 import flask
 import sentry_sdk
 from apispec.ext.marshmallow import MarshmallowPlugin
 from apispec_webframeworks.flask import FlaskPlugin
 from flasgger import APISpec, Swagger, swag_from
-from flask import Flask, jsonify, render_template, request
+from flask import Flask, g, jsonify, render_template, request
 from flask_injector import FlaskInjector
 from flask_restful import Api
 from prometheus_flask_exporter import PrometheusMetrics
 from sentry_sdk.integrations.flask import FlaskIntegration
-from sqlalchemy import and_
-from werkzeug.utils import secure_filename
-
-from src.depends import UserIdDepend, configure
+from werkzeug.exceptions import RequestEntityTooLarge
+
+from src import replicas, write_behind
+from src.cache import CacheCollector
+from src.db_metrics import (
+    POOL_CHECKOUT,
+    POOL_WAIT,
+    REQUEST_DB_TIME,
+    REQUEST_QUERIES,
+    REQUEST_SLOWEST_QUERY,
+    SLOW_REQUEST_MS,
+    PoolCollector,
+    observe_request,
+    start_tracking,
+    stop_tracking,
+)
+from src.depends import UserIdDepend, api_key_cache, configure
 from src.log_config import dict_config
-from src.models import Follow, Like, Media, Tweet, session
+from src.models import engine, session
+from src.replicas import ReplicaCollector, use_replica
 from src.schemas import FollowSchema, LikeSchema, MediaSchema, TweetSchema, UserSchema
-from src.utils import followed, liked, show_profile, show_tweets
+from src.search import SEARCH_PAGE_SIZE
+from src.tags import show_trends
+from src.uploads import (
+    MAX_CONTENT_LENGTH,
+    MEDIA_ACCEL_REDIRECT,
+    StagedUpload,
+    media_headers,
+)
+from src.utils import (
+    FEED_PAGE_SIZE,
+    LIST_PAGE_SIZE,
+    UPLOAD_FOLDER,
+    add_follow,
+    add_like,
+    create_tweet,
+    media_file,
+    remove_follow,
+    remove_like,
+    remove_tweet,
+    show_follows,
+    show_likes,
+    show_profile,
+    show_search,
+    show_tweets,
+    store_media,
+    user_cache,
+)
+from src.write_behind import WriteBehindCollector
 
 root_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -29,10 +72,29 @@ css_directory = os.path.join(template_folder, "static/css")
 images_directory = os.path.join(template_folder, "static/images")
 static_directory = os.path.join(template_folder, "static")
 
+
+class UploadRequest(flask.Request):
+    """
+    Запрос, файлы которого при разборе пишутся сразу во временный файл
+    в UPLOAD_FOLDER с подсчётом хеша, без промежуточной копии
+    """
+
+    def _get_file_stream(
+        self,
+        total_content_length: Optional[int],
+        content_type: Optional[str],
+        filename: Optional[str] = None,
+        content_length: Optional[int] = None,
+    ) -> StagedUpload:
+        return StagedUpload(app.config["UPLOAD_FOLDER"])
+
+
 app = Flask(__name__, template_folder=template_folder)
+app.request_class = UploadRequest
 
-app.config["UPLOAD_FOLDER"] = "media/"
-ALLOWED_EXTENSIONS = set(["png", "jpg", "jpeg"])
+app.config["UPLOAD_FOLDER"] = UPLOAD_FOLDER
+app.config["MAX_CONTENT_LENGTH"] = MAX_CONTENT_LENGTH
+app.config["MEDIA_ACCEL_REDIRECT"] = MEDIA_ACCEL_REDIRECT
 
 api = Api(app)
 
@@ -61,6 +123,66 @@ sentry_sdk.init(
 )
 
 metrics = PrometheusMetrics(app)
+metrics.registry.register(CacheCollector("api_key_cache", api_key_cache))
+metrics.registry.register(CacheCollector("user_cache", user_cache.local))
+metrics.registry.register(POOL_WAIT)
+metrics.registry.register(POOL_CHECKOUT)
+metrics.registry.register(PoolCollector(engine))
+metrics.registry.register(REQUEST_QUERIES)
+metrics.registry.register(REQUEST_DB_TIME)
+metrics.registry.register(REQUEST_SLOWEST_QUERY)
+if write_behind.buffer is not None:
+    metrics.registry.register(WriteBehindCollector(write_behind.buffer))
+if replicas.router is not None:
+    metrics.registry.register(ReplicaCollector(replicas.router))
+
+
+@app.before_request
+def start_query_tracking() -> None:
+    """
+    Начало сбора статистики SQL запросов текущего запроса
+    :return: None
+    """
+    g.request_started_at = time.perf_counter()
+    g.query_stats, g.query_tracking = start_tracking(
+        keep_statements=SLOW_REQUEST_MS > 0
+    )
+
+
+@app.teardown_request
+def finish_query_tracking(exception=None) -> None:
+    """
+    Выгрузка статистики SQL запросов в Prometheus и запись медленных
+    запросов в журнал
+    :param exception: Exception | None
+    :return: None
+    """
+    if "query_tracking" not in g:
+        return
+    stop_tracking(g.query_tracking)
+    stats = g.query_stats
+    endpoint = request.endpoint or "unknown"
+    observe_request(endpoint, stats)
+    elapsed_ms = (time.perf_counter() - g.request_started_at) * 1000
+    if SLOW_REQUEST_MS and elapsed_ms >= SLOW_REQUEST_MS:
+        statements = "\n".join(
+            f"  {duration * 1000:.1f} ms: {statement}"
+            for duration, statement in stats.statements
+        )
+        logger.warning(
+            f"Slow request {endpoint}: {elapsed_ms:.1f} ms, "
+            f"{stats.count} queries, {stats.total * 1000:.1f} ms in DB\n{statements}"
+        )
+
+
+@app.teardown_appcontext
+def remove_session(exception=None) -> None:
+    """
+    Закрытие сессии БД текущего запроса, незавершённая транзакция откатывается
+    :param exception: Exception | None
+    :return: None
+    """
+    session.remove()
 
 
 @app.route("/", methods=["GET", "POST"])
@@ -82,14 +204,30 @@ def add_tweet(user_id: UserIdDepend) -> flask.wrappers.Response:
     data = request.get_json()
     tweet_data = data.get("tweet_data")
     tweet_media_ids = data.get("tweet_media_ids")
-    new_tweet = Tweet(user_id=user_id, text=tweet_data, media=tweet_media_ids)
-    session.add(new_tweet)
-    session.commit()
+    new_tweet = create_tweet(user_id, tweet_data, tweet_media_ids)
     response = {"result": True, "tweet_id": new_tweet.id}
     logger.debug(f"User (ID: {user_id}) added Tweet (ID: {new_tweet.id})")
     return jsonify(response)
 
 
+@app.errorhandler(RequestEntityTooLarge)
+def request_too_large(
+    exc: RequestEntityTooLarge,
+) -> Tuple[flask.wrappers.Response, int]:
+    """
+    Обработчик превышения MAX_CONTENT_LENGTH
+    :param exc: RequestEntityTooLarge
+    :return: Tuple[Response, int]
+    """
+    response = {
+        "result": False,
+        "error_type": type(exc).__name__,
+        "error_message": exc.description,
+    }
+    logger.error("Request body is larger than MAX_CONTENT_LENGTH")
+    return jsonify(response), exc.code
+
+
 @swag_from("docs/download_media.yml")
 @app.route("/api/medias/", methods=["POST"])
 def download_media(user_id: UserIdDepend) -> flask.wrappers.Response:
@@ -98,16 +236,54 @@ def download_media(user_id: UserIdDepend) -> flask.wrappers.Response:
     :return: Response
     """
     file = request.files["file"]
-    filename = secure_filename(file.filename)
-    file_path = os.path.join(app.config["UPLOAD_FOLDER"], filename)
-    file.save(file_path)
-    file.close()
-    new_media = Media(link=file_path)
-    session.add(new_media)
-    session.commit()
-    response = {"result": True, "media_id": new_media.id}
-    logger.debug(f"User (ID: {user_id}) added Media (ID: {new_media.id})")
-    return jsonify(response)
+    try:
+        media_id = store_media(file.stream, file.filename, app.config["UPLOAD_FOLDER"])
+        response = {"result": True, "media_id": media_id}
+        logger.debug(f"User (ID: {user_id}) added Media (ID: {media_id})")
+        return jsonify(response)
+    except ValueError as exc:
+        response = {
+            "result": False,
+            "error_type": type(exc).__name__,
+            "error_message": str(exc),
+        }
+        logger.error(f"User (ID: {user_id}) got Error while adding media")
+        return jsonify(response)
+    finally:
+        file.close()
+
+
+@swag_from("docs/get_media.yml")
+@app.route("/api/medias/<id>", methods=["GET"])
+def get_media(user_id: UserIdDepend, id: int) -> flask.wrappers.Response:
+    """
+    Endpoint для получения файла медиа после проверки api-key. За nginx
+    приложение только проверяет доступ, а файл отдаёт nginx
+    по X-Accel-Redirect
+    :param id: int
+    :return: Response
+    """
+    try:
+        path = media_file(id, request.args.get("variant"), request.args.get("format"))
+    except ValueError as exc:
+        response = {
+            "result": False,
+            "error_type": type(exc).__name__,
+            "error_message": str(exc),
+        }
+        logger.error(f"User (ID: {user_id}) got Error while getting Media (ID: {id})")
+        return jsonify(response), 404
+    accel_redirect = app.config["MEDIA_ACCEL_REDIRECT"]
+    headers = media_headers(path, app.config["UPLOAD_FOLDER"], accel_redirect)
+    if accel_redirect:
+        response = flask.Response(headers=headers)
+    else:
+        response = flask.send_file(
+            os.path.abspath(path), mimetype=headers.pop("Content-Type")
+        )
+        response.headers.update(headers)
+    logger.debug(f"User (ID: {user_id}) requested Media (ID: {id})")
+    return response
 
 
 @swag_from("docs/delete_tweet.yml")
@@ -118,11 +294,9 @@ def delete_tweet(user_id: UserIdDepend, id: int) -> flask.wrappers.Response:
     :param id: int
     :return: Response
     """
-    tweet = session.query(Tweet).get(id)
-    session.delete(tweet)
-    session.commit()
+    remove_tweet(id)
     response = {"result": True}
-    logger.debug(f"User (ID: {user_id}) deleted Tweet (ID: {tweet.id})")
+    logger.debug(f"User (ID: {user_id}) deleted Tweet (ID: {id})")
     return jsonify(response)
 
 
@@ -134,15 +308,36 @@ def put_like(user_id: UserIdDepend, id: int) -> flask.wrappers.Response:
     :param id: int
     :return: Response
     """
-    if not liked(user_id, id):
-        new_like = Like(user_id=user_id, tweet_id=id)
-        session.add(new_like)
-        session.commit()
+    add_like(user_id, id)
     response = {"result": True}
     logger.debug(f"User (ID: {user_id}) liked Tweet (ID: {id})")
     return jsonify(response)
 
 
+@swag_from("docs/get_likes.yml")
+@app.route("/api/tweets/<id>/likes", methods=["GET"])
+def get_likes(user_id: UserIdDepend, id: int) -> flask.wrappers.Response:
+    """
+    Endpoint для отображения списка лайкнувших твит
+    :param id: int
+    :return: Response
+    """
+    limit = request.args.get("limit", LIST_PAGE_SIZE, type=int)
+    cursor = request.args.get("cursor")
+    try:
+        response = show_likes(id, limit=limit, cursor=cursor)
+        logger.debug(f"User (ID: {user_id}) requested likes of Tweet (ID: {id})")
+        return jsonify(response)
+    except ValueError as exc:
+        response = {
+            "result": False,
+            "error_type": type(exc).__name__,
+            "error_message": str(exc),
+        }
+        logger.error(f"User (ID: {user_id}) got Error while getting likes")
+        return jsonify(response)
+
+
 @swag_from("docs/delete_like.yml")
 @app.route("/api/tweets/<id>/likes", methods=["DELETE"])
 def delete_like(user_id: UserIdDepend, id: int) -> flask.wrappers.Response:
@@ -151,12 +346,7 @@ def delete_like(user_id: UserIdDepend, id: int) -> flask.wrappers.Response:
     :param id: int
     :return: Response
     """
-    if liked(user_id, id):
-        like = session.query(Like).filter(
-            and_(Like.user_id == user_id, Like.tweet_id == id)
-        )
-        session.delete(like.one())
-        session.commit()
+    remove_like(user_id, id)
     response = {"result": True}
     logger.debug(f"User (ID: {user_id}) deleted liked from Tweet (ID: {id})")
     return jsonify(response)
@@ -170,10 +360,7 @@ def follow_user(user_id: UserIdDepend, id: int) -> flask.wrappers.Response:
     :param id: int
     :return: Response
     """
-    if not followed(user_id, id):
-        new_follow = Follow(following_user_id=user_id, followed_user_id=id)
-        session.add(new_follow)
-        session.commit()
+    add_follow(user_id, id)
     response = {"result": True}
     logger.debug(f"User (ID: {user_id}) followed User (ID: {id})")
     return jsonify(response)
@@ -187,12 +374,7 @@ def delete_follow(user_id: UserIdDepend, id: int) -> flask.wrappers.Response:
     :param id: int
     :return: Response
     """
-    if followed(user_id, id):
-        follow = session.query(Follow).filter(
-            and_(Follow.following_user_id == user_id, Follow.followed_user_id == id)
-        )
-        session.delete(follow.one())
-        session.commit()
+    remove_follow(user_id, id)
     response = {"result": True}
     logger.debug(f"User (ID: {user_id}) deleted follow from User (ID: {id})")
     return jsonify(response)
@@ -202,11 +384,14 @@ def delete_follow(user_id: UserIdDepend, id: int) -> flask.wrappers.Response:
 @app.route("/api/tweets/", methods=["GET"])
 def get_tweets(user_id: UserIdDepend) -> flask.wrappers.Response:
     """
-    Endpoint для отображения твитов в ленте
+    Endpoint для отображения твитов в ленте, читается с реплики
     :return: Response
     """
+    limit = request.args.get("limit", FEED_PAGE_SIZE, type=int)
+    cursor = request.args.get("cursor")
+    use_replica(user_id)
     try:
-        response = show_tweets(user_id)
+        response = show_tweets(user_id, limit=limit, cursor=cursor)
         logger.debug(f"User (ID: {user_id}) requested Tweets")
         return jsonify(response)
     except Exception as exc:
@@ -219,13 +404,59 @@ def get_tweets(user_id: UserIdDepend) -> flask.wrappers.Response:
         return jsonify(response)
 
 
+@swag_from("docs/search_tweets.yml")
+@app.route("/api/tweets/search", methods=["GET"])
+def search_tweets(user_id: UserIdDepend) -> flask.wrappers.Response:
+    """
+    Endpoint для полнотекстового поиска твитов
+    :return: Response
+    """
+    query = request.args.get("q")
+    limit = request.args.get("limit", SEARCH_PAGE_SIZE, type=int)
+    cursor = request.args.get("cursor")
+    try:
+        response = show_search(query, limit=limit, cursor=cursor)
+        logger.debug(f"User (ID: {user_id}) searched Tweets")
+        return jsonify(response)
+    except ValueError as exc:
+        response = {
+            "result": False,
+            "error_type": type(exc).__name__,
+            "error_message": str(exc),
+        }
+        logger.error(f"User (ID: {user_id}) got Error while searching Tweets")
+        return jsonify(response)
+
+
+@swag_from("docs/get_trends.yml")
+@app.route("/api/trends", methods=["GET"])
+def get_trends(user_id: UserIdDepend) -> flask.wrappers.Response:
+    """
+    Endpoint для отображения популярных хештегов за окно 1h или 24h
+    :return: Response
+    """
+    try:
+        response = show_trends(request.args.get("window", "1h"))
+        logger.debug(f"User (ID: {user_id}) requested trends")
+        return jsonify(response)
+    except ValueError as exc:
+        response = {
+            "result": False,
+            "error_type": type(exc).__name__,
+            "error_message": str(exc),
+        }
+        logger.error(f"User (ID: {user_id}) got Error while getting trends")
+        return jsonify(response)
+
+
 @swag_from("docs/my_profile.yml")
 @app.route("/api/users/me", methods=["GET"])
 def my_profile(user_id: UserIdDepend) -> flask.wrappers.Response:
     """
-    Endpoint для отображения собственного профиля
+    Endpoint для отображения собственного профиля, читается с реплики
     :return: Response
     """
+    use_replica(user_id)
     response = show_profile(user_id)
     logger.debug(f"User (ID: {user_id}) visited his profile")
     return jsonify(response)
@@ -235,15 +466,63 @@ def my_profile(user_id: UserIdDepend) -> flask.wrappers.Response:
 @app.route("/api/users/<id>", methods=["GET"])
 def get_profile(user_id: UserIdDepend, id: int) -> flask.wrappers.Response:
     """
-    Endpoint для отображения выбранного профиля
+    Endpoint для отображения выбранного профиля, читается с реплики
     :param id: int
     :return: Response
     """
+    use_replica(user_id)
     response = show_profile(id)
     logger.debug(f"User (ID: {user_id}) visited profile of User (ID: {id})")
     return jsonify(response)
 
 
+def follows_list(user_id: int, id: int, followers: bool) -> flask.wrappers.Response:
+    """
+    Функция для ответа со страницей подписчиков или подписок пользователя
+    :param user_id: int
+    :param id: int
+    :param followers: bool
+    :return: Response
+    """
+    limit = request.args.get("limit", LIST_PAGE_SIZE, type=int)
+    cursor = request.args.get("cursor")
+    kind = "followers" if followers else "following"
+    try:
+        response = show_follows(id, followers, limit=limit, cursor=cursor)
+        logger.debug(f"User (ID: {user_id}) requested {kind} of User (ID: {id})")
+        return jsonify(response)
+    except ValueError as exc:
+        response = {
+            "result": False,
+            "error_type": type(exc).__name__,
+            "error_message": str(exc),
+        }
+        logger.error(f"User (ID: {user_id}) got Error while getting {kind}")
+        return jsonify(response)
+
+
+@swag_from("docs/get_followers.yml")
+@app.route("/api/users/<id>/followers", methods=["GET"])
+def get_followers(user_id: UserIdDepend, id: int) -> flask.wrappers.Response:
+    """
+    Endpoint для отображения подписчиков пользователя
+    :param id: int
+    :return: Response
+    """
+    return follows_list(user_id, id, followers=True)
+
+
+@swag_from("docs/get_following.yml")
+@app.route("/api/users/<id>/following", methods=["GET"])
+def get_following(user_id: UserIdDepend, id: int) -> flask.wrappers.Response:
+    """
+    Endpoint для отображения подписок пользователя
+    :param id: int
+    :return: Response
+    """
+    return follows_list(user_id, id, followers=False)
+
+
 FlaskInjector(app=app, modules=[configure])
 
 if __name__ == "__main__":
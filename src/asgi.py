@@ -0,0 +1,570 @@
+import asyncio
+import logging
+import logging.config
+import os
+from collections import defaultdict
+from typing import Callable, List
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import UploadFile
+from starlette.requests import Request
+from starlette.responses import FileResponse, JSONResponse, Response
+from starlette.routing import Route
+from werkzeug.exceptions import HTTPException, LengthRequired, RequestEntityTooLarge
+
+from src import search, tags, timeline, write_behind
+from src.depends import api_key_cache
+from src.log_config import dict_config
+from src.models import (
+    DATABASE_URL,
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    TWEET_PAGE_OPTIONS,
+    Tweet,
+    User,
+    session,
+)
+from src.uploads import MAX_CONTENT_LENGTH, MEDIA_ACCEL_REDIRECT, media_headers
+from src.utils import (
+    FEED_MAX_PAGE_SIZE,
+    FEED_ORDER,
+    FEED_PAGE_SIZE,
+    LIST_MAX_PAGE_SIZE,
+    LIST_PAGE_SIZE,
+    UPLOAD_FOLDER,
+    add_follow,
+    add_like,
+    create_tweet,
+    decode_cursor,
+    decode_id_cursor,
+    feed_conditions,
+    follows_page,
+    follows_response,
+    likes_page,
+    likes_response,
+    likes_sample,
+    media_file,
+    profile_response,
+    remove_follow,
+    remove_like,
+    remove_tweet,
+    search_position,
+    search_response,
+    serialize_tweets,
+    store_media,
+    tweets_response,
+)
+
+ASYNC_DATABASE_URL = os.environ.get(
+    "ASYNC_DATABASE_URL", DATABASE_URL.replace("+psycopg2", "+asyncpg")
+)
+
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=DB_POOL_PRE_PING,
+)
+AsyncSessionLocal = sessionmaker(
+    async_engine, class_=AsyncSession, expire_on_commit=False
+)
+
+logging.config.dictConfig(dict_config)
+logger = logging.getLogger("twitter log")
+
+
+async def fetch_all(statement) -> list:
+    """
+    Функция для выполнения запроса в отдельной сессии, чтобы независимые
+    запросы одного endpoint'а могли выполняться параллельно
+    :param statement: Select
+    :return: list
+    """
+    async with AsyncSessionLocal() as db:
+        return (await db.execute(statement)).all()
+
+
+async def fetch_tweets(statement) -> List[Tweet]:
+    """
+    Функция для загрузки страницы твитов в отдельной сессии
+    :param statement: Select
+    :return: List[Tweet]
+    """
+    async with AsyncSessionLocal() as db:
+        return (await db.execute(statement)).scalars().all()
+
+
+async def run_sync(func: Callable, *args):
+    """
+    Функция для выполнения синхронной операции записи в пуле потоков,
+    сессия потока закрывается после вызова
+    :param func: Callable
+    :return: Any
+    """
+
+    def call():
+        try:
+            return func(*args)
+        finally:
+            session.remove()
+
+    return await run_in_threadpool(call)
+
+
+async def get_user_id(request: Request) -> int:
+    """
+    Функция для получения id пользователя по заголовку api-key
+    :param request: Request
+    :return: int
+    """
+    api_key = request.headers.get("api-key")
+    user_id = api_key_cache.get(api_key)
+    if user_id is None:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(select(User.id).where(User.api_key == api_key))
+            user_id = result.scalar_one()
+        api_key_cache.set(api_key, user_id)
+    if request.method == "GET" and write_behind.has_pending(user_id):
+        await run_sync(write_behind.sync, user_id)
+    return user_id
+
+
+async def hydrate_tweets(tweets: List[Tweet]) -> List[dict]:
+    """
+    Функция для сборки ответа ленты: автор и вложения загружены вместе
+    с твитами (TWEET_PAGE_OPTIONS), последние лайкнувшие с именами
+    загружаются одним запросом
+    :param tweets: List[Tweet]
+    :return: List[dict]
+    """
+    if not tweets:
+        return []
+    like_rows = await fetch_all(
+        likes_sample([tweet.id for tweet in tweets], with_names=True)
+    )
+    names = dict()
+    likes = defaultdict(list)
+    for tweet_id, liker_id, name in like_rows:
+        likes[tweet_id].append(liker_id)
+        names[liker_id] = name
+    return serialize_tweets(tweets, likes, names)
+
+
+def page_limit(request: Request, default: int, maximum: int) -> int:
+    """
+    Функция для чтения размера страницы из параметра limit
+    :param request: Request
+    :param default: int
+    :param maximum: int
+    :return: int
+    """
+    try:
+        limit = int(request.query_params.get("limit", default))
+    except ValueError:
+        limit = default
+    return max(1, min(limit, maximum))
+
+
+async def get_tweets(request: Request) -> JSONResponse:
+    """
+    Endpoint для отображения твитов в ленте
+    :param request: Request
+    :return: JSONResponse
+    """
+    user_id = await get_user_id(request)
+    limit = page_limit(request, FEED_PAGE_SIZE, FEED_MAX_PAGE_SIZE)
+    cursor = request.query_params.get("cursor")
+    try:
+        position = decode_cursor(cursor) if cursor else None
+        if timeline.fanout_enabled():
+            statements = [timeline.timeline_query(user_id, limit + 1, position)]
+            if timeline.FEED_MODE == "hybrid":
+                statements.append(
+                    timeline.celebrity_query(user_id, limit + 1, position)
+                )
+            # Страница предрассчитанной ленты и страница знаменитостей
+            # независимы и загружаются параллельно
+            streams = await asyncio.gather(*map(fetch_tweets, statements))
+            tweets = timeline.merge_streams(list(streams), limit + 1)
+        else:
+            tweets = await fetch_tweets(
+                select(Tweet)
+                .options(*TWEET_PAGE_OPTIONS)
+                .where(*feed_conditions(user_id, position))
+                .order_by(*FEED_ORDER)
+                .limit(limit + 1)
+            )
+        response = tweets_response(tweets, limit, await hydrate_tweets(tweets[:limit]))
+        logger.debug(f"User (ID: {user_id}) requested Tweets")
+        return JSONResponse(response)
+    except Exception as exc:
+        response = {
+            "result": False,
+            "error_type": type(exc).__name__,
+            "error_message": str(exc),
+        }
+        logger.error(f"User (ID: {user_id}) got Error while getting Tweets")
+        return JSONResponse(response)
+
+
+async def search_tweets(request: Request) -> JSONResponse:
+    """
+    Endpoint для полнотекстового поиска твитов
+    :param request: Request
+    :return: JSONResponse
+    """
+    user_id = await get_user_id(request)
+    query = request.query_params.get("q")
+    limit = page_limit(request, search.SEARCH_PAGE_SIZE, search.SEARCH_MAX_PAGE_SIZE)
+    cursor = request.query_params.get("cursor")
+    try:
+        position = search_position(query, cursor)
+        if search.SEARCH_BACKEND == "memory":
+            found = await run_sync(search.find_tweets, query, limit + 1, position)
+        else:
+            found = await fetch_all(search.search_query(query, limit + 1, position))
+        tweets = [tweet for tweet, _ in found[:limit]]
+        response = search_response(found, limit, await hydrate_tweets(tweets))
+        logger.debug(f"User (ID: {user_id}) searched Tweets")
+        return JSONResponse(response)
+    except ValueError as exc:
+        response = {
+            "result": False,
+            "error_type": type(exc).__name__,
+            "error_message": str(exc),
+        }
+        logger.error(f"User (ID: {user_id}) got Error while searching Tweets")
+        return JSONResponse(response)
+
+
+async def get_trends(request: Request) -> JSONResponse:
+    """
+    Endpoint для отображения популярных хештегов за окно 1h или 24h
+    :param request: Request
+    :return: JSONResponse
+    """
+    user_id = await get_user_id(request)
+    try:
+        window = tags.check_window(request.query_params.get("window", "1h"))
+        response = tags.trends_cache.get(window)
+        if response is None:
+            rows = await fetch_all(tags.trends_query(window))
+            response = tags.trends_response(window, rows)
+            tags.trends_cache.set(window, response)
+        logger.debug(f"User (ID: {user_id}) requested trends")
+        return JSONResponse(response)
+    except ValueError as exc:
+        response = {
+            "result": False,
+            "error_type": type(exc).__name__,
+            "error_message": str(exc),
+        }
+        logger.error(f"User (ID: {user_id}) got Error while getting trends")
+        return JSONResponse(response)
+
+
+async def get_likes(request: Request) -> JSONResponse:
+    """
+    Endpoint для отображения списка лайкнувших твит
+    :param request: Request
+    :return: JSONResponse
+    """
+    user_id = await get_user_id(request)
+    id = request.path_params["id"]
+    limit = page_limit(request, LIST_PAGE_SIZE, LIST_MAX_PAGE_SIZE)
+    cursor = request.query_params.get("cursor")
+    try:
+        before_id = decode_id_cursor(cursor) if cursor else None
+        rows = await fetch_all(likes_page(id, limit, before_id))
+        logger.debug(f"User (ID: {user_id}) requested likes of Tweet (ID: {id})")
+        return JSONResponse(likes_response(rows, limit))
+    except ValueError as exc:
+        response = {
+            "result": False,
+            "error_type": type(exc).__name__,
+            "error_message": str(exc),
+        }
+        logger.error(f"User (ID: {user_id}) got Error while getting likes")
+        return JSONResponse(response)
+
+
+async def show_profile(user_id: int) -> dict:
+    """
+    Функция для отобраджения информации профиля по user_id
+    :param user_id: int
+    :return: dict
+    """
+    user_rows = await fetch_all(select(User).where(User.id == user_id))
+    return profile_response(user_rows[0][0])
+
+
+async def follows_list(request: Request, followers: bool) -> JSONResponse:
+    """
+    Функция для ответа со страницей подписчиков или подписок пользователя
+    :param request: Request
+    :param followers: bool
+    :return: JSONResponse
+    """
+    user_id = await get_user_id(request)
+    id = request.path_params["id"]
+    limit = page_limit(request, LIST_PAGE_SIZE, LIST_MAX_PAGE_SIZE)
+    cursor = request.query_params.get("cursor")
+    kind = "followers" if followers else "following"
+    try:
+        before_id = decode_id_cursor(cursor) if cursor else None
+        rows = await fetch_all(follows_page(id, followers, limit, before_id))
+        logger.debug(f"User (ID: {user_id}) requested {kind} of User (ID: {id})")
+        return JSONResponse(follows_response(rows, limit))
+    except ValueError as exc:
+        response = {
+            "result": False,
+            "error_type": type(exc).__name__,
+            "error_message": str(exc),
+        }
+        logger.error(f"User (ID: {user_id}) got Error while getting {kind}")
+        return JSONResponse(response)
+
+
+async def get_followers(request: Request) -> JSONResponse:
+    """
+    Endpoint для отображения подписчиков пользователя
+    :param request: Request
+    :return: JSONResponse
+    """
+    return await follows_list(request, followers=True)
+
+
+async def get_following(request: Request) -> JSONResponse:
+    """
+    Endpoint для отображения подписок пользователя
+    :param request: Request
+    :return: JSONResponse
+    """
+    return await follows_list(request, followers=False)
+
+
+async def my_profile(request: Request) -> JSONResponse:
+    """
+    Endpoint для отображения собственного профиля
+    :param request: Request
+    :return: JSONResponse
+    """
+    user_id = await get_user_id(request)
+    response = await show_profile(user_id)
+    logger.debug(f"User (ID: {user_id}) visited his profile")
+    return JSONResponse(response)
+
+
+async def get_profile(request: Request) -> JSONResponse:
+    """
+    Endpoint для отображения выбранного профиля
+    :param request: Request
+    :return: JSONResponse
+    """
+    user_id = await get_user_id(request)
+    id = request.path_params["id"]
+    response = await show_profile(id)
+    logger.debug(f"User (ID: {user_id}) visited profile of User (ID: {id})")
+    return JSONResponse(response)
+
+
+async def add_tweet(request: Request) -> JSONResponse:
+    """
+    Endpoint для добавления твита
+    :param request: Request
+    :return: JSONResponse
+    """
+    user_id = await get_user_id(request)
+    data = await request.json()
+    new_tweet = await run_sync(
+        create_tweet, user_id, data.get("tweet_data"), data.get("tweet_media_ids")
+    )
+    logger.debug(f"User (ID: {user_id}) added Tweet (ID: {new_tweet.id})")
+    return JSONResponse({"result": True, "tweet_id": new_tweet.id})
+
+
+def http_error(exc: HTTPException, message: str) -> JSONResponse:
+    """
+    Функция для ответа с кодом HTTP ошибки exc в формате остальных ошибок API
+    :param exc: HTTPException
+    :param message: str
+    :return: JSONResponse
+    """
+    logger.error(message)
+    return JSONResponse(
+        {
+            "result": False,
+            "error_type": type(exc).__name__,
+            "error_message": exc.description,
+        },
+        status_code=exc.code,
+    )
+
+
+async def download_media(request: Request) -> JSONResponse:
+    """
+    Endpoint для добавления медиа файлов. Запрос без Content-Length
+    (chunked) отклоняется до разбора формы, иначе тело любого размера
+    было бы сохранено целиком до проверки MAX_CONTENT_LENGTH
+    :param request: Request
+    :return: JSONResponse
+    """
+    user_id = await get_user_id(request)
+    content_length = request.headers.get("content-length", "")
+    if not content_length.isdigit():
+        return http_error(LengthRequired(), "Upload request without Content-Length")
+    if int(content_length) > MAX_CONTENT_LENGTH:
+        return http_error(
+            RequestEntityTooLarge(), "Request body is larger than MAX_CONTENT_LENGTH"
+        )
+    form = await request.form()
+    try:
+        file = form.get("file")
+        if not isinstance(file, UploadFile):
+            raise ValueError("Request has no file field")
+        media_id = await run_sync(store_media, file.file, file.filename, UPLOAD_FOLDER)
+    except RequestEntityTooLarge as exc:
+        return http_error(exc, "Request body is larger than MAX_CONTENT_LENGTH")
+    except ValueError as exc:
+        logger.error(f"User (ID: {user_id}) got Error while adding media")
+        return JSONResponse(
+            {
+                "result": False,
+                "error_type": type(exc).__name__,
+                "error_message": str(exc),
+            }
+        )
+    finally:
+        await form.close()
+    logger.debug(f"User (ID: {user_id}) added Media (ID: {media_id})")
+    return JSONResponse({"result": True, "media_id": media_id})
+
+
+async def get_media(request: Request) -> Response:
+    """
+    Endpoint для получения файла медиа после проверки api-key. За nginx
+    приложение только проверяет доступ, а файл отдаёт nginx
+    по X-Accel-Redirect
+    :param request: Request
+    :return: Response
+    """
+    user_id = await get_user_id(request)
+    id = request.path_params["id"]
+    try:
+        path = await run_sync(
+            media_file,
+            id,
+            request.query_params.get("variant"),
+            request.query_params.get("format"),
+        )
+    except ValueError as exc:
+        logger.error(f"User (ID: {user_id}) got Error while getting Media (ID: {id})")
+        return JSONResponse(
+            {
+                "result": False,
+                "error_type": type(exc).__name__,
+                "error_message": str(exc),
+            },
+            status_code=404,
+        )
+    headers = media_headers(path, UPLOAD_FOLDER, MEDIA_ACCEL_REDIRECT)
+    logger.debug(f"User (ID: {user_id}) requested Media (ID: {id})")
+    if MEDIA_ACCEL_REDIRECT:
+        return Response(headers=headers)
+    return FileResponse(path, media_type=headers.pop("Content-Type"), headers=headers)
+
+
+async def delete_tweet(request: Request) -> JSONResponse:
+    """
+    Endpoint для удаления твитов
+    :param request: Request
+    :return: JSONResponse
+    """
+    user_id = await get_user_id(request)
+    id = request.path_params["id"]
+    await run_sync(remove_tweet, id)
+    logger.debug(f"User (ID: {user_id}) deleted Tweet (ID: {id})")
+    return JSONResponse({"result": True})
+
+
+async def put_like(request: Request) -> JSONResponse:
+    """
+    Endpoint для добавления лайков
+    :param request: Request
+    :return: JSONResponse
+    """
+    user_id = await get_user_id(request)
+    id = request.path_params["id"]
+    await run_sync(add_like, user_id, id)
+    logger.debug(f"User (ID: {user_id}) liked Tweet (ID: {id})")
+    return JSONResponse({"result": True})
+
+
+async def delete_like(request: Request) -> JSONResponse:
+    """
+    Endpoint для удаления лайков
+    :param request: Request
+    :return: JSONResponse
+    """
+    user_id = await get_user_id(request)
+    id = request.path_params["id"]
+    await run_sync(remove_like, user_id, id)
+    logger.debug(f"User (ID: {user_id}) deleted liked from Tweet (ID: {id})")
+    return JSONResponse({"result": True})
+
+
+async def follow_user(request: Request) -> JSONResponse:
+    """
+    Endpoint для добавления подписок
+    :param request: Request
+    :return: JSONResponse
+    """
+    user_id = await get_user_id(request)
+    id = request.path_params["id"]
+    await run_sync(add_follow, user_id, id)
+    logger.debug(f"User (ID: {user_id}) followed User (ID: {id})")
+    return JSONResponse({"result": True})
+
+
+async def delete_follow(request: Request) -> JSONResponse:
+    """
+    Endpoint для удаления подписок
+    :param request: Request
+    :return: JSONResponse
+    """
+    user_id = await get_user_id(request)
+    id = request.path_params["id"]
+    await run_sync(remove_follow, user_id, id)
+    logger.debug(f"User (ID: {user_id}) deleted follow from User (ID: {id})")
+    return JSONResponse({"result": True})
+
+
+routes = [
+    Route("/api/tweets/", add_tweet, methods=["POST"]),
+    Route("/api/tweets/", get_tweets, methods=["GET"]),
+    Route("/api/tweets/search", search_tweets, methods=["GET"]),
+    Route("/api/trends", get_trends, methods=["GET"]),
+    Route("/api/medias/", download_media, methods=["POST"]),
+    Route("/api/medias/{id:int}", get_media, methods=["GET"]),
+    Route("/api/tweets/{id:int}", delete_tweet, methods=["DELETE"]),
+    Route("/api/tweets/{id:int}/likes", get_likes, methods=["GET"]),
+    Route("/api/tweets/{id:int}/likes", put_like, methods=["POST"]),
+    Route("/api/tweets/{id:int}/likes", delete_like, methods=["DELETE"]),
+    Route("/api/users/{id:int}/follow", follow_user, methods=["POST"]),
+    Route("/api/users/{id:int}/follow", delete_follow, methods=["DELETE"]),
+    Route("/api/users/me", my_profile, methods=["GET"]),
+    Route("/api/users/{id:int}", get_profile, methods=["GET"]),
+    Route("/api/users/{id:int}/followers", get_followers, methods=["GET"]),
+    Route("/api/users/{id:int}/following", get_following, methods=["GET"]),
+]
+
+app = Starlette(routes=routes, on_shutdown=[write_behind.close, async_engine.dispose])
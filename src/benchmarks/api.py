@@ -0,0 +1,400 @@
+"""
+Бенчмарк всех endpoint'ов API: задержка (p50/p95/p99), RPS и число SQL
+запросов на запрос при фиксированном числе одновременных клиентов.
+
+Запросы выполняются внутри процесса через тестовый клиент Flask, сеть
+не используется. Запуск из директории src, как и самого приложения
+(журналы пишутся в src/logs):
+    PYTHONPATH=.. python -m src.benchmarks.api --users 1000 --concurrency 8 --json
+
+С --write-behind like follow лайки и подписки записываются через очередь
+отложенной записи, финальная запись очереди входит в измеряемое время.
+С --search-backend memory поиск выполняется по инвертированному индексу
+в памяти процесса, индекс строится до замера.
+"""
+import argparse
+import datetime
+import io
+import json
+import random
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from PIL import Image
+
+from src import search, tags, write_behind
+from src.app import app
+from src.benchmarks.common import (
+    cleanup,
+    count_queries,
+    create_users,
+    percentile,
+    power_law_weights,
+)
+from src.counters import reconcile_counters
+from src.models import Follow, Like, Media, Tweet, User, session
+from src.uploads import media_processor
+from src.write_behind import WRITE_BEHIND_BATCH_SIZE, WRITE_BEHIND_FLUSH_MS, WriteBehind
+
+ENDPOINTS = (
+    "get_tweets",
+    "my_profile",
+    "get_profile",
+    "put_like",
+    "follow_user",
+    "add_tweet",
+    "download_media",
+    "search_tweets",
+    "get_trends",
+)
+# Словарь текстов твитов: частота слов убывает по закону Ципфа, поэтому
+# в поиске есть и частые, и редкие слова
+WORDS = tuple(f"word{i}" for i in range(1000))
+WORDS_PER_TWEET = 8
+
+Call = Tuple[str, str, dict]
+
+
+def seed(
+    users: int,
+    follows_per_user: int,
+    tweets_per_user: int,
+    likes_per_tweet: int,
+    alpha: float,
+    rnd,
+) -> dict:
+    """
+    Функция для заполнения БД данными со степенным распределением:
+    популярные авторы чаще пишут, на них чаще подписываются и их твиты
+    чаще лайкают
+    :param users: int
+    :param follows_per_user: int
+    :param tweets_per_user: int
+    :param likes_per_tweet: int
+    :param alpha: float
+    :param rnd: random.Random
+    :return: dict
+    """
+    user_ids = create_users(users, prefix="api")
+    weights = power_law_weights(users, alpha)
+    popularity = dict(zip(user_ids, weights))
+
+    follows = set()
+    for follower in user_ids:
+        count = max(1, int(rnd.expovariate(1 / follows_per_user)))
+        for followee in rnd.choices(user_ids, weights=weights, k=count):
+            if followee != follower:
+                follows.add((follower, followee))
+    session.bulk_save_objects(
+        [Follow(following_user_id=a, followed_user_id=b) for a, b in follows]
+    )
+
+    now = datetime.datetime.utcnow()
+    word_weights = power_law_weights(len(WORDS), 1.0)
+    tweets = [
+        Tweet(
+            user_id=author_id,
+            text=f"tweet {i} "
+            + " ".join(rnd.choices(WORDS, weights=word_weights, k=WORDS_PER_TWEET))
+            + f" #{rnd.choices(WORDS, weights=word_weights)[0]}",
+            datetime=now - datetime.timedelta(minutes=rnd.randint(1, 10000)),
+        )
+        for i, author_id in enumerate(
+            rnd.choices(user_ids, weights=weights, k=users * tweets_per_user)
+        )
+    ]
+    session.add_all(tweets)
+    session.flush()
+    tags.index_tweets(tweets)
+    tweet_ids = [tweet.id for tweet in tweets]
+    tweet_weights = [popularity[tweet.user_id] for tweet in tweets]
+
+    likes = set()
+    for tweet_id in rnd.choices(
+        tweet_ids, weights=tweet_weights, k=len(tweet_ids) * likes_per_tweet
+    ):
+        likes.add((rnd.choice(user_ids), tweet_id))
+    session.bulk_save_objects(
+        [Like(user_id=user_id, tweet_id=tweet_id) for user_id, tweet_id in likes]
+    )
+    session.commit()
+    reconcile_counters()
+
+    api_keys = dict(session.query(User.id, User.api_key).filter(User.id.in_(user_ids)))
+    return {
+        "user_ids": user_ids,
+        "weights": weights,
+        "api_keys": api_keys,
+        "tweet_ids": tweet_ids,
+        "tweet_weights": tweet_weights,
+        "follows": follows,
+        "likes": likes,
+    }
+
+
+def unique_pairs(
+    count: int, make_pair: Callable[[], Tuple[int, int]], taken: set
+) -> List[Tuple[int, int]]:
+    """
+    Функция для выбора пар, которых ещё нет в БД, чтобы каждый запрос
+    на запись создавал новую строку
+    :param count: int
+    :param make_pair: Callable[[], Tuple[int, int]]
+    :param taken: set
+    :return: List[Tuple[int, int]]
+    """
+    pairs: List[Tuple[int, int]] = list()
+    for _ in range(count * 20):
+        if len(pairs) == count:
+            break
+        pair = make_pair()
+        if pair[0] != pair[1] and pair not in taken:
+            taken.add(pair)
+            pairs.append(pair)
+    return pairs
+
+
+def random_png(rnd, size: int = 32) -> bytes:
+    """
+    Функция для PNG из случайных пикселей: у каждой загрузки свой хеш,
+    а фоновая обработка получает настоящее изображение
+    :param rnd: random.Random
+    :param size: int
+    :return: bytes
+    """
+    buffer = io.BytesIO()
+    image = Image.frombytes("RGB", (size, size), rnd.randbytes(size * size * 3))
+    image.save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def build_calls(endpoint: str, requests: int, data: dict, rnd) -> List[Call]:
+    """
+    Функция для подготовки запросов к endpoint'у: метод, путь и аргументы
+    тестового клиента. Читатели выбираются равномерно, просматриваемые
+    профили и лайкаемые твиты - по популярности
+    :param endpoint: str
+    :param requests: int
+    :param data: dict
+    :param rnd: random.Random
+    :return: List[Call]
+    """
+    user_ids, weights, keys = data["user_ids"], data["weights"], data["api_keys"]
+
+    def headers(user_id: int) -> dict:
+        return {"headers": {"api-key": keys[user_id]}}
+
+    def popular_user() -> int:
+        return rnd.choices(user_ids, weights=weights)[0]
+
+    def popular_tweet() -> int:
+        return rnd.choices(data["tweet_ids"], weights=data["tweet_weights"])[0]
+
+    readers = [rnd.choice(user_ids) for _ in range(requests)]
+    windows = list(tags.TRENDS_WINDOWS)
+    if endpoint == "get_tweets":
+        return [("GET", "/api/tweets/", headers(user_id)) for user_id in readers]
+    if endpoint == "my_profile":
+        return [("GET", "/api/users/me", headers(user_id)) for user_id in readers]
+    if endpoint == "get_profile":
+        return [
+            ("GET", f"/api/users/{popular_user()}", headers(user_id))
+            for user_id in readers
+        ]
+    if endpoint == "put_like":
+        pairs = unique_pairs(
+            requests, lambda: (rnd.choice(user_ids), popular_tweet()), data["likes"]
+        )
+        return [
+            ("POST", f"/api/tweets/{tweet_id}/likes", headers(user_id))
+            for user_id, tweet_id in pairs
+        ]
+    if endpoint == "follow_user":
+        pairs = unique_pairs(
+            requests, lambda: (rnd.choice(user_ids), popular_user()), data["follows"]
+        )
+        return [
+            ("POST", f"/api/users/{followed_id}/follow", headers(user_id))
+            for user_id, followed_id in pairs
+        ]
+    if endpoint == "add_tweet":
+        return [
+            (
+                "POST",
+                "/api/tweets/",
+                {"json": {"tweet_data": f"benchmark {i}"}, **headers(user_id)},
+            )
+            for i, user_id in enumerate(readers)
+        ]
+    if endpoint == "download_media":
+        return [
+            (
+                "POST",
+                "/api/medias/",
+                {
+                    "data": {"file": (io.BytesIO(random_png(rnd)), f"b{i}.png")},
+                    "content_type": "multipart/form-data",
+                    **headers(user_id),
+                },
+            )
+            for i, user_id in enumerate(readers)
+        ]
+    if endpoint == "get_trends":
+        return [
+            ("GET", f"/api/trends?window={rnd.choice(windows)}", headers(user_id))
+            for user_id in readers
+        ]
+    if endpoint == "search_tweets":
+        return [
+            (
+                "GET",
+                "/api/tweets/search",
+                {
+                    "query_string": {
+                        "q": " ".join(rnd.sample(WORDS[:100], rnd.randint(1, 2)))
+                    },
+                    **headers(user_id),
+                },
+            )
+            for user_id in readers
+        ]
+    raise ValueError(f"Unknown endpoint: {endpoint}")
+
+
+def drive(
+    calls: List[Call], concurrency: int, finish: Optional[Callable[[], Any]] = None
+) -> Tuple[dict, List[dict]]:
+    """
+    Функция для выполнения запросов в concurrency потоках, у каждого потока
+    свой тестовый клиент. finish (запись очереди write-behind) входит
+    в измеряемое время
+    :param calls: List[Call]
+    :param concurrency: int
+    :param finish: Optional[Callable[[], Any]]
+    :return: Tuple[dict, List[dict]]
+    """
+    local = threading.local()
+
+    def call(item: Call) -> Tuple[float, bool, dict]:
+        if not hasattr(local, "client"):
+            local.client = app.test_client()
+        method, path, kwargs = item
+        start = time.perf_counter()
+        resp = local.client.open(path, method=method, **kwargs)
+        elapsed = (time.perf_counter() - start) * 1000
+        body = resp.get_json(silent=True) or dict()
+        return elapsed, resp.status_code < 400 and body.get("result", True), body
+
+    with count_queries() as counter, ThreadPoolExecutor(concurrency) as executor:
+        started = time.perf_counter()
+        results = list(executor.map(call, calls))
+        if finish is not None:
+            finish()
+        wall = time.perf_counter() - started
+
+    latencies = [elapsed for elapsed, ok, _ in results if ok]
+    report = {
+        "requests": len(calls),
+        "errors": len(calls) - len(latencies),
+        "rps": len(calls) / wall,
+        "p50_ms": percentile(latencies, 50) if latencies else None,
+        "p95_ms": percentile(latencies, 95) if latencies else None,
+        "p99_ms": percentile(latencies, 99) if latencies else None,
+        "queries_per_request": counter.count / len(calls) if calls else None,
+    }
+    return report, [body for _, _, body in results]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--follows-per-user", type=int, default=20)
+    parser.add_argument("--tweets-per-user", type=int, default=10)
+    parser.add_argument("--likes-per-tweet", type=int, default=3)
+    parser.add_argument("--alpha", type=float, default=1.1)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument(
+        "--endpoints", nargs="+", choices=ENDPOINTS, default=list(ENDPOINTS)
+    )
+    parser.add_argument(
+        "--write-behind",
+        nargs="+",
+        choices=(write_behind.LIKE, write_behind.FOLLOW),
+        default=[],
+        help="события, записываемые отложенно",
+    )
+    parser.add_argument("--flush-ms", type=int, default=WRITE_BEHIND_FLUSH_MS)
+    parser.add_argument("--batch-size", type=int, default=WRITE_BEHIND_BATCH_SIZE)
+    parser.add_argument(
+        "--search-backend",
+        choices=("postgres", "memory"),
+        default=search.SEARCH_BACKEND,
+        help="memory - инвертированный индекс в памяти процесса",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", action="store_true", help="вывод в формате JSON")
+    args = parser.parse_args()
+
+    rnd = random.Random(args.seed)
+    search_backend = search.SEARCH_BACKEND
+    search.SEARCH_BACKEND = args.search_backend
+    upload_folder = app.config["UPLOAD_FOLDER"]
+    app.config["UPLOAD_FOLDER"] = tempfile.mkdtemp(prefix="bench-media-")
+    data = seed(
+        args.users,
+        args.follows_per_user,
+        args.tweets_per_user,
+        args.likes_per_tweet,
+        args.alpha,
+        rnd,
+    )
+    results: Dict[str, dict] = dict()
+    media_ids: List[int] = list()
+    finish = None
+    if args.write_behind:
+        write_behind.configure(
+            WriteBehind(set(args.write_behind), args.flush_ms, args.batch_size)
+        )
+        finish = write_behind.buffer.flush
+    if args.search_backend == "memory" and "search_tweets" in args.endpoints:
+        search.memory_index.load()
+    try:
+        for endpoint in args.endpoints:
+            calls = build_calls(endpoint, args.requests, data, rnd)
+            results[endpoint], bodies = drive(calls, args.concurrency, finish)
+            media_ids.extend(body["media_id"] for body in bodies if "media_id" in body)
+    finally:
+        search.SEARCH_BACKEND = search_backend
+        write_behind.configure(None)
+        # Пул обработки медиа дорабатывает поставленные задачи до удаления
+        # их записей и файлов
+        media_processor.close()
+        session.rollback()
+        session.query(Media).filter(Media.id.in_(media_ids)).delete(
+            synchronize_session=False
+        )
+        cleanup(data["user_ids"])
+        shutil.rmtree(app.config["UPLOAD_FOLDER"], ignore_errors=True)
+        app.config["UPLOAD_FOLDER"] = upload_folder
+
+    if args.json:
+        print(json.dumps({"config": vars(args), "endpoints": results}, indent=2))
+        return
+    columns = list(next(iter(results.values())))
+    print(f"{'endpoint':<14} | " + " | ".join(f"{c:>19}" for c in columns))
+    for endpoint, row in results.items():
+        print(
+            f"{endpoint:<14} | "
+            + " | ".join(
+                f"{row[c] if row[c] is not None else 0:>19.2f}" for c in columns
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
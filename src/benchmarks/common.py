@@ -0,0 +1,125 @@
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Iterator, List
+
+from sqlalchemy import event
+
+from src.models import Follow, Like, Media, Tweet, TweetMedia, User, engine, session
+from src.tags import count_hashtags
+
+
+class QueryCounter:
+    """
+    Счётчик SQL запросов, выполненных через engine из любых потоков
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, *args, **kwargs) -> None:
+        with self._lock:
+            self.count += 1
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCounter]:
+    """
+    Контекстный менеджер для подсчёта SQL запросов внутри блока
+    :return: Iterator[QueryCounter]
+    """
+    counter = QueryCounter()
+    event.listen(engine, "before_cursor_execute", counter)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", counter)
+
+
+@contextmanager
+def timer() -> Iterator[dict]:
+    """
+    Контекстный менеджер для замера времени выполнения блока в миллисекундах
+    :return: Iterator[dict]
+    """
+    result = {"ms": 0.0}
+    start = time.perf_counter()
+    try:
+        yield result
+    finally:
+        result["ms"] = (time.perf_counter() - start) * 1000
+
+
+def create_users(count: int, prefix: str = "bench") -> List[int]:
+    """
+    Функция для создания тестовых пользователей с уникальными api_key
+    :param count: int
+    :param prefix: str
+    :return: List[int]
+    """
+    run_id = uuid.uuid4().hex[:8]
+    users = [
+        User(name=f"{prefix}{i}", api_key=f"{prefix}-{run_id}-{i}")
+        for i in range(count)
+    ]
+    session.add_all(users)
+    session.flush()
+    user_ids = [user.id for user in users]
+    session.commit()
+    return user_ids
+
+
+def cleanup(user_ids: List[int]) -> None:
+    """
+    Функция для удаления тестовых пользователей и всех связанных с ними данных
+    :param user_ids: List[int]
+    :return: None
+    """
+    tweet_ids = [
+        tweet_id
+        for (tweet_id,) in session.query(Tweet.id).filter(Tweet.user_id.in_(user_ids))
+    ]
+    media_ids = {
+        media_id
+        for (media_id,) in session.query(TweetMedia.media_id).filter(
+            TweetMedia.tweet_id.in_(tweet_ids)
+        )
+    }
+    count_hashtags(tweet_ids, -1)
+    session.query(Like).filter(
+        Like.user_id.in_(user_ids) | Like.tweet_id.in_(tweet_ids)
+    ).delete(synchronize_session=False)
+    session.query(Follow).filter(
+        Follow.following_user_id.in_(user_ids) | Follow.followed_user_id.in_(user_ids)
+    ).delete(synchronize_session=False)
+    session.query(Tweet).filter(Tweet.id.in_(tweet_ids)).delete(
+        synchronize_session=False
+    )
+    session.query(Media).filter(Media.id.in_(media_ids)).delete(
+        synchronize_session=False
+    )
+    session.query(User).filter(User.id.in_(user_ids)).delete(synchronize_session=False)
+    session.commit()
+
+
+def percentile(values: List[float], pct: int) -> float:
+    """
+    Функция для расчёта перцентиля
+    :param values: List[float]
+    :param pct: int
+    :return: float
+    """
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def power_law_weights(count: int, alpha: float) -> List[float]:
+    """
+    Функция для весов популярности авторов по закону Ципфа
+    :param count: int
+    :param alpha: float
+    :return: List[float]
+    """
+    return [1 / (rank + 1) ** alpha for rank in range(count)]
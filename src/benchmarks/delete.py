@@ -0,0 +1,119 @@
+"""
+Бенчмарк удаления твита в зависимости от числа его лайков: время
+DELETE FROM tweet с каскадным удалением лайков в запросе (hard) и мягкого
+удаления remove_tweet (soft), а также время фоновой очистки purge_deleted
+после мягкого удаления.
+
+Запуск из директории src:
+    PYTHONPATH=.. python -m src.benchmarks.delete --likes 0 1000 10000 100000
+"""
+import argparse
+import json
+import uuid
+from typing import Dict, List
+
+from sqlalchemy import delete, func, insert, literal, select
+
+from src.benchmarks.common import cleanup, create_users, timer
+from src.models import Like, Tweet, User, session
+from src.purge import purge_deleted
+from src.utils import remove_tweet
+
+
+def create_likers(count: int) -> List[int]:
+    """
+    Функция для создания count пользователей одним INSERT ... SELECT
+    :param count: int
+    :return: List[int]
+    """
+    if not count:
+        return []
+    run_id = uuid.uuid4().hex[:8]
+    number = func.generate_series(1, count).column_valued("number")
+    rows = session.execute(
+        insert(User)
+        .from_select(
+            ["name", "api_key"],
+            select(literal("liker"), func.concat(f"liker-{run_id}-", number)),
+        )
+        .returning(User.id)
+    )
+    user_ids = [user_id for (user_id,) in rows]
+    session.commit()
+    return user_ids
+
+
+def create_liked_tweet(author_id: int, liker_ids: List[int]) -> int:
+    """
+    Функция для создания твита с лайками всех liker_ids
+    :param author_id: int
+    :param liker_ids: List[int]
+    :return: int
+    """
+    tweet = Tweet(user_id=author_id, text="delete me", like_count=len(liker_ids))
+    session.add(tweet)
+    session.flush()
+    if liker_ids:
+        session.execute(
+            insert(Like).from_select(
+                ["user_id", "tweet_id"],
+                select(User.id, literal(tweet.id)).where(User.id.in_(liker_ids)),
+            )
+        )
+    session.commit()
+    return tweet.id
+
+
+def hard_delete(tweet_id: int) -> None:
+    """
+    Функция для удаления твита одним DELETE с каскадом на лайки, как до
+    появления мягкого удаления
+    :param tweet_id: int
+    :return: None
+    """
+    session.execute(delete(Tweet).where(Tweet.id == tweet_id))
+    session.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--likes", nargs="+", type=int, default=[0, 1000, 10000])
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--json", action="store_true", help="вывод в формате JSON")
+    args = parser.parse_args()
+
+    author_ids = create_users(1, prefix="delete")
+    liker_ids = create_likers(max(args.likes))
+    results: Dict[int, Dict[str, float]] = dict()
+    try:
+        for likes in args.likes:
+            results[likes] = dict()
+            tweet_id = create_liked_tweet(author_ids[0], liker_ids[:likes])
+            with timer() as elapsed:
+                hard_delete(tweet_id)
+            results[likes]["hard_ms"] = elapsed["ms"]
+
+            tweet_id = create_liked_tweet(author_ids[0], liker_ids[:likes])
+            with timer() as elapsed:
+                remove_tweet(tweet_id)
+            results[likes]["soft_ms"] = elapsed["ms"]
+            with timer() as elapsed:
+                purge_deleted(args.batch_size, pause_ms=0)
+            results[likes]["purge_ms"] = elapsed["ms"]
+    finally:
+        session.rollback()
+        cleanup(author_ids + liker_ids)
+
+    if args.json:
+        print(json.dumps({"config": vars(args), "likes": results}, indent=2))
+        return
+    print(f"{'likes':>8} | {'hard ms':>9} | {'soft ms':>9} | {'purge ms':>9}")
+    for likes, row in results.items():
+        print(
+            f"{likes:>8} | {row['hard_ms']:>9.2f} | {row['soft_ms']:>9.2f} "
+            f"| {row['purge_ms']:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
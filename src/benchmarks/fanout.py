@@ -0,0 +1,190 @@
+"""
+Бенчмарк стратегий построения ленты (read, write, hybrid) на синтетическом
+графе подписок со степенным распределением популярности авторов.
+
+Запуск из корня репозитория:
+    python -m src.benchmarks.fanout --users 2000 --threshold 200
+"""
+import argparse
+import datetime
+import json
+import random
+import statistics
+from collections import Counter
+from typing import List
+
+from src import timeline
+from src.benchmarks.common import (
+    cleanup,
+    count_queries,
+    create_users,
+    percentile,
+    power_law_weights,
+    timer,
+)
+from src.models import Follow, TimelineEntry, Tweet, User, session
+from src.utils import show_tweets
+
+STRATEGIES = ("read", "write", "hybrid")
+
+
+def seed(
+    users: int, follows_per_user: int, tweets_per_user: int, alpha: float, rnd
+) -> List[int]:
+    """
+    Функция для заполнения БД: каждый пользователь подписывается в среднем
+    на follows_per_user авторов, выбранных по степенному распределению
+    :param users: int
+    :param follows_per_user: int
+    :param tweets_per_user: int
+    :param alpha: float
+    :param rnd: random.Random
+    :return: List[int]
+    """
+    user_ids = create_users(users, prefix="fanout")
+    weights = power_law_weights(users, alpha)
+    pairs = set()
+    for follower in user_ids:
+        count = max(1, int(rnd.expovariate(1 / follows_per_user)))
+        for followee in rnd.choices(user_ids, weights=weights, k=count):
+            if followee != follower:
+                pairs.add((follower, followee))
+    session.bulk_save_objects(
+        [Follow(following_user_id=a, followed_user_id=b) for a, b in pairs]
+    )
+    # Счётчики нужны режиму hybrid: знаменитости определяются по follower_count
+    followers = Counter(b for _, b in pairs)
+    following = Counter(a for a, _ in pairs)
+    session.bulk_update_mappings(
+        User,
+        [
+            {
+                "id": user_id,
+                "follower_count": followers[user_id],
+                "following_count": following[user_id],
+            }
+            for user_id in user_ids
+        ],
+    )
+    now = datetime.datetime.utcnow()
+    session.bulk_save_objects(
+        [
+            Tweet(
+                user_id=user_id,
+                text=f"tweet {i}",
+                datetime=now - datetime.timedelta(minutes=rnd.randint(1, 10000)),
+            )
+            for user_id in user_ids
+            for i in range(tweets_per_user)
+        ]
+    )
+    session.commit()
+    return user_ids
+
+
+def configure(strategy: str, threshold: int) -> None:
+    """
+    Функция для переключения стратегии ленты и пересчёта таблицы timeline.
+    Пересчитываются ленты всех пользователей БД, поэтому бенчмарк следует
+    запускать на отдельной базе
+    :param strategy: str
+    :param threshold: int
+    :return: None
+    """
+    timeline.FEED_MODE = strategy
+    timeline.CELEBRITY_THRESHOLD = threshold
+    if timeline.fanout_enabled():
+        timeline.rebuild_timelines()
+
+
+def measure(
+    user_ids: List[int], writes: int, reads: int, page: int, alpha: float, rnd
+) -> dict:
+    """
+    Функция для замера стоимости публикации твитов и чтения лент
+    :param user_ids: List[int]
+    :param writes: int
+    :param reads: int
+    :param page: int
+    :param alpha: float
+    :param rnd: random.Random
+    :return: dict
+    """
+    weights = power_law_weights(len(user_ids), alpha)
+    rows_before = session.query(TimelineEntry).count()
+    write_ms = list()
+    for author_id in rnd.choices(user_ids, weights=weights, k=writes):
+        with timer() as elapsed:
+            tweet = Tweet(user_id=author_id, text="benchmark")
+            session.add(tweet)
+            session.flush()
+            timeline.on_tweet_created(tweet)
+            session.commit()
+        write_ms.append(elapsed["ms"])
+    rows_written = session.query(TimelineEntry).count() - rows_before
+
+    read_ms = list()
+    queries = list()
+    for reader_id in rnd.sample(user_ids, min(reads, len(user_ids))):
+        session.expunge_all()
+        with count_queries() as counter, timer() as elapsed:
+            show_tweets(reader_id, limit=page)
+        read_ms.append(elapsed["ms"])
+        queries.append(counter.count)
+    return {
+        "write_ms_mean": statistics.mean(write_ms),
+        "write_ms_p95": percentile(write_ms, 95),
+        "timeline_rows_per_write": rows_written / writes,
+        "read_ms_p50": percentile(read_ms, 50),
+        "read_ms_p95": percentile(read_ms, 95),
+        "read_queries_mean": statistics.mean(queries),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--follows-per-user", type=int, default=20)
+    parser.add_argument("--tweets-per-user", type=int, default=5)
+    parser.add_argument("--alpha", type=float, default=1.1)
+    parser.add_argument("--threshold", type=int, default=200)
+    parser.add_argument("--writes", type=int, default=200)
+    parser.add_argument("--reads", type=int, default=200)
+    parser.add_argument("--page", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", action="store_true", help="вывод в формате JSON")
+    args = parser.parse_args()
+
+    rnd = random.Random(args.seed)
+    mode, threshold = timeline.FEED_MODE, timeline.CELEBRITY_THRESHOLD
+    user_ids = seed(
+        args.users, args.follows_per_user, args.tweets_per_user, args.alpha, rnd
+    )
+    results = dict()
+    try:
+        for strategy in STRATEGIES:
+            configure(strategy, args.threshold)
+            results[strategy] = measure(
+                user_ids,
+                args.writes,
+                args.reads,
+                args.page,
+                args.alpha,
+                random.Random(args.seed),
+            )
+    finally:
+        session.rollback()
+        timeline.FEED_MODE, timeline.CELEBRITY_THRESHOLD = mode, threshold
+        cleanup(user_ids)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    columns = list(results[STRATEGIES[0]])
+    print(f"{'strategy':<8} | " + " | ".join(f"{c:>24}" for c in columns))
+    for strategy, row in results.items():
+        print(f"{strategy:<8} | " + " | ".join(f"{row[c]:>24.2f}" for c in columns))
+
+
+if __name__ == "__main__":
+    main()
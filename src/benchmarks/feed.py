@@ -0,0 +1,139 @@
+"""
+Бенчмарк построения ленты: как растут число SQL запросов и задержка
+в зависимости от количества подписок пользователя.
+
+Запуск из корня репозитория:
+    python -m src.benchmarks.feed --follows 10 100 500 2000
+"""
+import argparse
+import datetime
+import json
+from typing import List
+
+from src.benchmarks.common import cleanup, count_queries, create_users, timer
+from src.models import Follow, Like, Tweet, session
+from src.utils import feed_query, show_tweets
+
+
+def legacy_feed(user_id: int) -> List[Tweet]:
+    """
+    Прежний алгоритм выборки ленты: отдельный запрос на каждую подписку
+    и сортировка в Python. Оставлен только для сравнения
+    :param user_id: int
+    :return: List[Tweet]
+    """
+    followings = session.query(Follow).filter(Follow.following_user_id == user_id).all()
+    tweets = session.query(Tweet).filter(Tweet.user_id == user_id).all()
+    for follow in followings:
+        tweets.extend(
+            session.query(Tweet).filter(Tweet.user_id == follow.followed_user_id).all()
+        )
+    return sorted(tweets, key=lambda x: x.datetime, reverse=True)
+
+
+def seed(follows: int, tweets_per_author: int, likes_per_tweet: int) -> List[int]:
+    """
+    Функция для заполнения БД: читатель, подписанный на follows авторов,
+    у каждого из которых tweets_per_author твитов с likes_per_tweet лайками
+    :param follows: int
+    :param tweets_per_author: int
+    :param likes_per_tweet: int
+    :return: List[int]
+    """
+    user_ids = create_users(follows + 1, prefix="feed")
+    reader_id, author_ids = user_ids[0], user_ids[1:]
+    now = datetime.datetime.utcnow()
+    session.bulk_save_objects(
+        [Follow(following_user_id=reader_id, followed_user_id=a) for a in author_ids]
+    )
+    session.bulk_save_objects(
+        [
+            Tweet(
+                user_id=author_id,
+                text=f"tweet {i}",
+                datetime=now - datetime.timedelta(seconds=n * tweets_per_author + i),
+            )
+            for n, author_id in enumerate(user_ids)
+            for i in range(tweets_per_author)
+        ]
+    )
+    session.commit()
+    tweet_ids = [
+        tweet_id
+        for (tweet_id,) in session.query(Tweet.id).filter(Tweet.user_id.in_(user_ids))
+    ]
+    session.bulk_save_objects(
+        [
+            Like(user_id=user_ids[(n + i) % len(user_ids)], tweet_id=tweet_id)
+            for n, tweet_id in enumerate(tweet_ids)
+            for i in range(min(likes_per_tweet, len(user_ids)))
+        ]
+    )
+    session.commit()
+    return user_ids
+
+
+def run(
+    follow_counts: List[int], tweets_per_author: int, likes_per_tweet: int, repeat: int
+) -> List[dict]:
+    """
+    Функция для замера legacy_feed, feed_query и show_tweets
+    на разном количестве подписок
+    :param follow_counts: List[int]
+    :param tweets_per_author: int
+    :param likes_per_tweet: int
+    :param repeat: int
+    :return: List[dict]
+    """
+    results = list()
+    for follows in follow_counts:
+        user_ids = seed(follows, tweets_per_author, likes_per_tweet)
+        reader_id = user_ids[0]
+        try:
+            row = {"follows": follows}
+            for name, func in (
+                ("legacy", legacy_feed),
+                ("set_based", lambda uid: feed_query(uid).all()),
+                ("show_tweets", show_tweets),
+            ):
+                timings = list()
+                for _ in range(repeat):
+                    session.expunge_all()
+                    with count_queries() as counter, timer() as elapsed:
+                        func(reader_id)
+                    timings.append(elapsed["ms"])
+                row[name] = {"queries": counter.count, "ms": min(timings)}
+            results.append(row)
+        finally:
+            session.rollback()
+            cleanup(user_ids)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--follows", type=int, nargs="+", default=[10, 100, 500, 2000])
+    parser.add_argument("--tweets-per-author", type=int, default=2)
+    parser.add_argument("--likes-per-tweet", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", action="store_true", help="вывод в формате JSON")
+    args = parser.parse_args()
+
+    results = run(
+        args.follows, args.tweets_per_author, args.likes_per_tweet, args.repeat
+    )
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'follows':>8} | {'strategy':<12} | {'queries':>8} | {'ms':>10}")
+    for row in results:
+        for name in ("legacy", "set_based", "show_tweets"):
+            stats = row[name]
+            print(
+                f"{row['follows']:>8} | {name:<12} | "
+                f"{stats['queries']:>8} | {stats['ms']:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
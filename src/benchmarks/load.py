@@ -0,0 +1,122 @@
+"""
+Нагрузочный тест HTTP API: фиксированное число одновременных соединений
+в течение заданного времени, для одного или нескольких запущенных серверов.
+
+Запуск из корня репозитория (WSGI и ASGI версии должны быть запущены):
+    python -m src.benchmarks.load --target wsgi=http://localhost:5001 \\
+        --target asgi=http://localhost:5002 --concurrency 1000 --duration 30
+"""
+import argparse
+import asyncio
+import json
+import time
+from typing import Dict, List, Optional
+
+import httpx
+
+from src.benchmarks.common import percentile
+
+
+async def hammer(
+    base_url: str,
+    path: str,
+    headers: Dict[str, str],
+    concurrency: int,
+    duration: float,
+    method: str = "GET",
+    body: Optional[dict] = None,
+) -> dict:
+    """
+    Функция для нагрузки одного endpoint'а: concurrency воркеров по кругу
+    отправляют запросы в течение duration секунд
+    :param base_url: str
+    :param path: str
+    :param headers: Dict[str, str]
+    :param concurrency: int
+    :param duration: float
+    :param method: str
+    :param body: dict | None
+    :return: dict
+    """
+    latencies: List[float] = list()
+    errors = 0
+    limits = httpx.Limits(
+        max_connections=concurrency, max_keepalive_connections=concurrency
+    )
+    async with httpx.AsyncClient(
+        base_url=base_url, headers=headers, limits=limits, timeout=60
+    ) as client:
+        deadline = time.perf_counter() + duration
+
+        async def worker() -> None:
+            nonlocal errors
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                try:
+                    resp = await client.request(method, path, json=body)
+                    ok = resp.status_code < 400 and resp.json().get("result", True)
+                except (httpx.HTTPError, ValueError):
+                    ok = False
+                if ok:
+                    latencies.append((time.perf_counter() - start) * 1000)
+                else:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 50) if latencies else None,
+        "p95_ms": percentile(latencies, 95) if latencies else None,
+        "p99_ms": percentile(latencies, 99) if latencies else None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--target",
+        action="append",
+        required=True,
+        help="имя=адрес сервера, можно указать несколько раз",
+    )
+    parser.add_argument("--path", default="/api/tweets/")
+    parser.add_argument("--api-key", default="test")
+    parser.add_argument("--concurrency", type=int, default=1000)
+    parser.add_argument("--duration", type=float, default=30)
+    parser.add_argument("--json", action="store_true", help="вывод в формате JSON")
+    args = parser.parse_args()
+
+    results = dict()
+    for target in args.target:
+        name, url = target.split("=", 1)
+        results[name] = asyncio.run(
+            hammer(
+                url,
+                args.path,
+                {"api-key": args.api_key},
+                args.concurrency,
+                args.duration,
+            )
+        )
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    columns = ["requests", "errors", "rps", "p50_ms", "p95_ms", "p99_ms"]
+    print(f"{'target':<8} | " + " | ".join(f"{c:>10}" for c in columns))
+    for name, row in results.items():
+        print(
+            f"{name:<8} | "
+            + " | ".join(
+                f"{row[c] if row[c] is not None else 0:>10.2f}" for c in columns
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Бенчмарк отдачи медиа через GET /api/medias/<id>: процессорное время
+Python на запрос, когда файл отдаёт само приложение (send_file), и когда
+приложение только проверяет доступ, а файл отдаёт nginx по X-Accel-Redirect.
+
+Запросы выполняются внутри процесса через тестовый клиент Flask, тело
+ответа читается полностью, как его читал бы WSGI сервер. Запуск из
+директории src:
+    PYTHONPATH=.. python -m src.benchmarks.media --sizes 100000 1000000 8000000
+"""
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+from typing import Dict, List
+
+from src.app import app
+from src.benchmarks.common import cleanup, create_users, percentile
+from src.models import Media, User, session
+from src.uploads import media_path
+
+MODES = {"send_file": "", "accel": "/protected-media/"}
+
+
+def measure(client, api_key: str, media_id: int, requests: int) -> dict:
+    """
+    Функция для замера процессорного и полного времени запросов к файлу
+    :param client: FlaskClient
+    :param api_key: str
+    :param media_id: int
+    :param requests: int
+    :return: dict
+    """
+    cpu: List[float] = list()
+    wall: List[float] = list()
+    body = 0
+    for _ in range(requests):
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        resp = client.get(f"/api/medias/{media_id}", headers={"api-key": api_key})
+        body = len(resp.data)
+        cpu.append((time.process_time() - cpu_start) * 1000)
+        wall.append((time.perf_counter() - wall_start) * 1000)
+        assert resp.status_code == 200
+    return {
+        "cpu_ms": sum(cpu) / len(cpu),
+        "p50_ms": percentile(wall, 50),
+        "p99_ms": percentile(wall, 99),
+        "body_bytes": body,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--sizes", nargs="+", type=int, default=[100_000, 1_000_000, 8_000_000]
+    )
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--json", action="store_true", help="вывод в формате JSON")
+    args = parser.parse_args()
+
+    upload_folder = app.config["UPLOAD_FOLDER"]
+    accel_redirect = app.config["MEDIA_ACCEL_REDIRECT"]
+    app.config["UPLOAD_FOLDER"] = tempfile.mkdtemp(prefix="bench-media-")
+    user_ids = create_users(1, prefix="media")
+    api_key = session.query(User.api_key).filter(User.id == user_ids[0]).scalar()
+    client = app.test_client()
+    results: Dict[int, Dict[str, dict]] = dict()
+    media_ids: List[int] = list()
+    try:
+        for size in args.sizes:
+            digest = f"{size:064x}"
+            path = media_path(app.config["UPLOAD_FOLDER"], digest, "png")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as file:
+                file.write(os.urandom(size))
+            media = Media(link=path, hash=digest)
+            session.add(media)
+            session.commit()
+            media_ids.append(media.id)
+            results[size] = dict()
+            for mode, prefix in MODES.items():
+                app.config["MEDIA_ACCEL_REDIRECT"] = prefix
+                measure(client, api_key, media.id, 10)
+                results[size][mode] = measure(client, api_key, media.id, args.requests)
+    finally:
+        app.config["MEDIA_ACCEL_REDIRECT"] = accel_redirect
+        session.rollback()
+        session.query(Media).filter(Media.id.in_(media_ids)).delete(
+            synchronize_session=False
+        )
+        cleanup(user_ids)
+        shutil.rmtree(app.config["UPLOAD_FOLDER"], ignore_errors=True)
+        app.config["UPLOAD_FOLDER"] = upload_folder
+
+    if args.json:
+        print(json.dumps({"config": vars(args), "sizes": results}, indent=2))
+        return
+    print(
+        f"{'size':>10} | {'mode':<10} | {'cpu ms/req':>10} | {'p50 ms':>8} "
+        f"| {'p99 ms':>8} | {'body bytes':>10} | {'cpu saved':>9}"
+    )
+    for size, modes in results.items():
+        saved = 1 - modes["accel"]["cpu_ms"] / modes["send_file"]["cpu_ms"]
+        for mode, row in modes.items():
+            print(
+                f"{size:>10} | {mode:<10} | {row['cpu_ms']:>10.3f} "
+                f"| {row['p50_ms']:>8.3f} | {row['p99_ms']:>8.3f} "
+                f"| {row['body_bytes']:>10} "
+                f"| {saved if mode == 'accel' else 0:>9.0%}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Iterator, Optional
+
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+_MISSING = object()
+# Ключ session.info со сбросами кешей, ожидающими фиксации транзакции
+_PENDING_INVALIDATIONS = "pending_cache_invalidations"
+
+
+class TTLCache:
+    """
+    Потокобезопасный LRU кеш с ограничением размера и временем жизни записей
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Метод для получения значения по ключу, просроченные записи удаляются
+        :param key: Hashable
+        :param default: Any
+        :return: Any
+        """
+        with self._lock:
+            value, expires_at = self._data.get(key, (_MISSING, 0.0))
+            if value is _MISSING or expires_at <= time.monotonic():
+                if value is not _MISSING:
+                    del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def get_many(self, keys: Iterable[Hashable]) -> Dict[Hashable, Any]:
+        """
+        Метод для получения нескольких значений, отсутствующие ключи
+        в результат не попадают
+        :param keys: Iterable[Hashable]
+        :return: Dict[Hashable, Any]
+        """
+        found = dict()
+        for key in keys:
+            value = self.get(key, _MISSING)
+            if value is not _MISSING:
+                found[key] = value
+        return found
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Метод для сохранения значения, при переполнении вытесняется самая
+        давно использованная запись
+        :param key: Hashable
+        :param value: Any
+        :return: None
+        """
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def set_many(self, mapping: Dict[Hashable, Any]) -> None:
+        """
+        Метод для сохранения нескольких значений
+        :param mapping: Dict[Hashable, Any]
+        :return: None
+        """
+        for key, value in mapping.items():
+            self.set(key, value)
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Метод для удаления записи по ключу
+        :param key: Hashable
+        :return: None
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Метод для очистки кеша
+        :return: None
+        """
+        with self._lock:
+            self._data.clear()
+
+
+class RedisTier:
+    """
+    Общий для всех воркеров уровень кеша строковых значений в Redis
+    """
+
+    def __init__(self, url: str, prefix: str, ttl: int) -> None:
+        import redis
+
+        self.client = redis.Redis.from_url(url)
+        self.errors = (redis.RedisError,)
+        self.prefix = prefix
+        self.ttl = ttl
+
+    def _key(self, key: Hashable) -> str:
+        return f"{self.prefix}:{key}"
+
+    def get_many(self, keys: Iterable[Hashable]) -> Dict[Hashable, str]:
+        """
+        Метод для получения нескольких значений одним MGET, при недоступности
+        Redis все ключи считаются промахами
+        :param keys: Iterable[Hashable]
+        :return: Dict[Hashable, str]
+        """
+        keys = list(keys)
+        try:
+            values = self.client.mget([self._key(key) for key in keys])
+        except self.errors:
+            return dict()
+        return {
+            key: value.decode() for key, value in zip(keys, values) if value is not None
+        }
+
+    def set_many(self, mapping: Dict[Hashable, str]) -> None:
+        """
+        Метод для сохранения нескольких значений одним pipeline
+        :param mapping: Dict[Hashable, str]
+        :return: None
+        """
+        pipeline = self.client.pipeline(transaction=False)
+        for key, value in mapping.items():
+            pipeline.set(self._key(key), value, ex=self.ttl)
+        try:
+            pipeline.execute()
+        except self.errors:
+            pass
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Метод для удаления записи по ключу
+        :param key: Hashable
+        :return: None
+        """
+        try:
+            self.client.delete(self._key(key))
+        except self.errors:
+            pass
+
+
+class TieredCache:
+    """
+    Двухуровневый кеш: локальный LRU воркера и необязательный общий уровень
+    (RedisTier или совместимый объект с get_many, set_many и invalidate)
+    """
+
+    def __init__(self, local: TTLCache, remote: Optional[Any] = None) -> None:
+        self.local = local
+        self.remote = remote
+
+    def get_many(self, keys: Iterable[Hashable]) -> Dict[Hashable, Any]:
+        """
+        Метод для получения нескольких значений: сначала из локального уровня,
+        затем недостающие из общего с прогревом локального
+        :param keys: Iterable[Hashable]
+        :return: Dict[Hashable, Any]
+        """
+        keys = set(keys)
+        found = self.local.get_many(keys)
+        missing = keys - found.keys()
+        if missing and self.remote is not None:
+            remote_found = self.remote.get_many(missing)
+            self.local.set_many(remote_found)
+            found.update(remote_found)
+        return found
+
+    def set_many(self, mapping: Dict[Hashable, Any]) -> None:
+        """
+        Метод для сохранения нескольких значений на обоих уровнях
+        :param mapping: Dict[Hashable, Any]
+        :return: None
+        """
+        self.local.set_many(mapping)
+        if self.remote is not None:
+            self.remote.set_many(mapping)
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Метод для удаления записи на обоих уровнях
+        :param key: Hashable
+        :return: None
+        """
+        self.local.invalidate(key)
+        if self.remote is not None:
+            self.remote.invalidate(key)
+
+
+class CacheCollector:
+    """
+    Коллектор Prometheus для счётчиков попаданий, промахов и вытеснений кеша
+    """
+
+    def __init__(self, name: str, cache: TTLCache) -> None:
+        self.name = name
+        self.cache = cache
+
+    def collect(self) -> Iterator:
+        for kind in ("hits", "misses", "evictions"):
+            yield CounterMetricFamily(
+                f"{self.name}_{kind}",
+                f"Number of {self.name} {kind}",
+                value=getattr(self.cache, kind),
+            )
+        yield GaugeMetricFamily(
+            f"{self.name}_size", f"Number of {self.name} entries", value=len(self.cache)
+        )
+
+
+def invalidate_on_commit(db_session: Session, cache: Any, key: Hashable) -> None:
+    """
+    Функция для сброса ключа кеша после фиксации транзакции db_session.
+    Сброс во время flush не защищает от параллельного запроса, который
+    прочитает ещё не изменённую строку и вернёт старое значение в кеш, поэтому
+    ключ сбрасывается только после COMMIT, а при откате забывается
+    :param db_session: Session
+    :param cache: Any
+    :param key: Hashable
+    :return: None
+    """
+    db_session.info.setdefault(_PENDING_INVALIDATIONS, list()).append((cache, key))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(db_session: Session) -> None:
+    for cache, key in db_session.info.pop(_PENDING_INVALIDATIONS, ()):
+        cache.invalidate(key)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back(db_session: Session) -> None:
+    # Откат SAVEPOINT не отменяет изменений внешней транзакции
+    if not db_session.in_nested_transaction():
+        db_session.info.pop(_PENDING_INVALIDATIONS, None)
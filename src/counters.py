@@ -0,0 +1,171 @@
+from typing import Iterable, Tuple
+
+from sqlalchemy import delete, func, literal, select, tuple_, union_all, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.sql.expression import CTE, Update
+
+from src import timeline
+from src.models import Follow, Like, Tweet, User, session
+
+
+def update_like_count(changed: CTE, delta: int) -> Update:
+    """
+    Функция для UPDATE счётчиков лайков твитов, затронутых вставкой или
+    удалением в CTE changed (RETURNING tweet_id). Изменение строк like
+    и счётчиков выполняются одним запросом, CTE может содержать несколько
+    строк одного твита
+    :param changed: CTE
+    :param delta: int
+    :return: Update
+    """
+    counts = (
+        select(changed.c.tweet_id, func.count().label("changed"))
+        .group_by(changed.c.tweet_id)
+        .subquery()
+    )
+    return (
+        update(Tweet)
+        .where(Tweet.id == counts.c.tweet_id)
+        .values(like_count=Tweet.like_count + counts.c.changed * delta)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def update_follow_counts(changed: CTE, delta: int) -> Update:
+    """
+    Функция для UPDATE счётчиков подписок и подписчиков пользователей,
+    затронутых вставкой или удалением в CTE changed (RETURNING
+    following_user_id, followed_user_id), одним запросом
+    :param changed: CTE
+    :param delta: int
+    :return: Update
+    """
+    sides = union_all(
+        select(
+            changed.c.following_user_id.label("user_id"),
+            literal(1).label("following"),
+            literal(0).label("follower"),
+        ),
+        select(changed.c.followed_user_id, literal(0), literal(1)),
+    ).subquery()
+    counts = (
+        select(
+            sides.c.user_id,
+            func.sum(sides.c.following).label("following"),
+            func.sum(sides.c.follower).label("follower"),
+        )
+        .group_by(sides.c.user_id)
+        .subquery()
+    )
+    return (
+        update(User)
+        .where(User.id == counts.c.user_id)
+        .values(
+            following_count=User.following_count + counts.c.following * delta,
+            follower_count=User.follower_count + counts.c.follower * delta,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def write_likes(pairs: Iterable[Tuple[int, int]], present: bool) -> int:
+    """
+    Функция для вставки (present=True) или удаления лайков по парам
+    (user_id, tweet_id) одним запросом вместе с изменением счётчиков.
+    Уже существующие или отсутствующие лайки пропускаются. Транзакция
+    не фиксируется
+    :param pairs: Iterable[Tuple[int, int]]
+    :param present: bool
+    :return: int
+    """
+    pairs = list(pairs)
+    if not pairs:
+        return 0
+    if present:
+        changed = (
+            insert(Like)
+            .values([{"user_id": user, "tweet_id": tweet} for user, tweet in pairs])
+            .on_conflict_do_nothing(index_elements=[Like.user_id, Like.tweet_id])
+            .returning(Like.tweet_id)
+            .cte("inserted_like")
+        )
+    else:
+        changed = (
+            delete(Like)
+            .where(tuple_(Like.user_id, Like.tweet_id).in_(pairs))
+            .returning(Like.tweet_id)
+            .cte("deleted_like")
+        )
+    return session.execute(update_like_count(changed, 1 if present else -1)).rowcount
+
+
+def write_follows(pairs: Iterable[Tuple[int, int]], present: bool) -> int:
+    """
+    Функция для вставки (present=True) или удаления подписок по парам
+    (following_user_id, followed_user_id) одним запросом вместе с изменением
+    счётчиков. Транзакция не фиксируется
+    :param pairs: Iterable[Tuple[int, int]]
+    :param present: bool
+    :return: int
+    """
+    pairs = list(pairs)
+    if not pairs:
+        return 0
+    columns = (Follow.following_user_id, Follow.followed_user_id)
+    if present:
+        changed = (
+            insert(Follow)
+            .values(
+                [
+                    {"following_user_id": following, "followed_user_id": followed}
+                    for following, followed in pairs
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=columns)
+            .returning(*columns)
+            .cte("inserted_follow")
+        )
+    else:
+        changed = (
+            delete(Follow)
+            .where(tuple_(*columns).in_(pairs))
+            .returning(*columns)
+            .cte("deleted_follow")
+        )
+    return session.execute(update_follow_counts(changed, 1 if present else -1)).rowcount
+
+
+def reconcile_counters() -> int:
+    """
+    Функция для сверки счётчиков с таблицами like и follow, исправляются
+    только разошедшиеся строки. Флаги знаменитостей пересчитываются по
+    исправленным счётчикам
+    :return: int
+    """
+    fixed = 0
+    for model, column, count in (
+        (
+            Tweet,
+            Tweet.like_count,
+            select(func.count(Like.id)).where(Like.tweet_id == Tweet.id),
+        ),
+        (
+            User,
+            User.follower_count,
+            select(func.count(Follow.id)).where(Follow.followed_user_id == User.id),
+        ),
+        (
+            User,
+            User.following_count,
+            select(func.count(Follow.id)).where(Follow.following_user_id == User.id),
+        ),
+    ):
+        count = count.scalar_subquery()
+        fixed += (
+            session.query(model)
+            .filter(column != count)
+            .update({column: count}, synchronize_session=False)
+        )
+    timeline.update_celebrities()
+    session.commit()
+    return fixed
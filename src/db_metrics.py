@@ -0,0 +1,206 @@
+import contextvars
+import os
+import time
+from contextlib import contextmanager
+from contextvars import Token
+from typing import Iterator, List, Optional, Tuple
+
+from prometheus_client import Histogram
+from prometheus_client.core import GaugeMetricFamily
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+# Порог в миллисекундах для журнала медленных запросов, 0 - журнал отключён
+SLOW_REQUEST_MS = float(os.environ.get("SLOW_REQUEST_MS", 0))
+
+POOL_WAIT = Histogram(
+    "db_pool_wait_seconds",
+    "Time spent waiting for a connection from the pool",
+    registry=None,
+)
+POOL_CHECKOUT = Histogram(
+    "db_pool_checkout_seconds",
+    "Time a connection stays checked out of the pool",
+    registry=None,
+)
+REQUEST_QUERIES = Histogram(
+    "db_request_queries",
+    "Number of SQL statements executed per request",
+    ["endpoint"],
+    buckets=(1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, float("inf")),
+    registry=None,
+)
+REQUEST_DB_TIME = Histogram(
+    "db_request_seconds",
+    "Total time spent in SQL statements per request",
+    ["endpoint"],
+    registry=None,
+)
+REQUEST_SLOWEST_QUERY = Histogram(
+    "db_request_slowest_query_seconds",
+    "Duration of the slowest SQL statement of a request",
+    ["endpoint"],
+    registry=None,
+)
+
+_active_stats: contextvars.ContextVar = contextvars.ContextVar(
+    "active_query_stats", default=()
+)
+
+
+class QueryStats:
+    """
+    Статистика SQL запросов, выполненных внутри track_queries
+    """
+
+    def __init__(self, keep_statements: bool = False) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.slowest = 0.0
+        self.slowest_statement: Optional[str] = None
+        self.keep_statements = keep_statements
+        self.statements: List[Tuple[float, str]] = list()
+
+    def record(self, statement: str, duration: float) -> None:
+        """
+        Метод для учёта выполненного запроса
+        :param statement: str
+        :param duration: float
+        :return: None
+        """
+        self.total += duration
+        if duration >= self.slowest:
+            self.slowest = duration
+            self.slowest_statement = statement
+        if self.keep_statements:
+            self.statements.append((duration, statement))
+
+
+def start_tracking(keep_statements: bool = False) -> Tuple[QueryStats, Token]:
+    """
+    Функция для начала сбора статистики запросов текущего потока или задачи,
+    вложенные сборы учитывают запросы независимо друг от друга
+    :param keep_statements: bool
+    :return: Tuple[QueryStats, Token]
+    """
+    stats = QueryStats(keep_statements)
+    return stats, _active_stats.set((*_active_stats.get(), stats))
+
+
+def stop_tracking(token: Token) -> None:
+    """
+    Функция для завершения сбора статистики, начатого start_tracking
+    :param token: Token
+    :return: None
+    """
+    _active_stats.reset(token)
+
+
+@contextmanager
+def track_queries(keep_statements: bool = False) -> Iterator[QueryStats]:
+    """
+    Контекстный менеджер для сбора статистики запросов внутри блока
+    :param keep_statements: bool
+    :return: Iterator[QueryStats]
+    """
+    stats, token = start_tracking(keep_statements)
+    try:
+        yield stats
+    finally:
+        stop_tracking(token)
+
+
+def instrument_queries(engine: Engine) -> None:
+    """
+    Функция для подсчёта числа и длительности запросов, выполняемых
+    внутри track_queries
+    :param engine: Engine
+    :return: None
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_execute(conn, cursor, statement, parameters, context, many) -> None:
+        active = _active_stats.get()
+        for stats in active:
+            stats.count += 1
+        if active:
+            conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_execute(conn, cursor, statement, parameters, context, many) -> None:
+        started = conn.info.get("query_started_at")
+        if not started:
+            return
+        duration = time.perf_counter() - started.pop()
+        for stats in _active_stats.get():
+            stats.record(statement, duration)
+
+    @event.listens_for(engine, "handle_error")
+    def _on_error(exception_context) -> None:
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("query_started_at"):
+            connection.info["query_started_at"].pop()
+
+
+def observe_request(endpoint: str, stats: QueryStats) -> None:
+    """
+    Функция для выгрузки статистики запросов одного HTTP запроса в Prometheus
+    :param endpoint: str
+    :param stats: QueryStats
+    :return: None
+    """
+    REQUEST_QUERIES.labels(endpoint).observe(stats.count)
+    REQUEST_DB_TIME.labels(endpoint).observe(stats.total)
+    REQUEST_SLOWEST_QUERY.labels(endpoint).observe(stats.slowest)
+
+
+class TimedQueuePool(QueuePool):
+    """
+    QueuePool, замеряющий время ожидания свободного соединения
+    """
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            POOL_WAIT.observe(time.perf_counter() - start)
+
+
+def instrument_pool(engine: Engine) -> None:
+    """
+    Функция для замера времени, на которое соединения берутся из пула
+    :param engine: Engine
+    :return: None
+    """
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+        connection_record.info["checkout_at"] = time.perf_counter()
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record) -> None:
+        checkout_at = connection_record.info.pop("checkout_at", None)
+        if checkout_at is not None:
+            POOL_CHECKOUT.observe(time.perf_counter() - checkout_at)
+
+
+class PoolCollector:
+    """
+    Коллектор Prometheus для текущего состояния пула соединений
+    """
+
+    def __init__(self, engine: Engine) -> None:
+        self.engine = engine
+
+    def collect(self) -> Iterator:
+        pool = self.engine.pool
+        if not isinstance(pool, QueuePool):
+            return
+        for name, description, value in (
+            ("db_pool_size", "Configured pool size", pool.size()),
+            ("db_pool_checked_out", "Connections in use", pool.checkedout()),
+            ("db_pool_overflow", "Overflow connections", max(pool.overflow(), 0)),
+        ):
+            yield GaugeMetricFamily(name, description, value=value)
@@ -1,17 +1,62 @@
-from flask import request
+import os
+
+from flask import after_this_request, request
 from injector import Injector, inject
+from sqlalchemy import event, inspect
+
+from src import replicas, write_behind
+from src.cache import TTLCache, invalidate_on_commit
+from src.models import User, session
+
+API_KEY_CACHE_SIZE = int(os.environ.get("API_KEY_CACHE_SIZE", 10000))
+API_KEY_CACHE_TTL = int(os.environ.get("API_KEY_CACHE_TTL", 300))
+
+api_key_cache = TTLCache(maxsize=API_KEY_CACHE_SIZE, ttl=API_KEY_CACHE_TTL)
 
-from src.models import SessionLocal, User
+
+def invalidate_api_key(api_key: str) -> None:
+    """
+    Функция для сброса закешированного пользователя по api_key,
+    вызывается при смене или отзыве ключа
+    :param api_key: str
+    :return: None
+    """
+    api_key_cache.invalidate(api_key)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_user_api_key(mapper, connection, target: User) -> None:
+    """
+    Функция для сброса кеша api_key после фиксации изменения или удаления
+    пользователя через ORM в этом процессе. Остальные воркеры увидят
+    изменение по истечении API_KEY_CACHE_TTL
+    """
+    state = inspect(target)
+    history = state.attrs.api_key.history
+    for api_key in (*history.deleted, target.api_key):
+        invalidate_on_commit(state.session, api_key_cache, api_key)
 
 
 class UserIdDepend(Injector):
     @inject
     def get_user_id_by_api_key(self) -> int:
-        session = SessionLocal()
         api_key = request.headers.get("api-key")
-        user = session.query(User).filter(User.api_key == api_key).one()
-        session.close()
-        return user.id
+        user_id = api_key_cache.get(api_key)
+        if user_id is None:
+            user_id = session.query(User.id).filter(User.api_key == api_key).one().id
+            api_key_cache.set(api_key, user_id)
+        if request.method == "GET":
+            write_behind.sync(user_id)
+        else:
+            # Отметка ставится после ответа, когда запись уже зафиксирована,
+            # чтобы окно чтения из основной БД не истекло раньше времени
+            @after_this_request
+            def _stick_to_primary(response):
+                replicas.on_write(user_id)
+                return response
+
+        return user_id
 
 
 def configure(binder):
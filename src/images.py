@@ -0,0 +1,98 @@
+import os
+import tempfile
+from typing import Dict, Optional, Tuple
+
+from PIL import Image, ImageOps
+
+# Варианты изображения: имя и максимальная сторона в пикселях
+MEDIA_VARIANTS: Tuple[Tuple[str, int], ...] = tuple(
+    (name, int(size))
+    for name, size in (
+        variant.split(":")
+        for variant in os.environ.get(
+            "MEDIA_VARIANTS", "thumb:320,medium:1280,large:2048"
+        ).split(",")
+    )
+)
+MEDIA_FORMATS = {"webp": ("WEBP", "webp"), "jpeg": ("JPEG", "jpg")}
+MEDIA_QUALITY = int(os.environ.get("MEDIA_QUALITY", 80))
+MEDIA_FEED_VARIANT = os.environ.get("MEDIA_FEED_VARIANT", "medium")
+MEDIA_FEED_FORMAT = os.environ.get("MEDIA_FEED_FORMAT", "webp")
+
+Variants = Dict[str, Dict[str, str]]
+
+
+def variant_path(link: str, name: str, fmt: str) -> str:
+    """
+    Функция для получения пути варианта рядом с исходным файлом:
+    media/ab/cd/<hash>.png -> media/ab/cd/<hash>.medium.webp
+    :param link: str
+    :param name: str
+    :param fmt: str
+    :return: str
+    """
+    return f"{os.path.splitext(link)[0]}.{name}.{MEDIA_FORMATS[fmt][1]}"
+
+
+def _save(image: Image.Image, path: str, fmt: str) -> None:
+    # Вариант пишется во временный файл и атомарно переименовывается,
+    # EXIF и прочие метаданные не передаются
+    handle, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path) or ".", prefix=".variant-"
+    )
+    try:
+        with os.fdopen(handle, "wb") as file:
+            image.save(
+                file, MEDIA_FORMATS[fmt][0], quality=MEDIA_QUALITY, optimize=True
+            )
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def render_variants(link: str) -> Variants:
+    """
+    Функция для создания уменьшенных вариантов изображения в форматах
+    WebP и JPEG без метаданных. Ориентация из EXIF применяется к пикселям
+    до удаления метаданных, изображение не увеличивается. Выполняется
+    в процессах пула, к БД не обращается
+    :param link: str
+    :return: Variants
+    """
+    with Image.open(link) as source:
+        source = ImageOps.exif_transpose(source)
+        if source.mode in ("RGBA", "LA", "P"):
+            # Прозрачные области JPEG заполняются белым, а не чёрным
+            source = source.convert("RGBA")
+            background = Image.new("RGB", source.size, "white")
+            background.paste(source, mask=source.getchannel("A"))
+            source = background
+        else:
+            source = source.convert("RGB")
+    variants: Variants = dict()
+    for name, size in MEDIA_VARIANTS:
+        image = source.copy()
+        image.thumbnail((size, size), Image.Resampling.LANCZOS)
+        variants[name] = dict()
+        for fmt in MEDIA_FORMATS:
+            path = variant_path(link, name, fmt)
+            _save(image, path, fmt)
+            variants[name][fmt] = path
+    return variants
+
+
+def feed_link(link: str, variants: Optional[Variants]) -> str:
+    """
+    Функция для выбора ссылки на вложение в ленте: вариант
+    MEDIA_FEED_VARIANT в формате MEDIA_FEED_FORMAT, а пока варианты
+    не готовы - исходный файл
+    :param link: str
+    :param variants: Optional[Variants]
+    :return: str
+    """
+    return (
+        (variants or dict())
+        .get(MEDIA_FEED_VARIANT, dict())
+        .get(MEDIA_FEED_FORMAT, link)
+    )
@@ -1,8 +1,81 @@
+import click
 from flask.cli import FlaskGroup
 
 from src.app import app as app
+from src.counters import reconcile_counters
+from src.purge import purge_deleted
+from src.tags import prune_trends, rebuild_tags
+from src.timeline import rebuild_timelines
+from src.uploads import collect_media_garbage, process_pending_media
 
 cli = FlaskGroup(app)
 
+
+@cli.command("rebuild-timelines")
+def rebuild_timelines_command() -> None:
+    """
+    Команда для пересчёта предрассчитанных лент (FEED_MODE=write)
+    """
+    count = rebuild_timelines()
+    click.echo(f"Timelines rebuilt: {count} entries")
+
+
+@cli.command("rebuild-tags")
+def rebuild_tags_command() -> None:
+    """
+    Команда для заполнения хештегов, упоминаний и счётчиков трендов
+    по всем твитам
+    """
+    count = rebuild_tags()
+    click.echo(f"Tags rebuilt: {count} tweets with hashtags or mentions")
+
+
+@cli.command("prune-trends")
+def prune_trends_command() -> None:
+    """
+    Команда для удаления счётчиков трендов старше самого длинного окна
+    """
+    count = prune_trends()
+    click.echo(f"Trends pruned: {count} buckets removed")
+
+
+@cli.command("reconcile-counters")
+def reconcile_counters_command() -> None:
+    """
+    Команда для сверки счётчиков лайков и подписок с таблицами like и follow
+    """
+    count = reconcile_counters()
+    click.echo(f"Counters reconciled: {count} rows fixed")
+
+
+@cli.command("collect-media")
+def collect_media_command() -> None:
+    """
+    Команда для удаления медиа, не прикреплённых ни к одному твиту
+    """
+    count = collect_media_garbage(app.config["UPLOAD_FOLDER"])
+    click.echo(f"Media collected: {count} files removed")
+
+
+@cli.command("purge-deleted")
+def purge_deleted_command() -> None:
+    """
+    Команда для удаления лайков, записей лент и медиа удалённых твитов
+    и самих твитов
+    """
+    count = purge_deleted()
+    click.echo(f"Deleted tweets purged: {count}")
+
+
+@cli.command("process-media")
+def process_media_command() -> None:
+    """
+    Команда для создания вариантов изображений, загруженных до появления
+    фоновой обработки, и повторной обработки брошенных и неудачных
+    """
+    count = process_pending_media()
+    click.echo(f"Media processed: {count} files")
+
+
 if __name__ == "__main__":
     cli()
@@ -0,0 +1,284 @@
+import atexit
+import logging
+import os
+import threading
+import time
+from typing import Optional, Tuple
+
+from sqlalchemy import delete, exc, select, tuple_
+from sqlalchemy.sql import ColumnElement
+
+from src.models import Like, Media, TimelineEntry, Tweet, TweetMedia, session
+from src.tags import TRENDS_BUCKET_SECONDS, prune_trends
+from src.uploads import remove_media, unreferenced_media
+
+# 1 - удалённые твиты очищает фоновый поток каждого процесса, 0 - только
+# команда purge-deleted (например, по расписанию)
+PURGE_WORKER = os.environ.get("PURGE_WORKER", "1") == "1"
+PURGE_BATCH_SIZE = int(os.environ.get("PURGE_BATCH_SIZE", 1000))
+# Пауза между пачками, чтобы очистка не занимала БД целиком
+PURGE_PAUSE_MS = int(os.environ.get("PURGE_PAUSE_MS", 10))
+# Интервал проверки очереди без новых удалений, секунды
+PURGE_INTERVAL = float(os.environ.get("PURGE_INTERVAL", 60))
+
+logger = logging.getLogger("twitter log")
+
+
+def pause(pause_ms: int, stop: Optional[threading.Event]) -> bool:
+    """
+    Функция для паузы между пачками, возвращает True, если очистку нужно
+    прервать: каждая пачка - отдельная транзакция, поэтому прерванная
+    очистка продолжится со следующего запуска
+    :param pause_ms: int
+    :param stop: Optional[threading.Event]
+    :return: bool
+    """
+    if stop is None:
+        time.sleep(pause_ms / 1000)
+        return False
+    return stop.wait(pause_ms / 1000)
+
+
+def purge_rows(
+    model,
+    keys: Tuple[ColumnElement, ...],
+    tweet_id: ColumnElement,
+    batch_size: int,
+    pause_ms: int,
+    stop: Optional[threading.Event] = None,
+) -> int:
+    """
+    Функция для удаления строк model (ключ keys), относящихся к удалённым
+    твитам, пачками по batch_size строк, каждая пачка - отдельная
+    транзакция. Блокировки держатся не дольше одной пачки, сколько бы строк
+    ни было
+    :param model: Base
+    :param keys: Tuple[ColumnElement, ...]
+    :param tweet_id: ColumnElement
+    :param batch_size: int
+    :param pause_ms: int
+    :param stop: Optional[threading.Event]
+    :return: int
+    """
+    batch = (
+        select(*keys)
+        .join(Tweet, Tweet.id == tweet_id)
+        .where(Tweet.deleted_at.isnot(None))
+        .limit(batch_size)
+    )
+    removed = 0
+    while True:
+        count = session.execute(
+            delete(model)
+            .where(tuple_(*keys).in_(batch))
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        session.commit()
+        removed += count
+        if count < batch_size or pause(pause_ms, stop):
+            return removed
+
+
+def purge_deleted(
+    batch_size: int = PURGE_BATCH_SIZE,
+    pause_ms: int = PURGE_PAUSE_MS,
+    stop: Optional[threading.Event] = None,
+) -> int:
+    """
+    Функция для очистки удалённых твитов: лайки и записи лент удаляются
+    пачками, затем сами твиты (оставшиеся строки вложений, хештегов и
+    упоминаний - каскадом) и медиа, на которые больше не ссылается ни один
+    твит. Возвращает число окончательно удалённых твитов
+    :param batch_size: int
+    :param pause_ms: int
+    :param stop: Optional[threading.Event]
+    :return: int
+    """
+    purge_rows(Like, (Like.id,), Like.tweet_id, batch_size, pause_ms, stop)
+    purge_rows(
+        TimelineEntry,
+        (TimelineEntry.user_id, TimelineEntry.tweet_id),
+        TimelineEntry.tweet_id,
+        batch_size,
+        pause_ms,
+        stop,
+    )
+    purged = 0
+    while stop is None or not stop.is_set():
+        tweet_ids = (
+            session.execute(
+                select(Tweet.id)
+                .where(Tweet.deleted_at.isnot(None))
+                .order_by(Tweet.deleted_at)
+                .limit(batch_size)
+            )
+            .scalars()
+            .all()
+        )
+        if not tweet_ids:
+            return purged
+        media_ids = (
+            session.execute(
+                select(TweetMedia.media_id)
+                .where(TweetMedia.tweet_id.in_(tweet_ids))
+                .distinct()
+            )
+            .scalars()
+            .all()
+        )
+        session.execute(
+            delete(Tweet)
+            .where(Tweet.id.in_(tweet_ids))
+            .execution_options(synchronize_session=False)
+        )
+        session.commit()
+        purged += len(tweet_ids)
+        if media_ids:
+            remove_media((Media.id.in_(media_ids), *unreferenced_media()), batch_size)
+        if len(tweet_ids) < batch_size or pause(pause_ms, stop):
+            return purged
+    return purged
+
+
+class PurgeWorker:
+    """
+    Фоновый поток очистки удалённых твитов: просыпается после удаления
+    твита в этом процессе или раз в interval секунд и вызывает
+    purge_deleted. Запрос удаления только помечает твит и не ждёт очистки.
+    Раз в prune_interval секунд поток также удаляет устаревшие счётчики
+    трендов (prune_trends)
+    """
+
+    def __init__(
+        self,
+        batch_size: int = PURGE_BATCH_SIZE,
+        pause_ms: int = PURGE_PAUSE_MS,
+        interval: float = PURGE_INTERVAL,
+        prune_interval: float = TRENDS_BUCKET_SECONDS,
+    ) -> None:
+        self.batch_size = batch_size
+        self.pause_ms = pause_ms
+        self.interval = interval
+        self.prune_interval = prune_interval
+        self.purged = 0
+        self.pruned = 0
+        self._pruned_at = float("-inf")
+        self._requested = False
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._closed = False
+
+    def notify(self) -> None:
+        """
+        Метод для запуска очистки после удаления твита
+        :return: None
+        """
+        with self._lock:
+            self._ensure_worker()
+            self._requested = True
+            self._wakeup.notify()
+
+    def start(self) -> None:
+        """
+        Метод для запуска фонового потока без запроса очистки, например
+        в процессе, который создаёт твиты, но не удаляет их
+        :return: None
+        """
+        with self._lock:
+            self._ensure_worker()
+
+    def _ensure_worker(self) -> None:
+        # Поток запускается при первом удалении в каждом процессе, так как
+        # воркеры uwsgi создаются fork после импорта приложения
+        if self._closed or (self._thread is not None and self._pid == os.getpid()):
+            return
+        self._pid = os.getpid()
+        self._thread = threading.Thread(target=self._run, name="purge", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._requested and not self._closed:
+                    self._wakeup.wait(self.interval)
+                if self._closed:
+                    return
+                self._requested = False
+            try:
+                self.purged += purge_deleted(self.batch_size, self.pause_ms, self._stop)
+                if time.monotonic() - self._pruned_at >= self.prune_interval:
+                    self.pruned += prune_trends()
+                    self._pruned_at = time.monotonic()
+            except (exc.SQLAlchemyError, OSError):
+                # Ошибки БД и файловой системы считаются временными, очистка
+                # повторяется через interval. Ошибки в коде не перехватываются
+                session.rollback()
+                logger.exception("Purge of deleted Tweets or trends failed, retrying")
+                self._stop.wait(self.interval)
+
+    def close(self) -> None:
+        """
+        Метод для остановки фонового потока после текущей пачки,
+        вызывается при завершении процесса. Оставшиеся твиты очистит
+        следующий запуск
+        :return: None
+        """
+        self._stop.set()
+        with self._lock:
+            self._closed = True
+            self._wakeup.notify()
+        if self._thread is not None and self._thread.is_alive():
+            self._thread.join()
+
+
+worker: Optional[PurgeWorker] = None
+
+
+def configure(purge_worker: Optional[PurgeWorker]) -> None:
+    """
+    Функция для включения (или отключения при None) фоновой очистки,
+    предыдущий поток останавливается
+    :param purge_worker: Optional[PurgeWorker]
+    :return: None
+    """
+    global worker
+    if worker is not None:
+        worker.close()
+    worker = purge_worker
+
+
+def on_tweet_deleted(tweet_id: int) -> None:
+    """
+    Функция для запуска фоновой очистки после удаления твита
+    :param tweet_id: int
+    :return: None
+    """
+    if worker is not None:
+        worker.notify()
+
+
+def on_tweet_created() -> None:
+    """
+    Функция для запуска фонового потока в процессе, создающем твиты:
+    счётчики трендов растут с каждым твитом и удаляются этим потоком
+    :return: None
+    """
+    if worker is not None:
+        worker.start()
+
+
+def close() -> None:
+    """
+    Функция для остановки фоновой очистки при завершении процесса
+    :return: None
+    """
+    if worker is not None:
+        worker.close()
+
+
+if PURGE_WORKER:
+    configure(PurgeWorker())
+atexit.register(close)
@@ -0,0 +1,226 @@
+import logging
+import math
+import os
+import threading
+import time
+from typing import Iterable, Iterator, List, Optional
+
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from sqlalchemy import event, exc, text
+from sqlalchemy.engine import Engine
+
+from src.cache import RedisTier, TieredCache, TTLCache
+from src.models import make_engine, session
+
+# Адреса реплик для чтения через запятую, пусто - все запросы идут
+# в основную БД
+DATABASE_REPLICA_URLS = [
+    url.strip()
+    for url in os.environ.get("DATABASE_REPLICA_URLS", "").split(",")
+    if url.strip()
+]
+# Как часто проверять доступность реплики (и возвращать отключённую), секунды
+REPLICA_CHECK_INTERVAL = float(os.environ.get("REPLICA_CHECK_INTERVAL", 5))
+# Сколько секунд после записи пользователь читает из основной БД, чтобы
+# видеть свои изменения, пока они доходят до реплик
+REPLICA_STICKY_SECONDS = float(os.environ.get("REPLICA_STICKY_SECONDS", 5))
+REPLICA_STICKY_CACHE_SIZE = int(os.environ.get("REPLICA_STICKY_CACHE_SIZE", 100000))
+# Общее для всех воркеров хранилище отметок о записи, без него отметка
+# действует только в воркере, обработавшем запись
+REPLICA_STICKY_REDIS_URL = os.environ.get("REPLICA_STICKY_REDIS_URL")
+
+PRIMARY = "primary"
+REPLICA = "replica"
+
+logger = logging.getLogger("twitter log")
+
+
+class ReplicaRouter:
+    """
+    Выбор реплики для чтения: реплики перебираются по кругу, недоступные
+    пропускаются до следующей проверки. Пользователь, недавно выполнявший
+    запись, читает из основной БД
+    """
+
+    def __init__(
+        self,
+        engines: Iterable[Engine],
+        check_interval: float = REPLICA_CHECK_INTERVAL,
+        sticky_seconds: float = REPLICA_STICKY_SECONDS,
+        sticky_remote: Optional[RedisTier] = None,
+    ) -> None:
+        self.engines: List[Engine] = list(engines)
+        self.check_interval = check_interval
+        self.sticky = TieredCache(
+            TTLCache(maxsize=REPLICA_STICKY_CACHE_SIZE, ttl=sticky_seconds),
+            sticky_remote,
+        )
+        self.reads = {PRIMARY: 0, REPLICA: 0}
+        self._healthy = [True] * len(self.engines)
+        self._checked_at = [float("-inf")] * len(self.engines)
+        self._position = 0
+        self._lock = threading.Lock()
+        for index, replica in enumerate(self.engines):
+            self._watch(index, replica)
+
+    def _watch(self, index: int, replica: Engine) -> None:
+        # Реплика, потерявшая соединение посреди запроса, отключается сразу,
+        # не дожидаясь плановой проверки
+        @event.listens_for(replica, "handle_error")
+        def _on_error(exception_context) -> None:
+            if exception_context.is_disconnect:
+                self._mark(index, False)
+
+    def _mark(self, index: int, healthy: bool) -> None:
+        if self._healthy[index] != healthy:
+            state = "available" if healthy else "unavailable"
+            logger.warning(f"Read replica {self.engines[index].url!r} is {state}")
+        self._healthy[index] = healthy
+        self._checked_at[index] = time.monotonic()
+
+    def check(self, index: int) -> bool:
+        """
+        Метод для проверки доступности реплики запросом SELECT 1
+        :param index: int
+        :return: bool
+        """
+        try:
+            with self.engines[index].connect() as connection:
+                connection.execute(text("SELECT 1"))
+            healthy = True
+        except exc.DBAPIError:
+            healthy = False
+        self._mark(index, healthy)
+        return healthy
+
+    def available(self, index: int) -> bool:
+        """
+        Метод для доступности реплики: результат проверки действует
+        check_interval секунд
+        :param index: int
+        :return: bool
+        """
+        if time.monotonic() - self._checked_at[index] >= self.check_interval:
+            return self.check(index)
+        return self._healthy[index]
+
+    def choose(self) -> Optional[Engine]:
+        """
+        Метод для выбора следующей по кругу доступной реплики, None - все
+        реплики недоступны
+        :return: Optional[Engine]
+        """
+        for _ in range(len(self.engines)):
+            with self._lock:
+                index = self._position % len(self.engines)
+                self._position += 1
+            if self.available(index):
+                return self.engines[index]
+        return None
+
+    def stick(self, user_id: int) -> None:
+        """
+        Метод для отметки о записи пользователя: его чтения идут в основную
+        БД в течение sticky_seconds
+        :param user_id: int
+        :return: None
+        """
+        self.sticky.set_many({user_id: "1"})
+
+    def is_sticky(self, user_id: int) -> bool:
+        """
+        Метод для проверки, выполнял ли пользователь запись недавно
+        :param user_id: int
+        :return: bool
+        """
+        return user_id in self.sticky.get_many([user_id])
+
+    def route(self, user_id: int) -> Optional[Engine]:
+        """
+        Метод для выбора реплики для чтений пользователя, None - читать
+        из основной БД
+        :param user_id: int
+        :return: Optional[Engine]
+        """
+        replica = None if self.is_sticky(user_id) else self.choose()
+        self.reads[PRIMARY if replica is None else REPLICA] += 1
+        return replica
+
+
+router: Optional[ReplicaRouter] = None
+
+
+def configure(replica_router: Optional[ReplicaRouter]) -> None:
+    """
+    Функция для включения (или отключения при None) чтения с реплик
+    :param replica_router: Optional[ReplicaRouter]
+    :return: None
+    """
+    global router
+    router = replica_router
+
+
+def use_replica(user_id: int) -> bool:
+    """
+    Функция для чтения текущей сессии с реплики: SELECT до конца запроса
+    выполняются на выбранной реплике, если пользователь не выполнял запись
+    последние REPLICA_STICKY_SECONDS секунд и есть доступная реплика
+    :param user_id: int
+    :return: bool
+    """
+    if router is None:
+        return False
+    replica = router.route(user_id)
+    session.info["replica"] = replica
+    return replica is not None
+
+
+def on_write(user_id: int) -> None:
+    """
+    Функция для отметки о записи пользователя после её фиксации
+    :param user_id: int
+    :return: None
+    """
+    if router is not None:
+        router.stick(user_id)
+
+
+class ReplicaCollector:
+    """
+    Коллектор Prometheus для доступности реплик и числа чтений
+    с реплик и основной БД
+    """
+
+    def __init__(self, replica_router: ReplicaRouter) -> None:
+        self.router = replica_router
+
+    def collect(self) -> Iterator:
+        healthy = GaugeMetricFamily(
+            "db_replica_healthy", "Read replica passed its last check", labels=["url"]
+        )
+        for index, replica in enumerate(self.router.engines):
+            healthy.add_metric([repr(replica.url)], int(self.router._healthy[index]))
+        yield healthy
+        reads = CounterMetricFamily(
+            "db_routed_reads", "Routed read requests by target", labels=["target"]
+        )
+        for target, count in self.router.reads.items():
+            reads.add_metric([target], count)
+        yield reads
+
+
+if DATABASE_REPLICA_URLS:
+    configure(
+        ReplicaRouter(
+            [make_engine(url) for url in DATABASE_REPLICA_URLS],
+            sticky_remote=(
+                RedisTier(
+                    REPLICA_STICKY_REDIS_URL,
+                    "replica_sticky",
+                    math.ceil(REPLICA_STICKY_SECONDS),
+                )
+                if REPLICA_STICKY_REDIS_URL
+                else None
+            ),
+        )
+    )
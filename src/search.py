@@ -0,0 +1,244 @@
+import base64
+import math
+import os
+import re
+import threading
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import Float, cast, func, literal, literal_column, select, tuple_
+from sqlalchemy.sql import Select
+
+from src.models import TWEET_PAGE_OPTIONS, TWEET_SEARCH_CONFIG, Tweet, session
+
+# postgres - tsvector и GIN индекс, memory - инвертированный индекс в памяти
+# процесса для тестов и сравнения в бенчмарках. Приложение работает только
+# с PostgreSQL, поэтому memory не замена для других СУБД и включается явно
+SEARCH_BACKEND = os.environ.get("SEARCH_BACKEND") or "postgres"
+SEARCH_PAGE_SIZE = int(os.environ.get("SEARCH_PAGE_SIZE", 20))
+SEARCH_MAX_PAGE_SIZE = int(os.environ.get("SEARCH_MAX_PAGE_SIZE", 100))
+
+WORD_RE = re.compile(r"\w+")
+
+Position = Tuple[float, int]
+
+
+def encode_search_cursor(rank: float, tweet_id: int) -> str:
+    """
+    Функция для кодирования позиции результата поиска в непрозрачный курсор.
+    repr сохраняет rank без потери точности, поэтому сравнение на следующей
+    странице точное
+    :param rank: float
+    :param tweet_id: int
+    :return: str
+    """
+    raw = f"{rank!r}|{tweet_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_search_cursor(cursor: str) -> Position:
+    """
+    Функция для декодирования курсора поиска в пару (rank, id)
+    :param cursor: str
+    :return: Position
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        rank, tweet_id = raw.split("|")
+        return float(rank), int(tweet_id)
+    except ValueError as exc:
+        raise ValueError(f"Invalid cursor: {cursor}") from exc
+
+
+def parse_query(query: str) -> Tuple[List[str], List[str]]:
+    """
+    Функция для разбора запроса в памяти по правилам websearch_to_tsquery
+    в упрощённом виде: все слова обязательны, слово с минусом исключается
+    :param query: str
+    :return: Tuple[List[str], List[str]]
+    """
+    required: List[str] = list()
+    excluded: List[str] = list()
+    for chunk in query.lower().split():
+        words = WORD_RE.findall(chunk)
+        (excluded if chunk.startswith("-") else required).extend(words)
+    return required, excluded
+
+
+class InvertedIndex:
+    """
+    Инвертированный индекс твитов в памяти процесса: слово -> {id: число
+    вхождений}. Загружается из БД при первом поиске и обновляется при
+    создании и удалении твитов в этом процессе, поэтому подходит только
+    для тестов и бенчмарков, а не для нескольких воркеров
+    """
+
+    def __init__(self) -> None:
+        self.postings: Dict[str, Dict[int, int]] = defaultdict(dict)
+        self.words: Dict[int, List[str]] = dict()
+        self.lengths: Dict[int, int] = dict()
+        self.loaded = False
+        self._lock = threading.Lock()
+
+    def _add(self, tweet_id: int, text: Optional[str]) -> None:
+        words = Counter(WORD_RE.findall((text or "").lower()))
+        for word, count in words.items():
+            self.postings[word][tweet_id] = count
+        self.words[tweet_id] = list(words)
+        self.lengths[tweet_id] = max(1, sum(words.values()))
+
+    def load(self) -> None:
+        """
+        Метод для построения индекса по всем твитам из БД
+        :return: None
+        """
+        with self._lock:
+            if self.loaded:
+                return
+            rows = session.execute(
+                select(Tweet.id, Tweet.text).where(Tweet.deleted_at.is_(None))
+            )
+            for tweet_id, text in rows:
+                self._add(tweet_id, text)
+            self.loaded = True
+
+    def add(self, tweet_id: int, text: Optional[str]) -> None:
+        """
+        Метод для добавления твита в загруженный индекс
+        :param tweet_id: int
+        :param text: Optional[str]
+        :return: None
+        """
+        with self._lock:
+            if self.loaded:
+                self._add(tweet_id, text)
+
+    def remove(self, tweet_id: int) -> None:
+        """
+        Метод для удаления твита из индекса
+        :param tweet_id: int
+        :return: None
+        """
+        with self._lock:
+            self.lengths.pop(tweet_id, None)
+            for word in self.words.pop(tweet_id, []):
+                del self.postings[word][tweet_id]
+                if not self.postings[word]:
+                    del self.postings[word]
+
+    def search(
+        self, query: str, limit: int, position: Optional[Position] = None
+    ) -> List[Tuple[int, float]]:
+        """
+        Метод для поиска твитов, содержащих все слова запроса, по убыванию
+        rank (TF-IDF, нормированный на длину твита) и id
+        :param query: str
+        :param limit: int
+        :param position: Optional[Position]
+        :return: List[Tuple[int, float]]
+        """
+        self.load()
+        required, excluded = parse_query(query)
+        if not required:
+            return []
+        with self._lock:
+            postings = [self.postings.get(word, dict()) for word in required]
+            ids: Set[int] = set(min(postings, key=len))
+            for posting in postings:
+                ids.intersection_update(posting)
+            for word in excluded:
+                ids.difference_update(self.postings.get(word, dict()))
+            total = len(self.lengths)
+            ranked = [
+                (
+                    tweet_id,
+                    sum(
+                        posting[tweet_id] * math.log(1 + total / len(posting))
+                        for posting in postings
+                    )
+                    / (1 + math.log(self.lengths[tweet_id])),
+                )
+                for tweet_id in ids
+            ]
+        if position is not None:
+            ranked = [row for row in ranked if (row[1], row[0]) < position]
+        ranked.sort(key=lambda row: (row[1], row[0]), reverse=True)
+        return ranked[:limit]
+
+
+memory_index = InvertedIndex()
+
+
+def on_tweet_created(tweet: Tweet) -> None:
+    """
+    Функция для добавления нового твита в индекс в памяти.
+    В PostgreSQL поисковый вектор вычисляет сама БД
+    :param tweet: Tweet
+    :return: None
+    """
+    if SEARCH_BACKEND == "memory":
+        memory_index.add(tweet.id, tweet.text)
+
+
+def on_tweet_deleted(tweet_id: int) -> None:
+    """
+    Функция для удаления твита из индекса в памяти
+    :param tweet_id: int
+    :return: None
+    """
+    if SEARCH_BACKEND == "memory":
+        memory_index.remove(tweet_id)
+
+
+def search_query(query: str, limit: int, position: Optional[Position] = None) -> Select:
+    """
+    Функция для запроса страницы результатов поиска в PostgreSQL: GIN индекс
+    находит твиты по tsvector, результаты сортируются по (rank, id)
+    :param query: str
+    :param limit: int
+    :param position: Optional[Position]
+    :return: Select
+    """
+    config = literal_column(f"'{TWEET_SEARCH_CONFIG}'::regconfig")
+    tsquery = func.websearch_to_tsquery(config, query)
+    # real из ts_rank_cd приводится к double precision: его текстовое
+    # представление читается в float без потерь, и курсор сравнивается точно
+    rank = cast(func.ts_rank_cd(Tweet.text_search, tsquery), Float)
+    statement = (
+        select(Tweet, rank.label("rank"))
+        .options(*TWEET_PAGE_OPTIONS)
+        .where(Tweet.text_search.op("@@")(tsquery), Tweet.deleted_at.is_(None))
+    )
+    if position is not None:
+        statement = statement.where(
+            tuple_(rank, Tweet.id)
+            < tuple_(literal(position[0], Float), literal(position[1]))
+        )
+    return statement.order_by(rank.desc(), Tweet.id.desc()).limit(limit)
+
+
+def find_tweets(
+    query: str, limit: int, position: Optional[Position] = None
+) -> List[Tuple[Tweet, float]]:
+    """
+    Функция для поиска страницы твитов с их rank выбранным SEARCH_BACKEND
+    :param query: str
+    :param limit: int
+    :param position: Optional[Position]
+    :return: List[Tuple[Tweet, float]]
+    """
+    if SEARCH_BACKEND == "memory":
+        ranked = memory_index.search(query, limit, position)
+        tweets = {
+            tweet.id: tweet
+            for tweet in session.query(Tweet)
+            .options(*TWEET_PAGE_OPTIONS)
+            .filter(
+                Tweet.id.in_([tweet_id for tweet_id, _ in ranked]),
+                Tweet.deleted_at.is_(None),
+            )
+        }
+        return [
+            (tweets[tweet_id], rank) for tweet_id, rank in ranked if tweet_id in tweets
+        ]
+    return [tuple(row) for row in session.execute(search_query(query, limit, position))]
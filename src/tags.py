@@ -0,0 +1,321 @@
+import datetime
+import os
+import re
+from typing import List, Optional, Tuple
+
+from sqlalchemy import (
+    Integer,
+    String,
+    column,
+    delete,
+    desc,
+    func,
+    or_,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.sql import ColumnElement, Select
+from sqlalchemy.sql.expression import Values
+
+from src.cache import TTLCache
+from src.models import (
+    Hashtag,
+    HashtagBucket,
+    Mention,
+    Tweet,
+    TweetHashtag,
+    User,
+    session,
+)
+
+# Длина интервала счётчиков трендов: окно тренда округляется до интервала
+TRENDS_BUCKET_SECONDS = int(os.environ.get("TRENDS_BUCKET_SECONDS", 300))
+TRENDS_WINDOWS = {"1h": 3600, "24h": 24 * 3600}
+TRENDS_SIZE = int(os.environ.get("TRENDS_SIZE", 10))
+# Время жизни рассчитанного топа в процессе, секунды
+TRENDS_REFRESH = float(os.environ.get("TRENDS_REFRESH", 30))
+TAGS_BATCH_SIZE = int(os.environ.get("TAGS_BATCH_SIZE", 10000))
+
+HASHTAG_RE = re.compile(r"(?<![\w#])#(\w{1,100})")
+MENTION_RE = re.compile(r"(?<![\w@])@(\w{1,100})")
+
+trends_cache = TTLCache(maxsize=len(TRENDS_WINDOWS), ttl=TRENDS_REFRESH)
+
+
+def parse_hashtags(text: Optional[str]) -> List[str]:
+    """
+    Функция для извлечения хештегов из текста: без #, в нижнем регистре,
+    без повторов, в порядке появления
+    :param text: Optional[str]
+    :return: List[str]
+    """
+    return list(dict.fromkeys(tag.lower() for tag in HASHTAG_RE.findall(text or "")))
+
+
+def parse_mentions(text: Optional[str]) -> List[str]:
+    """
+    Функция для извлечения имён упомянутых пользователей (@имя) из текста
+    :param text: Optional[str]
+    :return: List[str]
+    """
+    return list(dict.fromkeys(MENTION_RE.findall(text or "")))
+
+
+def bucket_of(moment: ColumnElement) -> ColumnElement:
+    """
+    Функция для SQL выражения начала интервала TRENDS_BUCKET_SECONDS,
+    в который попадает moment
+    :param moment: ColumnElement
+    :return: ColumnElement
+    """
+    epoch = func.extract("epoch", moment)
+    return func.to_timestamp(
+        func.floor(epoch / TRENDS_BUCKET_SECONDS) * TRENDS_BUCKET_SECONDS
+    )
+
+
+def count_hashtags(tweet_ids: List[int], delta: int) -> None:
+    """
+    Функция для изменения счётчиков трендов на delta по хештегам твитов
+    tweet_ids в интервалах их создания, одним запросом. Строки счётчиков
+    блокируются в порядке hashtag_id, поэтому одновременные твиты с
+    одинаковыми хештегами не взаимоблокируются
+    :param tweet_ids: List[int]
+    :param delta: int
+    :return: None
+    """
+    rows = (
+        select(
+            bucket_of(Tweet.datetime).label("bucket"),
+            TweetHashtag.hashtag_id,
+            func.count().label("count"),
+        )
+        .join(Tweet, Tweet.id == TweetHashtag.tweet_id)
+        .where(TweetHashtag.tweet_id.in_(tweet_ids))
+        .group_by("bucket", TweetHashtag.hashtag_id)
+        .order_by(TweetHashtag.hashtag_id, "bucket")
+    )
+    if delta < 0:
+        counts = rows.subquery()
+        session.execute(
+            update(HashtagBucket)
+            .where(
+                HashtagBucket.bucket == counts.c.bucket,
+                HashtagBucket.hashtag_id == counts.c.hashtag_id,
+            )
+            .values(count=HashtagBucket.count + counts.c.count * delta)
+            .execution_options(synchronize_session=False)
+        )
+        return
+    statement = insert(HashtagBucket).from_select(
+        ["bucket", "hashtag_id", "count"], rows
+    )
+    session.execute(
+        statement.on_conflict_do_update(
+            index_elements=[HashtagBucket.bucket, HashtagBucket.hashtag_id],
+            set_={"count": HashtagBucket.count + statement.excluded.count},
+        )
+    )
+
+
+def pairs(name: str, rows: List[Tuple[int, str]]) -> Values:
+    """
+    Функция для списка пар (id твита, имя) в виде VALUES для INSERT ... SELECT
+    :param name: str
+    :param rows: List[Tuple[int, str]]
+    :return: Values
+    """
+    return values(column("tweet_id", Integer), column("name", String), name=name).data(
+        rows
+    )
+
+
+def index_tweets(tweets: List[Tweet]) -> int:
+    """
+    Функция для сохранения хештегов и упоминаний твитов и увеличения
+    счётчиков трендов: не больше четырёх запросов на любое число твитов,
+    твиты без хештегов и упоминаний не добавляют запросов
+    :param tweets: List[Tweet]
+    :return: int
+    """
+    hashtags = [
+        (tweet.id, name) for tweet in tweets for name in parse_hashtags(tweet.text)
+    ]
+    mentions = [
+        (tweet.id, name) for tweet in tweets for name in parse_mentions(tweet.text)
+    ]
+    if hashtags:
+        session.execute(
+            insert(Hashtag)
+            .values([{"name": name} for name in sorted({n for _, n in hashtags})])
+            .on_conflict_do_nothing(index_elements=[Hashtag.name])
+        )
+        tags = pairs("tags", hashtags)
+        session.execute(
+            insert(TweetHashtag).from_select(
+                ["tweet_id", "hashtag_id"],
+                select(tags.c.tweet_id, Hashtag.id).join(
+                    Hashtag, Hashtag.name == tags.c.name
+                ),
+            )
+        )
+        count_hashtags(sorted({tweet_id for tweet_id, _ in hashtags}), 1)
+    if mentions:
+        names = pairs("names", mentions)
+        # Имя пользователя не уникально: упоминание связывается только
+        # с единственным владельцем имени, неоднозначные имена пропускаются
+        owners = (
+            select(User.name, func.min(User.id).label("user_id"))
+            .where(User.name.in_(sorted({name for _, name in mentions})))
+            .group_by(User.name)
+            .having(func.count() == 1)
+            .subquery()
+        )
+        session.execute(
+            insert(Mention)
+            .from_select(
+                ["tweet_id", "user_id"],
+                select(names.c.tweet_id, owners.c.user_id).join(
+                    owners, owners.c.name == names.c.name
+                ),
+            )
+            .on_conflict_do_nothing()
+        )
+    return len({tweet_id for tweet_id, _ in hashtags + mentions})
+
+
+def on_tweet_created(tweet: Tweet) -> None:
+    """
+    Функция для сохранения хештегов и упоминаний нового твита в его
+    транзакции
+    :param tweet: Tweet
+    :return: None
+    """
+    index_tweets([tweet])
+
+
+def on_tweet_deleted(tweet_id: int) -> None:
+    """
+    Функция для уменьшения счётчиков трендов при удалении твита, строки
+    хештегов и упоминаний удаляются каскадно при очистке твита
+    :param tweet_id: int
+    :return: None
+    """
+    count_hashtags([tweet_id], -1)
+
+
+def rebuild_tags(batch_size: int = TAGS_BATCH_SIZE) -> int:
+    """
+    Функция для заполнения хештегов, упоминаний и счётчиков трендов по всем
+    твитам, например после миграции. Твиты читаются пачками по batch_size
+    :param batch_size: int
+    :return: int
+    """
+    session.execute(delete(TweetHashtag))
+    session.execute(delete(Mention))
+    session.execute(delete(HashtagBucket))
+    last_id, processed = 0, 0
+    while True:
+        tweets = (
+            session.query(Tweet)
+            .filter(Tweet.id > last_id, Tweet.deleted_at.is_(None))
+            .order_by(Tweet.id)
+            .limit(batch_size)
+            .all()
+        )
+        processed += index_tweets(tweets)
+        session.commit()
+        if len(tweets) < batch_size:
+            break
+        last_id = tweets[-1].id
+    prune_trends()
+    return processed
+
+
+def prune_trends() -> int:
+    """
+    Функция для удаления счётчиков трендов старше самого длинного окна
+    и обнулённых удалением твитов: размер таблицы ограничен числом
+    интервалов в окне
+    :return: int
+    """
+    horizon = max(TRENDS_WINDOWS.values()) + TRENDS_BUCKET_SECONDS
+    removed = session.execute(
+        delete(HashtagBucket)
+        .where(
+            or_(
+                HashtagBucket.bucket < func.now() - datetime.timedelta(seconds=horizon),
+                HashtagBucket.count <= 0,
+            )
+        )
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    session.commit()
+    return removed
+
+
+def trends_query(window: str, limit: int = TRENDS_SIZE) -> Select:
+    """
+    Функция для запроса топа хештегов за окно по счётчикам интервалов:
+    читаются только строки интервалов окна, а не таблица твитов
+    :param window: str
+    :param limit: int
+    :return: Select
+    """
+    since = bucket_of(func.now() - datetime.timedelta(seconds=TRENDS_WINDOWS[window]))
+    total = func.sum(HashtagBucket.count).label("count")
+    return (
+        select(Hashtag.name, total)
+        .join(Hashtag, Hashtag.id == HashtagBucket.hashtag_id)
+        .where(HashtagBucket.bucket >= since)
+        .group_by(Hashtag.name)
+        .having(func.sum(HashtagBucket.count) > 0)
+        .order_by(desc("count"), Hashtag.name)
+        .limit(limit)
+    )
+
+
+def trends_response(window: str, rows: list) -> dict:
+    """
+    Функция для сборки ответа трендов
+    :param window: str
+    :param rows: list
+    :return: dict
+    """
+    return {
+        "result": True,
+        "window": window,
+        "trends": [{"hashtag": name, "count": int(count)} for name, count in rows],
+    }
+
+
+def check_window(window: Optional[str]) -> str:
+    """
+    Функция для проверки окна трендов
+    :param window: Optional[str]
+    :return: str
+    """
+    if window not in TRENDS_WINDOWS:
+        raise ValueError(
+            f"Unknown trends window: {window!r}, "
+            f"expected one of {', '.join(TRENDS_WINDOWS)}"
+        )
+    return window
+
+
+def show_trends(window: Optional[str] = "1h") -> dict:
+    """
+    Функция для отображения топа TRENDS_SIZE хештегов за окно. Топ
+    рассчитывается не чаще раза в TRENDS_REFRESH секунд на процесс,
+    остальные запросы получают готовый список из TRENDS_SIZE записей
+    :param window: Optional[str]
+    :return: dict
+    """
+    window = check_window(window)
+    response = trends_cache.get(window)
+    if response is None:
+        response = trends_response(window, session.execute(trends_query(window)).all())
+        trends_cache.set(window, response)
+    return response
@@ -1,10 +1,22 @@
+from contextlib import contextmanager
+
 import pytest
 from flask.testing import FlaskClient
 
+from src import purge
 from src.app import app
+from src.db_metrics import track_queries
 from src.models import Tweet, User, session
 
 
+@pytest.fixture(autouse=True, scope="session")
+def purge_worker():
+    # Удалённые твиты очищаются в фикстурах пользователей, а не фоновым
+    # потоком, чтобы тесты видели предсказуемое состояние БД
+    purge.configure(None)
+    yield
+
+
 @pytest.fixture
 def test_app():
     yield app
@@ -21,6 +33,7 @@ def mock_user():
     session.add(mock_user)
     session.commit()
     yield mock_user
+    purge.purge_deleted(pause_ms=0)
     session.delete(mock_user)
     session.commit()
 
@@ -36,6 +49,7 @@ def mock_user_2():
     session.add(mock_user_2)
     session.commit()
     yield mock_user_2
+    purge.purge_deleted(pause_ms=0)
     session.delete(mock_user_2)
     session.commit()
 
@@ -55,3 +69,17 @@ def client(test_app):
     client: FlaskClient = app.test_client()
     client.post()
     yield client
+
+
+@pytest.fixture
+def query_budget():
+    @contextmanager
+    def budget(max_queries: int):
+        with track_queries(keep_statements=True) as stats:
+            yield stats
+        statements = "\n".join(statement for _, statement in stats.statements)
+        assert (
+            stats.count <= max_queries
+        ), f"{stats.count} queries, budget {max_queries}:\n{statements}"
+
+    yield budget
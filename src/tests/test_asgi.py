@@ -0,0 +1,112 @@
+import pytest
+from flask.testing import FlaskClient
+from sqlalchemy.orm import Session
+from starlette.testclient import TestClient
+
+from src import timeline
+from src.asgi import app as asgi_app
+from src.models import Follow, Like, Media, Tweet, User
+from src.purge import purge_deleted
+
+
+@pytest.fixture(scope="module")
+def asgi_client():
+    with TestClient(asgi_app) as client:
+        yield client
+
+
+@pytest.mark.parametrize("feed_mode", ["read", "hybrid"])
+def test_asgi_matches_wsgi(
+    client: FlaskClient,
+    asgi_client: TestClient,
+    mock_user: User,
+    mock_user_2: User,
+    _session: Session,
+    mock_headers: dict,
+    monkeypatch: pytest.MonkeyPatch,
+    feed_mode: str,
+) -> None:
+    """
+    Тест для проверки, что ASGI версия API отдаёт те же ответы, что и WSGI,
+    в том числе лента hybrid, где автор подписки - знаменитость
+    :param client: FlaskClient
+    :param asgi_client: TestClient
+    :param mock_user: User
+    :param mock_user_2: User
+    :param _session: Session
+    :param mock_headers: dict
+    :param monkeypatch: MonkeyPatch
+    :param feed_mode: str
+    :return: None
+    """
+    monkeypatch.setattr(timeline, "FEED_MODE", feed_mode)
+    monkeypatch.setattr(timeline, "CELEBRITY_THRESHOLD", 1)
+    media = Media(link="media/asgi.png")
+    _session.add(media)
+    _session.commit()
+    resp = asgi_client.post(
+        "/api/tweets/",
+        json={"tweet_data": "Hello ASGI", "tweet_media_ids": [media.id]},
+        headers={"api-key": mock_user_2.api_key},
+    )
+    tweet_id = resp.json()["tweet_id"]
+    assert resp.json() == {"result": True, "tweet_id": tweet_id}
+    asgi_client.post(f"/api/users/{mock_user_2.id}/follow", headers=mock_headers)
+    asgi_client.post(f"/api/tweets/{tweet_id}/likes", headers=mock_headers)
+
+    for path in (
+        f"/api/medias/{media.id}?variant=medium",
+        "/api/tweets/search?q=hello%20asgi",
+        "/api/trends?window=24h",
+        "/api/tweets/",
+        "/api/tweets/?limit=1",
+        f"/api/tweets/{tweet_id}/likes",
+        "/api/users/me",
+        f"/api/users/{mock_user_2.id}",
+        f"/api/users/{mock_user.id}/following",
+        f"/api/users/{mock_user_2.id}/followers",
+    ):
+        expected = client.get(path, headers=mock_headers).get_json()
+        assert asgi_client.get(path, headers=mock_headers).json() == expected
+    assert expected["users"] == [{"id": mock_user.id, "name": mock_user.name}]
+
+    asgi_client.delete(f"/api/tweets/{tweet_id}/likes", headers=mock_headers)
+    asgi_client.delete(f"/api/users/{mock_user_2.id}/follow", headers=mock_headers)
+    assert not _session.query(Like).filter(Like.tweet_id == tweet_id).count()
+    assert (
+        not _session.query(Follow)
+        .filter(Follow.following_user_id == mock_user.id)
+        .count()
+    )
+
+    resp = asgi_client.delete(
+        f"/api/tweets/{tweet_id}", headers={"api-key": mock_user_2.api_key}
+    )
+    assert resp.json() == {"result": True}
+    assert _session.query(Tweet.deleted_at).filter(Tweet.id == tweet_id).scalar()
+    assert purge_deleted(pause_ms=0) == 1
+    _session.delete(media)
+    _session.commit()
+
+
+def test_asgi_upload_errors(asgi_client: TestClient, mock_headers: dict) -> None:
+    """
+    Тест для проверки отказов загрузки: тело без Content-Length не
+    разбирается, запрос без поля file получает ответ с ошибкой, а не 500
+    :param asgi_client: TestClient
+    :param mock_headers: dict
+    :return: None
+    """
+    resp = asgi_client.post(
+        "/api/medias/", content=iter([b"chunk"] * 3), headers=mock_headers
+    )
+    assert resp.status_code == 411
+    assert resp.json()["error_type"] == "LengthRequired"
+
+    resp = asgi_client.post("/api/medias/", data={"name": "x"}, headers=mock_headers)
+    assert resp.status_code == 200
+    assert resp.json() == {
+        "result": False,
+        "error_type": "ValueError",
+        "error_message": "Request has no file field",
+    }
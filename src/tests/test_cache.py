@@ -0,0 +1,99 @@
+import pytest
+from sqlalchemy.orm import Session
+
+from src import cache
+from src.cache import TieredCache, TTLCache
+
+
+def test_cache_lru_eviction() -> None:
+    """
+    Тест для проверки вытеснения самой давно использованной записи
+    :return: None
+    """
+    lru = TTLCache(maxsize=2, ttl=60)
+    lru.set("a", 1)
+    lru.set("b", 2)
+    assert lru.get("a") == 1
+    lru.set("c", 3)
+    assert lru.get("b") is None
+    assert lru.get("a") == 1
+    assert lru.get("c") == 3
+    assert (lru.hits, lru.misses, lru.evictions) == (3, 1, 1)
+
+
+def test_cache_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Тест для проверки истечения времени жизни записей и ручного сброса
+    :param monkeypatch: MonkeyPatch
+    :return: None
+    """
+    now = [100.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    ttl_cache = TTLCache(maxsize=10, ttl=5)
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2)
+    now[0] += 4
+    assert ttl_cache.get("a") == 1
+    now[0] += 1
+    assert ttl_cache.get("a") is None
+    assert len(ttl_cache) == 1
+    ttl_cache.invalidate("b")
+    assert ttl_cache.get("b") is None
+
+
+class DictTier:
+    """
+    Заглушка общего уровня кеша для тестов
+    """
+
+    def __init__(self) -> None:
+        self.data = dict()
+
+    def get_many(self, keys):
+        return {key: self.data[key] for key in keys if key in self.data}
+
+    def set_many(self, mapping) -> None:
+        self.data.update(mapping)
+
+    def invalidate(self, key) -> None:
+        self.data.pop(key, None)
+
+
+def test_tiered_cache() -> None:
+    """
+    Тест для проверки двухуровневого кеша: общий уровень прогревает
+    локальный, сброс удаляет запись на обоих уровнях
+    :return: None
+    """
+    remote = DictTier()
+    first = TieredCache(TTLCache(maxsize=10, ttl=60), remote)
+    second = TieredCache(TTLCache(maxsize=10, ttl=60), remote)
+    first.set_many({1: "hello", 2: "world"})
+    assert second.get_many([1, 2, 3]) == {1: "hello", 2: "world"}
+    assert second.local.get(1) == "hello"
+    second.invalidate(1)
+    assert first.remote.get_many([1]) == {}
+    assert second.get_many([1]) == {}
+
+
+def test_invalidate_on_commit() -> None:
+    """
+    Тест для проверки сброса кеша только после фиксации транзакции и отмены
+    сброса при откате
+    :return: None
+    """
+    local = TTLCache(maxsize=10, ttl=60)
+    db_session = Session()
+    local.set("key", "old")
+    db_session.begin()
+    cache.invalidate_on_commit(db_session, local, "key")
+    assert local.get("key") == "old"
+    db_session.commit()
+    assert local.get("key") is None
+
+    local.set("key", "old")
+    db_session.begin()
+    cache.invalidate_on_commit(db_session, local, "key")
+    db_session.rollback()
+    db_session.commit()
+    assert local.get("key") == "old"
@@ -0,0 +1,189 @@
+import logging
+
+import pytest
+from flask.testing import FlaskClient
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from src import app as app_module
+from src.app import metrics
+from src.depends import api_key_cache
+from src.models import Like, Tweet, User
+
+
+@pytest.mark.parametrize(
+    "path, budget",
+    [
+        # пользователь, твиты с авторами, вложения, последние лайкнувшие
+        ("/api/tweets/", 4),
+        ("/api/users/me", 2),
+        ("/api/users/{user_2}", 2),
+        ("/api/users/{user_2}/followers", 2),
+    ],
+)
+def test_read_query_budget(
+    client: FlaskClient,
+    mock_user: User,
+    mock_user_2: User,
+    mock_tweet: Tweet,
+    mock_headers: dict,
+    query_budget,
+    path: str,
+    budget: int,
+) -> None:
+    """
+    Тест для проверки числа SQL запросов endpoint'ов чтения, включая
+    поиск пользователя по api-key
+    :param client: FlaskClient
+    :param mock_user: User
+    :param mock_user_2: User
+    :param mock_tweet: Tweet
+    :param mock_headers: dict
+    :param query_budget: Callable
+    :param path: str
+    :param budget: int
+    :return: None
+    """
+    api_key_cache.clear()
+    with query_budget(budget):
+        resp = client.get(path.format(user_2=mock_user_2.id), headers=mock_headers)
+    assert resp.status_code == 200
+
+
+def test_write_query_budget(
+    client: FlaskClient,
+    mock_user: User,
+    mock_user_2: User,
+    mock_tweet: Tweet,
+    mock_headers: dict,
+    _session: Session,
+    query_budget,
+) -> None:
+    """
+    Тест для проверки числа SQL запросов endpoint'ов записи
+    :param client: FlaskClient
+    :param mock_user: User
+    :param mock_user_2: User
+    :param mock_tweet: Tweet
+    :param mock_headers: dict
+    :param _session: Session
+    :param query_budget: Callable
+    :return: None
+    """
+    for method, path, budget in (
+        ("POST", f"/api/tweets/{mock_tweet.id}/likes", 2),
+        ("DELETE", f"/api/tweets/{mock_tweet.id}/likes", 2),
+        ("POST", f"/api/users/{mock_user_2.id}/follow", 2),
+        ("DELETE", f"/api/users/{mock_user_2.id}/follow", 2),
+    ):
+        api_key_cache.clear()
+        with query_budget(budget):
+            resp = client.open(path, method=method, headers=mock_headers)
+        assert resp.status_code == 200
+
+    api_key_cache.clear()
+    with query_budget(2):
+        resp = client.post(
+            "/api/tweets/", json={"tweet_data": "budget"}, headers=mock_headers
+        )
+    _session.query(Tweet).filter(Tweet.id == resp.json["tweet_id"]).delete()
+    _session.commit()
+
+
+def test_relationship_loading(
+    client: FlaskClient,
+    mock_user: User,
+    mock_user_2: User,
+    mock_tweet: Tweet,
+    _session: Session,
+    query_budget,
+) -> None:
+    """
+    Тест для проверки стратегий загрузки связей: обращение к незагруженной
+    связи бросает исключение вместо скрытого запроса, явные joinedload и
+    selectinload загружают связи страницы фиксированным числом запросов
+    :param client: FlaskClient
+    :param mock_user: User
+    :param mock_user_2: User
+    :param mock_tweet: Tweet
+    :param _session: Session
+    :param query_budget: Callable
+    :return: None
+    """
+    client.post(
+        f"/api/tweets/{mock_tweet.id}/likes", headers={"api-key": mock_user_2.api_key}
+    )
+    _session.expunge_all()
+    tweet = _session.query(Tweet).get(mock_tweet.id)
+    with pytest.raises(InvalidRequestError):
+        tweet.likers
+
+    with query_budget(2):
+        tweet = (
+            _session.query(Tweet)
+            .options(joinedload(Tweet.author), selectinload(Tweet.likers))
+            .populate_existing()
+            .filter(Tweet.id == mock_tweet.id)
+            .one()
+        )
+        assert tweet.author.name == mock_user.name
+        assert [user.id for user in tweet.likers] == [mock_user_2.id]
+    _session.expunge_all()
+
+
+def test_request_query_metrics(
+    client: FlaskClient, mock_user: User, mock_headers: dict
+) -> None:
+    """
+    Тест для проверки выгрузки статистики SQL запросов в Prometheus
+    с меткой endpoint'а
+    :param client: FlaskClient
+    :param mock_user: User
+    :param mock_headers: dict
+    :return: None
+    """
+    labels = {"endpoint": "my_profile"}
+    before = metrics.registry.get_sample_value("db_request_queries_count", labels)
+    queries_before = metrics.registry.get_sample_value("db_request_queries_sum", labels)
+    api_key_cache.clear()
+    client.get("/api/users/me", headers=mock_headers)
+    after = metrics.registry.get_sample_value("db_request_queries_count", labels)
+    queries_after = metrics.registry.get_sample_value("db_request_queries_sum", labels)
+    assert after == (before or 0) + 1
+    assert queries_after - (queries_before or 0) >= 2
+    assert metrics.registry.get_sample_value("db_request_seconds_count", labels)
+    assert metrics.registry.get_sample_value(
+        "db_request_slowest_query_seconds_count", labels
+    )
+
+
+def test_slow_request_log(
+    client: FlaskClient,
+    mock_user: User,
+    mock_tweet: Tweet,
+    mock_headers: dict,
+    _session: Session,
+    monkeypatch,
+    caplog,
+) -> None:
+    """
+    Тест для проверки журнала медленных запросов со списком SQL запросов
+    :param client: FlaskClient
+    :param mock_user: User
+    :param mock_tweet: Tweet
+    :param mock_headers: dict
+    :param _session: Session
+    :param monkeypatch: MonkeyPatch
+    :param caplog: LogCaptureFixture
+    :return: None
+    """
+    monkeypatch.setattr(app_module, "SLOW_REQUEST_MS", 0.001)
+    with caplog.at_level(logging.WARNING, logger="twitter log"):
+        client.post(f"/api/tweets/{mock_tweet.id}/likes", headers=mock_headers)
+    _session.query(Like).filter(Like.tweet_id == mock_tweet.id).delete()
+    _session.commit()
+    messages = [r.message for r in caplog.records if r.levelno == logging.WARNING]
+    assert any(
+        "Slow request put_like" in message and "INSERT INTO" in message
+        for message in messages
+    )
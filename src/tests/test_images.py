@@ -0,0 +1,158 @@
+import datetime
+import io
+import os
+import time
+
+from flask.testing import FlaskClient
+from PIL import Image
+from sqlalchemy.orm import Session
+
+from src import images
+from src.images import feed_link, render_variants, variant_path
+from src.models import Media, Tweet, User
+from src.uploads import MEDIA_PROCESSING_ATTEMPTS, media_url, process_pending_media
+
+
+def exif_jpeg(size: tuple = (1600, 800)) -> bytes:
+    """
+    Функция для создания JPEG с EXIF: поворот на 90 градусов и модель камеры
+    :param size: tuple
+    :return: bytes
+    """
+    exif = Image.Exif()
+    exif[0x0112] = 6
+    exif[0x0110] = "Camera"
+    buffer = io.BytesIO()
+    Image.new("RGB", size, "red").save(buffer, "JPEG", exif=exif)
+    return buffer.getvalue()
+
+
+def test_render_variants(tmp_path) -> None:
+    """
+    Тест для проверки вариантов изображения: ориентация применена,
+    EXIF удалён, маленькие изображения не увеличиваются
+    :param tmp_path: Path
+    :return: None
+    """
+    source = tmp_path / "photo.jpg"
+    source.write_bytes(exif_jpeg())
+
+    variants = render_variants(str(source))
+    assert set(variants) == {name for name, _ in images.MEDIA_VARIANTS}
+    assert variants["medium"]["webp"] == variant_path(str(source), "medium", "webp")
+    sizes = dict()
+    for name, formats in variants.items():
+        assert set(formats) == {"webp", "jpeg"}
+        for path in formats.values():
+            with Image.open(path) as image:
+                assert not image.getexif()
+                assert "exif" not in image.info
+                sizes[name] = image.size
+    assert sizes == {"thumb": (160, 320), "medium": (640, 1280), "large": (800, 1600)}
+    assert not [path for path in tmp_path.iterdir() if path.name.startswith(".")]
+
+    assert feed_link("a.png", None) == "a.png"
+    assert feed_link("a.png", {}) == "a.png"
+    assert feed_link("a.png", variants) == variants["medium"]["webp"]
+
+
+def test_upload_variants_in_feed(
+    client: FlaskClient,
+    mock_user: User,
+    _session: Session,
+    mock_headers: dict,
+) -> None:
+    """
+    Тест для проверки фоновой обработки загрузки: ответ не ждёт создания
+    вариантов, повторная загрузка не ставит обработку повторно, лента
+    ссылается на вариант MEDIA_FEED_VARIANT
+    :param client: FlaskClient
+    :param mock_user: User
+    :param _session: Session
+    :param mock_headers: dict
+    :return: None
+    """
+    content = exif_jpeg()
+    media_ids = [
+        client.post(
+            "/api/medias/",
+            data={"file": (io.BytesIO(content), "photo.jpg")},
+            content_type="multipart/form-data",
+            headers=mock_headers,
+        ).json["media_id"]
+        for _ in range(2)
+    ]
+    assert media_ids[0] == media_ids[1]
+    media = _session.query(Media).get(media_ids[0])
+
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        _session.refresh(media)
+        if media.variants:
+            break
+        time.sleep(0.1)
+    assert media.variants["medium"]["webp"] == variant_path(
+        media.link, "medium", "webp"
+    )
+
+    tweet = client.post(
+        "/api/tweets/",
+        json={"tweet_data": "photo", "tweet_media_ids": media_ids[:1]},
+        headers=mock_headers,
+    ).json["tweet_id"]
+    feed = client.get("/api/tweets/", headers=mock_headers).json["tweets"]
+    assert feed[0]["attachments"] == [
+        media_url(
+            media.variants["medium"]["webp"], client.application.config["UPLOAD_FOLDER"]
+        )
+    ]
+
+    _session.query(Tweet).filter(Tweet.id == tweet).delete()
+    _session.commit()
+    _session.delete(media)
+    _session.commit()
+    paths = [media.link] + [
+        path for formats in media.variants.values() for path in formats.values()
+    ]
+    for path in paths:
+        os.remove(path)
+    os.removedirs(os.path.dirname(media.link))
+
+
+def test_process_pending_media_retries(tmp_path, _session: Session) -> None:
+    """
+    Тест для проверки повторной обработки: брошенный захват перехватывается,
+    неудачная обработка повторяется не больше MEDIA_PROCESSING_ATTEMPTS раз
+    :param tmp_path: Path
+    :param _session: Session
+    :return: None
+    """
+    photo = tmp_path / "photo.jpg"
+    photo.write_bytes(exif_jpeg((400, 200)))
+    broken = tmp_path / "broken.jpg"
+    broken.write_bytes(b"not an image")
+    stale = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(hours=1)
+    abandoned = Media(
+        link=str(photo), processing_started_at=stale, processing_attempts=1
+    )
+    failing = Media(link=str(broken))
+    _session.add_all([abandoned, failing])
+    _session.commit()
+
+    # Каждый запуск повторяет неудачную обработку один раз
+    runs = [process_pending_media(timeout=60) for _ in range(MEDIA_PROCESSING_ATTEMPTS)]
+    assert runs == [2] + [1] * (MEDIA_PROCESSING_ATTEMPTS - 1)
+    _session.refresh(abandoned)
+    _session.refresh(failing)
+    assert abandoned.variants["medium"]["webp"] == variant_path(
+        str(photo), "medium", "webp"
+    )
+    assert abandoned.processing_started_at is None
+    assert failing.variants is None
+    assert failing.processing_started_at is None
+    assert failing.processing_attempts == MEDIA_PROCESSING_ATTEMPTS
+    assert process_pending_media(timeout=60) == 0
+
+    _session.delete(abandoned)
+    _session.delete(failing)
+    _session.commit()
@@ -0,0 +1,163 @@
+import os
+import time
+from pathlib import Path
+from typing import List
+
+import pytest
+from flask.testing import FlaskClient
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.engine import Engine
+
+from src import replicas
+from src.models import DATABASE_URL, User, session
+from src.replicas import ReplicaRouter
+
+
+def stand_in(path: Path, user: User, name: str) -> Engine:
+    """
+    Функция для SQLite базы, заменяющей реплику: таблица пользователей
+    с копией user под другим именем, по которому видно, откуда прочитан
+    профиль
+    :param path: Path
+    :param user: User
+    :param name: str
+    :return: Engine
+    """
+    engine = create_engine(f"sqlite:///{path}")
+    User.__table__.create(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(User).values(id=user.id, name=name, api_key=user.api_key)
+        )
+    return engine
+
+
+@pytest.fixture
+def replica_names(tmp_path: Path, mock_user: User):
+    engines = [
+        stand_in(tmp_path / f"{name}.db", mock_user, name)
+        for name in ("replica1", "replica2")
+    ]
+    # Иначе профиль вернётся из identity map сессии теста, а не с реплики
+    session.remove()
+    yield engines
+    replicas.configure(None)
+    for engine in engines:
+        engine.dispose()
+
+
+def profile_name(client: FlaskClient, headers: dict) -> str:
+    """
+    Функция для имени из ответа /api/users/me
+    :param client: FlaskClient
+    :param headers: dict
+    :return: str
+    """
+    return client.get("/api/users/me", headers=headers).json["user"]["name"]
+
+
+def test_replica_round_robin(
+    client: FlaskClient,
+    replica_names: List[Engine],
+    mock_user: User,
+    mock_headers: dict,
+) -> None:
+    """
+    Тест для проверки чтения профиля с реплик по кругу и из основной БД
+    в течение окна после записи пользователя
+    :param client: FlaskClient
+    :param replica_names: List[Engine]
+    :param mock_user: User
+    :param mock_headers: dict
+    :return: None
+    """
+    router = ReplicaRouter(replica_names, sticky_seconds=0.2)
+    replicas.configure(router)
+    names = [profile_name(client, mock_headers) for _ in range(4)]
+    assert names == ["replica1", "replica2", "replica1", "replica2"]
+    response = client.get(f"/api/users/{mock_user.id}", headers=mock_headers)
+    assert response.json["user"]["name"] == "replica1"
+
+    tweet = client.post(
+        "/api/tweets/", json={"tweet_data": "sticky"}, headers=mock_headers
+    )
+    assert profile_name(client, mock_headers) == "mockname"
+    assert router.reads == {replicas.PRIMARY: 1, replicas.REPLICA: 5}
+    time.sleep(0.3)
+    assert profile_name(client, mock_headers) == "replica2"
+
+    client.delete(f"/api/tweets/{tweet.json['tweet_id']}", headers=mock_headers)
+    assert profile_name(client, mock_headers) == "mockname"
+
+
+def test_replica_health_check(
+    client: FlaskClient,
+    replica_names: List[Engine],
+    mock_headers: dict,
+    tmp_path: Path,
+) -> None:
+    """
+    Тест для проверки пропуска недоступной реплики и чтения из основной БД,
+    когда недоступны все реплики
+    :param client: FlaskClient
+    :param replica_names: List[Engine]
+    :param mock_headers: dict
+    :param tmp_path: Path
+    :return: None
+    """
+    broken = create_engine(f"sqlite:///{tmp_path / 'missing' / 'replica.db'}")
+    router = ReplicaRouter([broken, replica_names[1]], check_interval=60)
+    replicas.configure(router)
+    names = [profile_name(client, mock_headers) for _ in range(3)]
+    assert names == ["replica2"] * 3
+    assert router._healthy == [False, True]
+
+    replicas.configure(ReplicaRouter([broken]))
+    assert profile_name(client, mock_headers) == "mockname"
+
+    os.mkdir(tmp_path / "missing")
+    assert router.available(0) is False
+    assert router.check(0) is True
+    assert router._healthy == [True, True]
+    broken.dispose()
+
+
+def test_feed_reads_from_replica(
+    client: FlaskClient,
+    mock_user: User,
+    mock_headers: dict,
+) -> None:
+    """
+    Тест для проверки чтения ленты с реплики (второе подключение к той же
+    БД) и чтения своего нового твита из основной БД сразу после записи
+    :param client: FlaskClient
+    :param mock_user: User
+    :param mock_headers: dict
+    :return: None
+    """
+    replica = create_engine(DATABASE_URL)
+    statements = list()
+    event.listen(
+        replica,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    replicas.configure(ReplicaRouter([replica], sticky_seconds=60))
+    try:
+        response = client.get("/api/tweets/", headers=mock_headers)
+        assert response.json["result"] is True
+        assert any("FROM tweet" in statement for statement in statements)
+
+        statements.clear()
+        tweet = client.post(
+            "/api/tweets/", json={"tweet_data": "fresh"}, headers=mock_headers
+        )
+        response = client.get("/api/tweets/", headers=mock_headers)
+        assert [item["id"] for item in response.json["tweets"]] == [
+            tweet.json["tweet_id"]
+        ]
+        assert statements == []
+        client.delete(f"/api/tweets/{tweet.json['tweet_id']}", headers=mock_headers)
+    finally:
+        replicas.configure(None)
+        replica.dispose()
@@ -1,13 +1,21 @@
+import datetime
+import hashlib
 import io
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
-import requests as requests
 from flask.testing import FlaskClient
+from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.orm import Session
 
-from src.models import Follow, Like, Media, Tweet, User
-from src.utils import followed, liked
+from src import timeline, utils
+from src.counters import reconcile_counters
+from src.depends import api_key_cache
+from src.models import Follow, Like, Media, TimelineEntry, Tweet, TweetMedia, User
+from src.purge import purge_deleted
+from src.uploads import collect_media_garbage, media_path
+from src.utils import followed, liked, user_cache
 
 
 def test_add_tweet(
@@ -37,54 +45,208 @@ def test_add_media(
     client: FlaskClient, mock_user: User, _session: Session, mock_headers: dict
 ) -> None:
     """
-    Тест для проверки добавления медиа файлов
+    Тест для проверки добавления медиа файлов: файл хранится по хешу
+    содержимого, повторная загрузка возвращает ту же запись
     :param client: FlaskClient
     :param mock_user: User
     :param _session: Session
     :param mock_headers: dict
     :return: None
     """
-    URL = "https://upload.wikimedia.org/wikipedia/commons/f/fa/Apple_logo_black.svg"
-    response = requests.get(URL)
-    filename = "test.svg"
-    data = {"file": (io.BytesIO(response.content), filename)}
+    content = os.urandom(200 * 1024)
+    digest = hashlib.sha256(content).hexdigest()
+    media_ids = list()
+    for filename in ("test.png", "copy.png"):
+        resp = client.post(
+            "/api/medias/",
+            data={"file": (io.BytesIO(content), filename)},
+            content_type="multipart/form-data",
+            headers=mock_headers,
+        )
+        assert resp.status_code == 200
+        assert resp.json["result"] is True
+        media_ids.append(resp.json["media_id"])
+    assert media_ids[0] == media_ids[1]
+
+    media = _session.query(Media).filter(Media.hash == digest).one()
+    assert media.id == media_ids[0]
+    assert media.link == media_path("media/", digest, "png")
+    with open(media.link, "rb") as file:
+        assert file.read() == content
+    assert not [name for name in os.listdir("media") if name.startswith(".upload-")]
+
+    _session.delete(media)
+    _session.commit()
+    os.remove(media.link)
+    os.removedirs(os.path.dirname(media.link))
+
+
+def test_collect_media_garbage(mock_user: User, _session: Session, tmp_path) -> None:
+    """
+    Тест для проверки удаления медиа, не прикреплённых к твитам: свежие
+    и прикреплённые медиа остаются, брошенные временные файлы удаляются
+    :param mock_user: User
+    :param _session: Session
+    :param tmp_path: Path
+    :return: None
+    """
+    old = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=2)
+    media = dict()
+    for name in ("attached", "orphan", "fresh"):
+        path = tmp_path / f"{name}.png"
+        path.write_bytes(name.encode())
+        media[name] = Media(link=str(path), hash=name)
+    media["attached"].uploaded_at = media["orphan"].uploaded_at = old
+    _session.add_all(media.values())
+    _session.flush()
+    tweet = Tweet(text="media", user_id=mock_user.id)
+    _session.add(tweet)
+    _session.flush()
+    _session.add(
+        TweetMedia(tweet_id=tweet.id, position=1, media_id=media["attached"].id)
+    )
+    _session.commit()
+    stale = tmp_path / ".upload-stale"
+    stale.write_bytes(b"partial")
+    os.utime(stale, (0, 0))
+
+    assert collect_media_garbage(str(tmp_path), grace_hours=1) == 1
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "attached.png",
+        "fresh.png",
+    ]
+    assert _session.query(Media).filter(Media.hash == "orphan").count() == 0
+
+    _session.delete(tweet)
+    _session.commit()
+    _session.query(Media).filter(Media.hash.in_(["attached", "fresh"])).delete()
+    _session.commit()
+
+
+def test_add_media_limits(
+    client: FlaskClient,
+    mock_user: User,
+    _session: Session,
+    mock_headers: dict,
+    monkeypatch,
+) -> None:
+    """
+    Тест для проверки ограничений загрузки: файл больше MAX_CONTENT_LENGTH
+    и файл с недопустимым расширением отклоняются, временные файлы удаляются
+    :param client: FlaskClient
+    :param mock_user: User
+    :param _session: Session
+    :param mock_headers: dict
+    :param monkeypatch: MonkeyPatch
+    :return: None
+    """
+    monkeypatch.setitem(client.application.config, "MAX_CONTENT_LENGTH", 1024)
     resp = client.post(
         "/api/medias/",
-        data=data,
+        data={"file": (io.BytesIO(b"x" * 4096), "big.png")},
         content_type="multipart/form-data",
         headers=mock_headers,
     )
-    json_resp = resp.get_json()
-    media = _session.query(Media).filter(Media.link == f"media/{filename}").one()
-    assert resp.status_code == 200
-    assert json_resp == {"result": True, "media_id": media.id}
-    assert _session.query(Media).get(json_resp.get("media_id"))
-    assert os.path.exists(f"media/{filename}")
+    assert resp.status_code == 413
+    assert resp.json["result"] is False
+    assert resp.json["error_type"] == "RequestEntityTooLarge"
 
-    _session.delete(media)
-    _session.commit()
-    os.remove(f"media/{filename}")
+    monkeypatch.undo()
+    resp = client.post(
+        "/api/medias/",
+        data={"file": (io.BytesIO(b"<svg/>"), "image.svg")},
+        content_type="multipart/form-data",
+        headers=mock_headers,
+    )
+    assert resp.json["result"] is False
+    assert resp.json["error_type"] == "ValueError"
+    assert not os.path.exists("media/image.svg")
+    assert not [name for name in os.listdir("media") if name.startswith(".upload-")]
+    assert _session.query(Media).count() == 0
+
+
+def test_add_media_commit_failure(
+    _session: Session, monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    """
+    Тест для проверки, что при ошибке фиксации записи Media файл не
+    переносится в хранилище и временный файл удаляется
+    :param _session: Session
+    :param monkeypatch: MonkeyPatch
+    :param tmp_path: Path
+    :return: None
+    """
+
+    def fail() -> None:
+        raise OperationalError("COMMIT", {}, Exception("connection lost"))
+
+    monkeypatch.setattr(utils.session, "commit", fail)
+    with pytest.raises(OperationalError):
+        utils.store_media(io.BytesIO(b"image"), "lost.png", str(tmp_path))
+    monkeypatch.undo()
+    _session.rollback()
+    assert list(tmp_path.iterdir()) == []
+    assert _session.query(Media).count() == 0
 
 
 def test_delete_tweet(
-    client: FlaskClient, mock_user: User, _session: Session, mock_headers: dict
+    client: FlaskClient,
+    mock_user: User,
+    mock_user_2: User,
+    _session: Session,
+    mock_headers: dict,
+    query_budget,
+    monkeypatch,
+    tmp_path,
 ) -> None:
     """
-    Тест для проверки удаления твитов
+    Тест для проверки удаления твитов: твит помечается удалённым одним
+    запросом и пропадает из ленты, лайки, записи лент и медиа удаляет
+    очистка purge_deleted
     :param client: FlaskClient
     :param mock_user: User
+    :param mock_user_2: User
     :param _session: Session
     :param mock_headers: dict
+    :param query_budget: Callable
+    :param monkeypatch: MonkeyPatch
+    :param tmp_path: Path
     :return: None
     """
-    new_tweet = Tweet(text="Hello World", user_id=mock_user.id)
-    _session.add(new_tweet)
+    monkeypatch.setattr(timeline, "FEED_MODE", "write")
+    path = tmp_path / "deleted.png"
+    path.write_bytes(b"deleted")
+    media = Media(link=str(path), hash="deleted")
+    media.uploaded_at = datetime.datetime.now(
+        datetime.timezone.utc
+    ) - datetime.timedelta(days=2)
+    _session.add(media)
     _session.commit()
+    tweet_id = client.post(
+        "/api/tweets/",
+        json={"tweet_data": "Hello World", "tweet_media_ids": [media.id]},
+        headers=mock_headers,
+    ).json["tweet_id"]
+    client.post(
+        f"/api/tweets/{tweet_id}/likes", headers={"api-key": mock_user_2.api_key}
+    )
 
-    resp = client.delete(f"/api/tweets/{new_tweet.id}", headers=mock_headers)
+    with query_budget(3):
+        resp = client.delete(f"/api/tweets/{tweet_id}", headers=mock_headers)
     assert resp.status_code == 200
     assert resp.json == {"result": True}
-    assert _session.query(Tweet).get(new_tweet.id) is None
+    assert client.get("/api/tweets/", headers=mock_headers).json["tweets"] == []
+    assert _session.query(Tweet.deleted_at).filter(Tweet.id == tweet_id).scalar()
+    assert _session.query(Like).filter(Like.tweet_id == tweet_id).count() == 1
+    resp = client.delete(f"/api/tweets/{tweet_id}", headers=mock_headers)
+    assert resp.json == {"result": True}
+
+    assert purge_deleted(batch_size=1, pause_ms=0) == 1
+    assert _session.query(Tweet).filter(Tweet.id == tweet_id).count() == 0
+    assert _session.query(Like).filter(Like.tweet_id == tweet_id).count() == 0
+    assert _session.query(TimelineEntry).filter_by(tweet_id=tweet_id).count() == 0
+    assert _session.query(Media).filter(Media.hash == "deleted").count() == 0
+    assert not path.exists()
 
 
 def test_add_like(
@@ -216,7 +378,7 @@ def test_get_tweets(
     resp = client.get("/api/tweets/", headers=mock_headers)
     json_resp = resp.get_json()
     assert resp.status_code == 200
-    assert json_resp == {"result": True, "tweets": []}
+    assert json_resp == {"result": True, "tweets": [], "next_cursor": None}
 
     new_tweet = Tweet(text="Hello World", user_id=mock_user_2.id)
     _session.add(new_tweet)
@@ -224,9 +386,8 @@ def test_get_tweets(
     new_follow = Follow(following_user_id=mock_user.id, followed_user_id=mock_user_2.id)
     _session.add(new_follow)
     _session.commit()
-    new_like = Like(user_id=mock_user.id, tweet_id=new_tweet.id)
-    _session.add(new_like)
-    _session.commit()
+    client.post(f"/api/tweets/{new_tweet.id}/likes", headers=mock_headers)
+    new_like = liked(mock_user.id, new_tweet.id)
     expected_json = {
         "result": True,
         "tweets": [
@@ -235,9 +396,11 @@ def test_get_tweets(
                 "content": new_tweet.text,
                 "attachments": [],
                 "author": {"id": mock_user_2.id, "name": mock_user_2.name},
+                "like_count": 1,
                 "likes": [{"user_id": mock_user.id, "name": mock_user.name}],
             }
         ],
+        "next_cursor": None,
     }
     resp = client.get("/api/tweets/", headers=mock_headers)
     json_resp = resp.get_json()
@@ -274,23 +437,24 @@ def test_get_profile_me(
         "user": {
             "id": mock_user.id,
             "name": mock_user.name,
-            "followers": [],
-            "following": [],
+            "follower_count": 0,
+            "following_count": 0,
         },
     }
 
-    follow1 = Follow(following_user_id=mock_user.id, followed_user_id=mock_user_2.id)
-    follow2 = Follow(following_user_id=mock_user_2.id, followed_user_id=mock_user.id)
-    _session.add(follow1)
-    _session.add(follow2)
-    _session.commit()
+    client.post(f"/api/users/{mock_user_2.id}/follow", headers=mock_headers)
+    client.post(
+        f"/api/users/{mock_user.id}/follow", headers={"api-key": mock_user_2.api_key}
+    )
+    follow1 = followed(mock_user.id, mock_user_2.id)
+    follow2 = followed(mock_user_2.id, mock_user.id)
     expected_json = {
         "result": True,
         "user": {
             "id": mock_user.id,
             "name": mock_user.name,
-            "followers": [{"id": mock_user_2.id, "name": mock_user_2.name}],
-            "following": [{"id": mock_user_2.id, "name": mock_user_2.name}],
+            "follower_count": 1,
+            "following_count": 1,
         },
     }
     resp = client.get("/api/users/me", headers=mock_headers)
@@ -327,23 +491,24 @@ def test_get_profile(
         "user": {
             "id": mock_user_2.id,
             "name": mock_user_2.name,
-            "followers": [],
-            "following": [],
+            "follower_count": 0,
+            "following_count": 0,
         },
     }
 
-    follow1 = Follow(following_user_id=mock_user.id, followed_user_id=mock_user_2.id)
-    follow2 = Follow(following_user_id=mock_user_2.id, followed_user_id=mock_user.id)
-    _session.add(follow1)
-    _session.add(follow2)
-    _session.commit()
+    client.post(f"/api/users/{mock_user_2.id}/follow", headers=mock_headers)
+    client.post(
+        f"/api/users/{mock_user.id}/follow", headers={"api-key": mock_user_2.api_key}
+    )
+    follow1 = followed(mock_user.id, mock_user_2.id)
+    follow2 = followed(mock_user_2.id, mock_user.id)
     expected_json = {
         "result": True,
         "user": {
             "id": mock_user_2.id,
             "name": mock_user_2.name,
-            "followers": [{"id": mock_user.id, "name": mock_user.name}],
-            "following": [{"id": mock_user.id, "name": mock_user.name}],
+            "follower_count": 1,
+            "following_count": 1,
         },
     }
     resp = client.get(f"/api/users/{mock_user_2.id}", headers=mock_headers)
@@ -354,3 +519,735 @@ def test_get_profile(
     _session.delete(follow1)
     _session.delete(follow2)
     _session.commit()
+
+
+def test_get_tweets_order(
+    client: FlaskClient,
+    mock_user: User,
+    mock_user_2: User,
+    _session: Session,
+    mock_headers: dict,
+) -> None:
+    """
+    Тест для проверки состава и порядка твитов в ленте: свои твиты и твиты
+    подписок, от новых к старым, без твитов остальных пользователей
+    :param client: FlaskClient
+    :param mock_user: User
+    :param mock_user_2: User
+    :param _session: Session
+    :param mock_headers: dict
+    :return: None
+    """
+    now = datetime.datetime.utcnow()
+    stranger = User(name="stranger", api_key="testtest3")
+    _session.add(stranger)
+    _session.commit()
+    old_tweet = Tweet(
+        text="old", user_id=mock_user.id, datetime=now - datetime.timedelta(hours=2)
+    )
+    new_tweet = Tweet(text="new", user_id=mock_user_2.id, datetime=now)
+    middle_tweet = Tweet(
+        text="middle",
+        user_id=mock_user_2.id,
+        datetime=now - datetime.timedelta(hours=1),
+    )
+    hidden_tweet = Tweet(text="hidden", user_id=stranger.id, datetime=now)
+    new_follow = Follow(following_user_id=mock_user.id, followed_user_id=mock_user_2.id)
+    _session.add_all([old_tweet, new_tweet, middle_tweet, hidden_tweet, new_follow])
+    _session.commit()
+
+    resp = client.get("/api/tweets/", headers=mock_headers)
+    assert resp.status_code == 200
+    assert [tweet["id"] for tweet in resp.json["tweets"]] == [
+        new_tweet.id,
+        middle_tweet.id,
+        old_tweet.id,
+    ]
+
+    for obj in (old_tweet, new_tweet, middle_tweet, hidden_tweet, new_follow):
+        _session.delete(obj)
+    _session.commit()
+    _session.delete(stranger)
+    _session.commit()
+
+
+def test_get_media(
+    client: FlaskClient,
+    mock_user: User,
+    _session: Session,
+    mock_headers: dict,
+    tmp_path,
+    monkeypatch,
+) -> None:
+    """
+    Тест для проверки отдачи медиа после проверки api-key: без nginx файл
+    отдаёт приложение, с MEDIA_ACCEL_REDIRECT ответ без тела передаёт
+    файл nginx заголовком X-Accel-Redirect
+    :param client: FlaskClient
+    :param mock_user: User
+    :param _session: Session
+    :param mock_headers: dict
+    :param tmp_path: Path
+    :param monkeypatch: MonkeyPatch
+    :return: None
+    """
+    monkeypatch.setitem(client.application.config, "UPLOAD_FOLDER", str(tmp_path))
+    original = tmp_path / "ab" / "cd" / "abcd.png"
+    original.parent.mkdir(parents=True)
+    original.write_bytes(b"original")
+    medium = tmp_path / "ab" / "cd" / "abcd.medium.webp"
+    medium.write_bytes(b"medium")
+    media = Media(link=str(original), variants={"medium": {"webp": str(medium)}})
+    _session.add(media)
+    _session.commit()
+
+    resp = client.get(f"/api/medias/{media.id}", headers=mock_headers)
+    assert resp.status_code == 200
+    assert resp.data == b"original"
+    assert resp.mimetype == "image/png"
+    assert "immutable" in resp.headers["Cache-Control"]
+    assert "X-Accel-Redirect" not in resp.headers
+
+    monkeypatch.setitem(
+        client.application.config, "MEDIA_ACCEL_REDIRECT", "/protected-media/"
+    )
+    resp = client.get(
+        f"/api/medias/{media.id}?variant=medium&format=webp", headers=mock_headers
+    )
+    assert resp.status_code == 200
+    assert resp.data == b""
+    assert resp.mimetype == "image/webp"
+    assert resp.headers["X-Accel-Redirect"] == "/protected-media/ab/cd/abcd.medium.webp"
+
+    for path in (
+        f"/api/medias/{media.id}?variant=large",
+        f"/api/medias/{media.id + 1000}",
+    ):
+        resp = client.get(path, headers=mock_headers)
+        assert resp.status_code == 404
+        assert resp.json["result"] is False
+
+    _session.delete(media)
+    _session.commit()
+
+
+def test_get_tweets_attachments(
+    client: FlaskClient,
+    mock_user: User,
+    _session: Session,
+    mock_headers: dict,
+    query_budget,
+) -> None:
+    """
+    Тест для проверки вложений в ленте: порядок ссылок сохраняется,
+    несуществующие медиа не прикрепляются, вложения страницы загружаются
+    одним запросом
+    :param client: FlaskClient
+    :param mock_user: User
+    :param _session: Session
+    :param mock_headers: dict
+    :param query_budget: Callable
+    :return: None
+    """
+    media_1 = Media(link="media/first.png")
+    media_2 = Media(link="media/second.png")
+    _session.add_all([media_1, media_2])
+    _session.commit()
+    missing_id = media_2.id + 1000
+    tweet_ids = [
+        client.post(
+            "/api/tweets/",
+            json={"tweet_data": "Hello World", "tweet_media_ids": media_ids},
+            headers=mock_headers,
+        ).json["tweet_id"]
+        for media_ids in ([media_1.id], [media_2.id, missing_id, media_1.id])
+    ]
+
+    with query_budget(4) as stats:
+        resp = client.get("/api/tweets/", headers=mock_headers)
+    assert resp.status_code == 200
+    assert [tweet["attachments"] for tweet in resp.json["tweets"]] == [
+        ["/media/second.png", "/media/first.png"],
+        ["/media/first.png"],
+    ]
+    assert len([sql for _, sql in stats.statements if "tweet_media" in sql]) == 1
+
+    for tweet_id in tweet_ids:
+        client.delete(f"/api/tweets/{tweet_id}", headers=mock_headers)
+    purge_deleted(pause_ms=0)
+    _session.delete(media_1)
+    _session.delete(media_2)
+    _session.commit()
+
+
+def test_get_tweets_pagination(
+    client: FlaskClient,
+    mock_user: User,
+    _session: Session,
+    mock_headers: dict,
+) -> None:
+    """
+    Тест для проверки постраничного вывода ленты по курсору
+    :param client: FlaskClient
+    :param mock_user: User
+    :param _session: Session
+    :param mock_headers: dict
+    :return: None
+    """
+    now = datetime.datetime.utcnow()
+    tweets = [
+        Tweet(
+            text=f"tweet {i}",
+            user_id=mock_user.id,
+            datetime=now - datetime.timedelta(minutes=i // 2),
+        )
+        for i in range(5)
+    ]
+    _session.add_all(tweets)
+    _session.commit()
+    expected_ids = [
+        tweet.id
+        for tweet in sorted(tweets, key=lambda x: (x.datetime, x.id), reverse=True)
+    ]
+
+    pages = list()
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        resp = client.get("/api/tweets/", headers=mock_headers, query_string=params)
+        assert resp.status_code == 200
+        assert resp.json["result"] is True
+        pages.append([tweet["id"] for tweet in resp.json["tweets"]])
+        cursor = resp.json["next_cursor"]
+        if cursor is None:
+            break
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert [tweet_id for page in pages for tweet_id in page] == expected_ids
+
+    # Не base64, не UTF-8 и не пара "время|id"
+    for cursor in ("a", "__8", "broken"):
+        resp = client.get(
+            "/api/tweets/", headers=mock_headers, query_string={"cursor": cursor}
+        )
+        assert resp.json["result"] is False
+        assert resp.json["error_type"] == "ValueError"
+
+    for tweet in tweets:
+        _session.delete(tweet)
+    _session.commit()
+
+
+def test_get_tweets_fanout_on_write(
+    client: FlaskClient,
+    mock_user: User,
+    mock_user_2: User,
+    _session: Session,
+    mock_headers: dict,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Тест для проверки ленты в режиме fan-out-on-write: новые твиты, подписки,
+    отписки и удаление твитов поддерживают предрассчитанные ленты
+    :param client: FlaskClient
+    :param mock_user: User
+    :param mock_user_2: User
+    :param _session: Session
+    :param mock_headers: dict
+    :param monkeypatch: MonkeyPatch
+    :return: None
+    """
+    monkeypatch.setattr(timeline, "FEED_MODE", "write")
+    headers_2 = {"api-key": mock_user_2.api_key}
+
+    def feed_ids() -> list:
+        resp = client.get("/api/tweets/", headers=mock_headers)
+        assert resp.json["result"] is True
+        return [tweet["id"] for tweet in resp.json["tweets"]]
+
+    old_id = client.post(
+        "/api/tweets/", json={"tweet_data": "before follow"}, headers=headers_2
+    ).json["tweet_id"]
+    own_id = client.post(
+        "/api/tweets/", json={"tweet_data": "mine"}, headers=mock_headers
+    ).json["tweet_id"]
+    assert feed_ids() == [own_id]
+
+    client.post(f"/api/users/{mock_user_2.id}/follow", headers=mock_headers)
+    assert feed_ids() == [own_id, old_id]
+
+    new_id = client.post(
+        "/api/tweets/", json={"tweet_data": "after follow"}, headers=headers_2
+    ).json["tweet_id"]
+    assert feed_ids() == [new_id, own_id, old_id]
+
+    client.delete(f"/api/tweets/{new_id}", headers=headers_2)
+    assert feed_ids() == [own_id, old_id]
+
+    client.delete(f"/api/users/{mock_user_2.id}/follow", headers=mock_headers)
+    assert feed_ids() == [own_id]
+
+    client.post(f"/api/users/{mock_user_2.id}/follow", headers=mock_headers)
+    _session.query(TimelineEntry).delete()
+    _session.commit()
+    timeline.rebuild_timelines()
+    assert feed_ids() == [own_id, old_id]
+
+    _session.delete(followed(mock_user.id, mock_user_2.id))
+    for tweet_id in (old_id, own_id):
+        _session.delete(_session.query(Tweet).get(tweet_id))
+    _session.commit()
+
+
+def test_get_tweets_hybrid_fanout(
+    client: FlaskClient,
+    mock_user: User,
+    mock_user_2: User,
+    _session: Session,
+    mock_headers: dict,
+    monkeypatch: pytest.MonkeyPatch,
+    query_budget,
+) -> None:
+    """
+    Тест для проверки ленты в режиме hybrid: твиты авторов с числом
+    подписчиков не меньше порога не раскладываются по лентам, а подмешиваются
+    при чтении одним запросом, сколько бы знаменитостей ни было в подписках
+    :param client: FlaskClient
+    :param mock_user: User
+    :param mock_user_2: User
+    :param _session: Session
+    :param mock_headers: dict
+    :param monkeypatch: MonkeyPatch
+    :param query_budget: Callable
+    :return: None
+    """
+    monkeypatch.setattr(timeline, "FEED_MODE", "hybrid")
+    monkeypatch.setattr(timeline, "CELEBRITY_THRESHOLD", 1)
+    client.post(f"/api/users/{mock_user_2.id}/follow", headers=mock_headers)
+
+    own_id = client.post(
+        "/api/tweets/", json={"tweet_data": "mine"}, headers=mock_headers
+    ).json["tweet_id"]
+    celebrity_id = client.post(
+        "/api/tweets/",
+        json={"tweet_data": "celebrity"},
+        headers={"api-key": mock_user_2.api_key},
+    ).json["tweet_id"]
+    assert _session.query(User.is_celebrity).filter(User.id == mock_user_2.id).scalar()
+    assert (
+        _session.query(TimelineEntry)
+        .filter(
+            TimelineEntry.user_id == mock_user.id,
+            TimelineEntry.tweet_id == celebrity_id,
+        )
+        .count()
+        == 0
+    )
+
+    resp = client.get("/api/tweets/", headers=mock_headers, query_string={"limit": 1})
+    assert [tweet["id"] for tweet in resp.json["tweets"]] == [celebrity_id]
+    resp = client.get(
+        "/api/tweets/",
+        headers=mock_headers,
+        query_string={"limit": 1, "cursor": resp.json["next_cursor"]},
+    )
+    assert [tweet["id"] for tweet in resp.json["tweets"]] == [own_id]
+    assert resp.json["next_cursor"] is None
+
+    # Вторая знаменитость в подписках не добавляет запросов к ленте
+    celebrity_2 = User(name="celebrity", api_key="celebrity")
+    _session.add(celebrity_2)
+    _session.commit()
+    client.post(f"/api/users/{celebrity_2.id}/follow", headers=mock_headers)
+    celebrity_2_id = client.post(
+        "/api/tweets/",
+        json={"tweet_data": "celebrity 2"},
+        headers={"api-key": celebrity_2.api_key},
+    ).json["tweet_id"]
+    with query_budget(5):
+        resp = client.get("/api/tweets/", headers=mock_headers)
+    assert [tweet["id"] for tweet in resp.json["tweets"]] == [
+        celebrity_2_id,
+        celebrity_id,
+        own_id,
+    ]
+    _session.delete(followed(mock_user.id, celebrity_2.id))
+    _session.delete(_session.query(Tweet).get(celebrity_2_id))
+    _session.delete(celebrity_2)
+    _session.commit()
+
+    # Автор ниже порога перестаёт быть знаменитостью, его твиты
+    # раскладываются по лентам подписчиков и не пропадают из ленты
+    monkeypatch.setattr(timeline, "CELEBRITY_THRESHOLD", 2)
+    assert timeline.update_celebrities([mock_user_2.id]) == [mock_user_2.id]
+    _session.commit()
+    assert (
+        _session.query(TimelineEntry)
+        .filter(
+            TimelineEntry.user_id == mock_user.id,
+            TimelineEntry.tweet_id == celebrity_id,
+        )
+        .count()
+        == 1
+    )
+    resp = client.get("/api/tweets/", headers=mock_headers)
+    assert [tweet["id"] for tweet in resp.json["tweets"]] == [celebrity_id, own_id]
+
+    _session.delete(followed(mock_user.id, mock_user_2.id))
+    for tweet_id in (own_id, celebrity_id):
+        _session.delete(_session.query(Tweet).get(tweet_id))
+    _session.commit()
+
+
+def test_api_key_cache(
+    client: FlaskClient,
+    mock_user: User,
+    _session: Session,
+    mock_headers: dict,
+) -> None:
+    """
+    Тест для проверки кеширования пользователя по api_key и сброса кеша
+    при смене ключа
+    :param client: FlaskClient
+    :param mock_user: User
+    :param _session: Session
+    :param mock_headers: dict
+    :return: None
+    """
+    api_key_cache.clear()
+    assert client.get("/api/users/me", headers=mock_headers).status_code == 200
+    assert api_key_cache.get(mock_user.api_key) == mock_user.id
+    hits = api_key_cache.hits
+    assert client.get("/api/users/me", headers=mock_headers).status_code == 200
+    assert api_key_cache.hits == hits + 1
+
+    mock_user.api_key = "rotated"
+    _session.add(mock_user)
+    _session.flush()
+    # Параллельный запрос до COMMIT читает старую строку и кеширует ключ
+    api_key_cache.set("testtest", mock_user.id)
+    _session.commit()
+    assert api_key_cache.get("testtest") is None
+    resp = client.get("/api/users/me", headers={"api-key": "rotated"})
+    assert resp.json["user"]["id"] == mock_user.id
+    assert b"api_key_cache_hits_total" in client.get("/metrics").data
+
+
+def test_user_name_cache(
+    client: FlaskClient,
+    mock_user: User,
+    mock_user_2: User,
+    _session: Session,
+    mock_headers: dict,
+) -> None:
+    """
+    Тест для проверки сброса кеша имён лайкнувших при переименовании
+    пользователя, имя автора загружается вместе с твитом
+    :param client: FlaskClient
+    :param mock_user: User
+    :param mock_user_2: User
+    :param _session: Session
+    :param mock_headers: dict
+    :return: None
+    """
+    new_tweet = Tweet(text="Hello World", user_id=mock_user.id)
+    _session.add(new_tweet)
+    _session.commit()
+    client.post(
+        f"/api/tweets/{new_tweet.id}/likes", headers={"api-key": mock_user_2.api_key}
+    )
+    resp = client.get("/api/tweets/", headers=mock_headers)
+    assert resp.json["tweets"][0]["likes"][0]["name"] == "mockname2"
+    assert user_cache.get_many([mock_user_2.id]) == {mock_user_2.id: "mockname2"}
+
+    mock_user.name = "renamed"
+    mock_user_2.name = "renamed2"
+    _session.add_all([mock_user, mock_user_2])
+    _session.flush()
+    # Параллельный запрос до COMMIT читает старое имя и кеширует его
+    user_cache.set_many({mock_user_2.id: "mockname2"})
+    _session.commit()
+    resp = client.get("/api/tweets/", headers=mock_headers)
+    assert resp.json["tweets"][0]["author"]["name"] == "renamed"
+    assert resp.json["tweets"][0]["likes"][0]["name"] == "renamed2"
+
+    _session.delete(new_tweet)
+    _session.commit()
+
+
+def test_failed_request_does_not_poison_session(
+    client: FlaskClient,
+    mock_user: User,
+    mock_headers: dict,
+) -> None:
+    """
+    Тест для проверки, что ошибка БД в одном запросе не ломает сессию
+    следующих запросов, а метрики пула соединений экспортируются
+    :param client: FlaskClient
+    :param mock_user: User
+    :param mock_headers: dict
+    :return: None
+    """
+    user_id = mock_user.id
+    resp = client.post(
+        "/api/tweets/",
+        json={"tweet_data": "broken", "tweet_media_ids": ["not a number"]},
+        headers=mock_headers,
+    )
+    assert resp.status_code == 500
+
+    resp = client.get("/api/users/me", headers=mock_headers)
+    assert resp.status_code == 200
+    assert resp.json["user"]["id"] == user_id
+
+    metrics = client.get("/metrics").data
+    assert b"db_pool_wait_seconds_count" in metrics
+    assert b"db_pool_checkout_seconds_count" in metrics
+    assert b"db_pool_checked_out" in metrics
+
+
+def test_like_and_follow_counters(
+    client: FlaskClient,
+    mock_user: User,
+    mock_user_2: User,
+    mock_tweet: Tweet,
+    _session: Session,
+    mock_headers: dict,
+) -> None:
+    """
+    Тест для проверки счётчиков лайков и подписок: повторный лайк
+    и повторная подписка не увеличивают счётчики
+    :param client: FlaskClient
+    :param mock_user: User
+    :param mock_user_2: User
+    :param mock_tweet: Tweet
+    :param _session: Session
+    :param mock_headers: dict
+    :return: None
+    """
+    for _ in range(2):
+        client.post(f"/api/tweets/{mock_tweet.id}/likes", headers=mock_headers)
+        client.post(f"/api/users/{mock_user_2.id}/follow", headers=mock_headers)
+    assert (
+        _session.query(Tweet.like_count).filter(Tweet.id == mock_tweet.id).scalar() == 1
+    )
+    assert _session.query(User.following_count, User.follower_count).filter(
+        User.id == mock_user.id
+    ).one() == (1, 0)
+    assert _session.query(User.following_count, User.follower_count).filter(
+        User.id == mock_user_2.id
+    ).one() == (0, 1)
+
+    client.delete(f"/api/tweets/{mock_tweet.id}/likes", headers=mock_headers)
+    client.delete(f"/api/users/{mock_user_2.id}/follow", headers=mock_headers)
+    assert (
+        _session.query(Tweet.like_count).filter(Tweet.id == mock_tweet.id).scalar() == 0
+    )
+    assert (
+        _session.query(User.follower_count).filter(User.id == mock_user_2.id).scalar()
+        == 0
+    )
+
+
+def test_likes_sample_and_pagination(
+    client: FlaskClient,
+    mock_user: User,
+    mock_tweet: Tweet,
+    _session: Session,
+    mock_headers: dict,
+    monkeypatch,
+) -> None:
+    """
+    Тест для проверки ленты с ограниченной выборкой последних лайкнувших
+    и постраничного списка всех лайкнувших
+    :param client: FlaskClient
+    :param mock_user: User
+    :param mock_tweet: Tweet
+    :param _session: Session
+    :param mock_headers: dict
+    :param monkeypatch: MonkeyPatch
+    :return: None
+    """
+    monkeypatch.setattr(utils, "LIKES_SAMPLE_SIZE", 2)
+    likers = [User(name=f"liker{i}", api_key=f"liker{i}") for i in range(5)]
+    _session.add_all(likers)
+    _session.commit()
+    for liker in likers:
+        client.post(
+            f"/api/tweets/{mock_tweet.id}/likes", headers={"api-key": liker.api_key}
+        )
+    newest_first = [
+        {"user_id": liker.id, "name": liker.name} for liker in reversed(likers)
+    ]
+
+    tweet = client.get("/api/tweets/", headers=mock_headers).json["tweets"][0]
+    assert tweet["like_count"] == 5
+    assert tweet["likes"] == newest_first[:2]
+
+    pages, cursor = list(), None
+    while True:
+        resp = client.get(
+            f"/api/tweets/{mock_tweet.id}/likes",
+            query_string={"limit": 2, **({"cursor": cursor} if cursor else {})},
+            headers=mock_headers,
+        ).json
+        pages.append(resp["likes"])
+        cursor = resp["next_cursor"]
+        if cursor is None:
+            break
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert [like for page in pages for like in page] == newest_first
+
+    resp = client.get(
+        f"/api/tweets/{mock_tweet.id}/likes?cursor=broken", headers=mock_headers
+    )
+    assert resp.json["result"] is False
+
+    _session.query(Like).filter(Like.tweet_id == mock_tweet.id).delete()
+    for liker in likers:
+        _session.delete(liker)
+    _session.commit()
+
+
+def test_reconcile_counters(
+    mock_user: User, mock_user_2: User, mock_tweet: Tweet, _session: Session
+) -> None:
+    """
+    Тест для проверки сверки разошедшихся счётчиков
+    :param mock_user: User
+    :param mock_user_2: User
+    :param mock_tweet: Tweet
+    :param _session: Session
+    :return: None
+    """
+    _session.add(Like(user_id=mock_user_2.id, tweet_id=mock_tweet.id))
+    _session.add(
+        Follow(following_user_id=mock_user.id, followed_user_id=mock_user_2.id)
+    )
+    _session.query(User).filter(User.id == mock_user.id).update({"follower_count": 7})
+    _session.commit()
+
+    assert reconcile_counters() == 4
+    assert (
+        _session.query(Tweet.like_count).filter(Tweet.id == mock_tweet.id).scalar() == 1
+    )
+    assert _session.query(User.following_count, User.follower_count).filter(
+        User.id == mock_user.id
+    ).one() == (1, 0)
+    assert (
+        _session.query(User.follower_count).filter(User.id == mock_user_2.id).scalar()
+        == 1
+    )
+    assert reconcile_counters() == 0
+
+    _session.query(Like).filter(Like.tweet_id == mock_tweet.id).delete()
+    _session.query(Follow).filter(Follow.following_user_id == mock_user.id).delete()
+    _session.commit()
+
+
+def test_concurrent_likes_and_follows(
+    test_app,
+    mock_user: User,
+    mock_user_2: User,
+    mock_tweet: Tweet,
+    _session: Session,
+    mock_headers: dict,
+) -> None:
+    """
+    Тест для проверки одновременных лайков и подписок: остаётся одна строка,
+    счётчики увеличиваются один раз, прямая вставка дубликата отклоняется БД
+    :param test_app: Flask
+    :param mock_user: User
+    :param mock_user_2: User
+    :param mock_tweet: Tweet
+    :param _session: Session
+    :param mock_headers: dict
+    :return: None
+    """
+    paths = [
+        f"/api/tweets/{mock_tweet.id}/likes",
+        f"/api/users/{mock_user_2.id}/follow",
+    ] * 8
+    with ThreadPoolExecutor(8) as executor:
+        statuses = list(
+            executor.map(
+                lambda path: test_app.test_client()
+                .post(path, headers=mock_headers)
+                .status_code,
+                paths,
+            )
+        )
+    assert statuses == [200] * len(paths)
+    assert _session.query(Like).filter(Like.tweet_id == mock_tweet.id).count() == 1
+    assert (
+        _session.query(Follow).filter(Follow.following_user_id == mock_user.id).count()
+        == 1
+    )
+    assert (
+        _session.query(Tweet.like_count).filter(Tweet.id == mock_tweet.id).scalar() == 1
+    )
+    assert _session.query(User.following_count, User.follower_count).filter(
+        User.id == mock_user.id
+    ).one() == (1, 0)
+
+    _session.add(Like(user_id=mock_user.id, tweet_id=mock_tweet.id))
+    with pytest.raises(IntegrityError):
+        _session.commit()
+    _session.rollback()
+
+    _session.query(Like).filter(Like.tweet_id == mock_tweet.id).delete()
+    _session.query(Follow).filter(Follow.following_user_id == mock_user.id).delete()
+    _session.commit()
+
+
+def test_followers_and_following_pagination(
+    client: FlaskClient,
+    mock_user: User,
+    _session: Session,
+    mock_headers: dict,
+) -> None:
+    """
+    Тест для проверки постраничных списков подписчиков и подписок,
+    от новых подписок к старым
+    :param client: FlaskClient
+    :param mock_user: User
+    :param _session: Session
+    :param mock_headers: dict
+    :return: None
+    """
+    others = [User(name=f"fan{i}", api_key=f"fan{i}") for i in range(5)]
+    _session.add_all(others)
+    _session.commit()
+    for other in others:
+        client.post(
+            f"/api/users/{mock_user.id}/follow", headers={"api-key": other.api_key}
+        )
+        client.post(f"/api/users/{other.id}/follow", headers=mock_headers)
+    newest_first = [{"id": other.id, "name": other.name} for other in reversed(others)]
+
+    for kind in ("followers", "following"):
+        users, cursor = list(), None
+        while True:
+            resp = client.get(
+                f"/api/users/{mock_user.id}/{kind}",
+                query_string={"limit": 2, **({"cursor": cursor} if cursor else {})},
+                headers=mock_headers,
+            ).json
+            assert len(resp["users"]) <= 2
+            users.extend(resp["users"])
+            cursor = resp["next_cursor"]
+            if cursor is None:
+                break
+        assert users == newest_first
+
+    resp = client.get("/api/users/me", headers=mock_headers)
+    assert resp.json["user"]["follower_count"] == 5
+    assert resp.json["user"]["following_count"] == 5
+
+    _session.query(Follow).filter(
+        Follow.following_user_id.in_([mock_user.id] + [o.id for o in others])
+    ).delete(synchronize_session=False)
+    for other in others:
+        _session.delete(other)
+    _session.commit()
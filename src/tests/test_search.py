@@ -0,0 +1,119 @@
+from flask.testing import FlaskClient
+from sqlalchemy.orm import Session
+
+from src import search
+from src.models import Tweet, User
+from src.search import InvertedIndex
+
+TEXTS = (
+    "cats and dogs",
+    "cats cats cats",
+    "dogs only",
+    "a long story about cats, dogs, birds and many other animals",
+)
+
+
+def search_all(client: FlaskClient, headers: dict, query: str) -> list:
+    """
+    Функция для обхода всех страниц поиска по одному твиту на страницу
+    :param client: FlaskClient
+    :param headers: dict
+    :param query: str
+    :return: list
+    """
+    contents, cursor = list(), None
+    while True:
+        params = {"q": query, "limit": 1}
+        if cursor:
+            params["cursor"] = cursor
+        resp = client.get("/api/tweets/search", query_string=params, headers=headers)
+        assert resp.json["result"] is True
+        contents.extend(tweet["content"] for tweet in resp.json["tweets"])
+        cursor = resp.json["next_cursor"]
+        if cursor is None:
+            return contents
+
+
+def test_search_tweets(
+    client: FlaskClient,
+    mock_user: User,
+    _session: Session,
+    mock_headers: dict,
+) -> None:
+    """
+    Тест для проверки поиска: найдены только твиты со всеми словами
+    запроса, более релевантные выше, страницы не теряют и не повторяют
+    результаты, пустой запрос - ошибка
+    :param client: FlaskClient
+    :param mock_user: User
+    :param _session: Session
+    :param mock_headers: dict
+    :return: None
+    """
+    tweet_ids = [
+        client.post(
+            "/api/tweets/", json={"tweet_data": text}, headers=mock_headers
+        ).json["tweet_id"]
+        for text in TEXTS
+    ]
+
+    cats = search_all(client, mock_headers, "cats")
+    assert cats[0] == "cats cats cats"
+    assert sorted(cats) == sorted(text for text in TEXTS if "cats" in text)
+    assert sorted(search_all(client, mock_headers, "CATS dogs")) == sorted(
+        [TEXTS[0], TEXTS[3]]
+    )
+    assert search_all(client, mock_headers, "dogs -cats") == ["dogs only"]
+    assert search_all(client, mock_headers, "nothing") == []
+
+    resp = client.get("/api/tweets/search?q=%20", headers=mock_headers)
+    assert resp.json["result"] is False
+    assert resp.json["error_type"] == "ValueError"
+
+    for tweet_id in tweet_ids:
+        client.delete(f"/api/tweets/{tweet_id}", headers=mock_headers)
+
+
+def test_search_memory_backend(
+    client: FlaskClient,
+    mock_user: User,
+    _session: Session,
+    mock_headers: dict,
+    monkeypatch,
+) -> None:
+    """
+    Тест для проверки инвертированного индекса в памяти: новые и удалённые
+    твиты попадают в индекс, результаты совпадают с поиском PostgreSQL
+    :param client: FlaskClient
+    :param mock_user: User
+    :param _session: Session
+    :param mock_headers: dict
+    :param monkeypatch: MonkeyPatch
+    :return: None
+    """
+    monkeypatch.setattr(search, "SEARCH_BACKEND", "memory")
+    monkeypatch.setattr(search, "memory_index", InvertedIndex())
+    first = Tweet(text=TEXTS[0], user_id=mock_user.id)
+    _session.add(first)
+    _session.commit()
+    tweet_ids = [first.id] + [
+        client.post(
+            "/api/tweets/", json={"tweet_data": text}, headers=mock_headers
+        ).json["tweet_id"]
+        for text in TEXTS[1:]
+    ]
+
+    cats = search_all(client, mock_headers, "cats")
+    assert cats[0] == "cats cats cats"
+    assert sorted(cats) == sorted(text for text in TEXTS if "cats" in text)
+    assert search_all(client, mock_headers, "dogs -cats") == ["dogs only"]
+
+    client.delete(f"/api/tweets/{tweet_ids[1]}", headers=mock_headers)
+    assert "cats cats cats" not in search_all(client, mock_headers, "cats")
+
+    monkeypatch.setattr(search, "SEARCH_BACKEND", "postgres")
+    assert sorted(search_all(client, mock_headers, "cats")) == sorted(
+        [TEXTS[0], TEXTS[3]]
+    )
+    for tweet_id in tweet_ids[:1] + tweet_ids[2:]:
+        client.delete(f"/api/tweets/{tweet_id}", headers=mock_headers)
@@ -0,0 +1,136 @@
+import datetime
+import time
+
+from flask.testing import FlaskClient
+from sqlalchemy.orm import Session
+
+from src import tags
+from src.models import Hashtag, HashtagBucket, Mention, TweetHashtag, User
+from src.purge import PurgeWorker
+from src.tags import parse_hashtags, parse_mentions, rebuild_tags
+
+
+def test_parse_tags() -> None:
+    """
+    Тест для проверки разбора хештегов и упоминаний
+    :return: None
+    """
+    assert parse_hashtags("#Flask is #fun, #flask and#not ##x #юникод") == [
+        "flask",
+        "fun",
+        "юникод",
+    ]
+    assert parse_hashtags(None) == []
+    assert parse_mentions("@alice hi @bob, mail me@host.com @alice") == [
+        "alice",
+        "bob",
+    ]
+
+
+def get_trends(client: FlaskClient, headers: dict, window: str) -> list:
+    """
+    Функция для запроса трендов без кеша процесса
+    :param client: FlaskClient
+    :param headers: dict
+    :param window: str
+    :return: list
+    """
+    tags.trends_cache.clear()
+    resp = client.get(f"/api/trends?window={window}", headers=headers)
+    assert resp.json["result"] is True
+    assert resp.json["window"] == window
+    return resp.json["trends"]
+
+
+def test_tags_and_trends(
+    client: FlaskClient,
+    mock_user: User,
+    mock_user_2: User,
+    _session: Session,
+    mock_headers: dict,
+) -> None:
+    """
+    Тест для проверки сохранения хештегов и упоминаний при создании твита
+    и трендов: счётчики увеличиваются при создании, уменьшаются при
+    удалении и совпадают после пересчёта командой rebuild-tags
+    :param client: FlaskClient
+    :param mock_user: User
+    :param mock_user_2: User
+    :param _session: Session
+    :param mock_headers: dict
+    :return: None
+    """
+    # Имя twin у двух пользователей: упоминание неоднозначно и пропускается
+    twins = [User(name="twin", api_key=f"twin{number}") for number in range(2)]
+    _session.add_all(twins)
+    _session.commit()
+    texts = (
+        f"#Flask is #fun @{mock_user_2.name} @twin",
+        "#flask again",
+        "#trendtest",
+    )
+    tweet_ids = [
+        client.post(
+            "/api/tweets/", json={"tweet_data": text}, headers=mock_headers
+        ).json["tweet_id"]
+        for text in texts
+    ]
+    expected = [
+        {"hashtag": "flask", "count": 2},
+        {"hashtag": "fun", "count": 1},
+        {"hashtag": "trendtest", "count": 1},
+    ]
+
+    rows = _session.query(TweetHashtag).filter(TweetHashtag.tweet_id.in_(tweet_ids))
+    assert rows.count() == 4
+    mentions = _session.query(Mention.tweet_id, Mention.user_id).all()
+    assert mentions == [(tweet_ids[0], mock_user_2.id)]
+    assert get_trends(client, mock_headers, "1h") == expected
+    assert get_trends(client, mock_headers, "24h") == expected
+
+    assert rebuild_tags(batch_size=2) >= 3
+    assert get_trends(client, mock_headers, "1h") == expected
+
+    client.delete(f"/api/tweets/{tweet_ids[1]}", headers=mock_headers)
+    assert get_trends(client, mock_headers, "1h")[0] == {"hashtag": "flask", "count": 1}
+
+    resp = client.get("/api/trends?window=7d", headers=mock_headers)
+    assert resp.json["result"] is False
+    assert resp.json["error_type"] == "ValueError"
+
+    for tweet_id in tweet_ids[:1] + tweet_ids[2:]:
+        client.delete(f"/api/tweets/{tweet_id}", headers=mock_headers)
+    assert get_trends(client, mock_headers, "1h") == []
+    _session.query(Hashtag).filter(
+        Hashtag.name.in_(["flask", "fun", "trendtest"])
+    ).delete(synchronize_session=False)
+    for twin in twins:
+        _session.delete(twin)
+    _session.commit()
+
+
+def test_purge_worker_prunes_trends(_session: Session) -> None:
+    """
+    Тест для проверки удаления устаревших счётчиков трендов фоновым
+    потоком очистки
+    :param _session: Session
+    :return: None
+    """
+    hashtag = Hashtag(name="stale")
+    _session.add(hashtag)
+    _session.flush()
+    old = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=2)
+    _session.add(HashtagBucket(bucket=old, hashtag_id=hashtag.id, count=1))
+    _session.commit()
+
+    worker = PurgeWorker(interval=0.01, prune_interval=60)
+    worker.start()
+    deadline = time.monotonic() + 5
+    while not worker.pruned and time.monotonic() < deadline:
+        time.sleep(0.01)
+    worker.close()
+    assert worker.pruned == 1
+    assert _session.query(HashtagBucket).count() == 0
+
+    _session.delete(hashtag)
+    _session.commit()
@@ -0,0 +1,158 @@
+import time
+
+import pytest
+from flask.testing import FlaskClient
+from sqlalchemy.orm import Session
+
+from src import write_behind
+from src.models import Follow, Like, Tweet, User
+from src.write_behind import WriteBehind
+
+
+@pytest.fixture
+def buffer():
+    buffer = WriteBehind({write_behind.LIKE, write_behind.FOLLOW}, flush_ms=60000)
+    write_behind.configure(buffer)
+    yield buffer
+    write_behind.configure(None)
+
+
+def cleanup(_session: Session, *users: User) -> None:
+    """
+    Функция для удаления лайков и подписок тестовых пользователей
+    :param _session: Session
+    :param users: User
+    :return: None
+    """
+    ids = [user.id for user in users]
+    _session.query(Like).filter(Like.user_id.in_(ids)).delete()
+    _session.query(Follow).filter(Follow.following_user_id.in_(ids)).delete()
+    _session.commit()
+
+
+def test_write_behind_collapses_events(
+    client: FlaskClient,
+    buffer: WriteBehind,
+    mock_user: User,
+    mock_user_2: User,
+    mock_tweet: Tweet,
+    mock_headers: dict,
+    _session: Session,
+) -> None:
+    """
+    Тест для проверки свёртки событий: лайк и отказ от лайка взаимно
+    уничтожаются, подписка записывается пачкой вместе со счётчиками
+    :param client: FlaskClient
+    :param buffer: WriteBehind
+    :param mock_user: User
+    :param mock_user_2: User
+    :param mock_tweet: Tweet
+    :param mock_headers: dict
+    :param _session: Session
+    :return: None
+    """
+    client.post(f"/api/tweets/{mock_tweet.id}/likes", headers=mock_headers)
+    client.delete(f"/api/tweets/{mock_tweet.id}/likes", headers=mock_headers)
+    client.post(f"/api/users/{mock_user_2.id}/follow", headers=mock_headers)
+    assert (len(buffer), buffer.submitted, buffer.collapsed) == (2, 3, 1)
+    assert _session.query(Follow).count() == 0
+
+    assert buffer.flush() == 2
+    assert _session.query(Like).filter(Like.tweet_id == mock_tweet.id).count() == 0
+    assert (
+        _session.query(Tweet.like_count).filter(Tweet.id == mock_tweet.id).scalar() == 0
+    )
+    assert _session.query(User.following_count, User.follower_count).filter(
+        User.id == mock_user.id
+    ).one() == (1, 0)
+    assert _session.query(User.following_count, User.follower_count).filter(
+        User.id == mock_user_2.id
+    ).one() == (0, 1)
+    cleanup(_session, mock_user)
+
+
+def test_write_behind_read_your_writes(
+    client: FlaskClient,
+    buffer: WriteBehind,
+    mock_user: User,
+    mock_user_2: User,
+    mock_tweet: Tweet,
+    mock_headers: dict,
+    _session: Session,
+) -> None:
+    """
+    Тест для проверки, что автор изменений видит их при следующем чтении,
+    не дожидаясь фоновой записи
+    :param client: FlaskClient
+    :param buffer: WriteBehind
+    :param mock_user: User
+    :param mock_user_2: User
+    :param mock_tweet: Tweet
+    :param mock_headers: dict
+    :param _session: Session
+    :return: None
+    """
+    client.post(f"/api/tweets/{mock_tweet.id}/likes", headers=mock_headers)
+    client.post(f"/api/users/{mock_user_2.id}/follow", headers=mock_headers)
+    assert len(buffer) == 2
+
+    tweet = client.get("/api/tweets/", headers=mock_headers).json["tweets"][0]
+    assert tweet["like_count"] == 1
+    profile = client.get("/api/users/me", headers=mock_headers).json["user"]
+    assert profile["following_count"] == 1
+    assert len(buffer) == 0
+    cleanup(_session, mock_user)
+
+
+def test_write_behind_batch_size_and_close(
+    buffer: WriteBehind,
+    mock_user: User,
+    mock_user_2: User,
+    mock_tweet: Tweet,
+    _session: Session,
+) -> None:
+    """
+    Тест для проверки записи фоновым потоком при накоплении batch_size
+    событий и записи оставшихся событий при остановке
+    :param buffer: WriteBehind
+    :param mock_user: User
+    :param mock_user_2: User
+    :param mock_tweet: Tweet
+    :param _session: Session
+    :return: None
+    """
+    buffer.batch_size = 2
+    write_behind.submit(write_behind.LIKE, mock_user.id, mock_tweet.id, True)
+    write_behind.submit(write_behind.LIKE, mock_user_2.id, mock_tweet.id, True)
+    deadline = time.monotonic() + 5
+    while buffer.flushed < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert _session.query(Like).filter(Like.tweet_id == mock_tweet.id).count() == 2
+
+    write_behind.submit(write_behind.LIKE, mock_user_2.id, mock_tweet.id, False)
+    write_behind.configure(None)
+    assert buffer.flushed == 3
+    assert (
+        _session.query(Tweet.like_count).filter(Tweet.id == mock_tweet.id).scalar() == 1
+    )
+    cleanup(_session, mock_user, mock_user_2)
+
+
+def test_write_behind_drops_invalid_events(
+    buffer: WriteBehind, mock_user: User, mock_tweet: Tweet, _session: Session
+) -> None:
+    """
+    Тест для проверки, что событие, нарушающее ограничения БД, отбрасывается,
+    а остальные события пачки записываются
+    :param buffer: WriteBehind
+    :param mock_user: User
+    :param mock_tweet: Tweet
+    :param _session: Session
+    :return: None
+    """
+    write_behind.submit(write_behind.LIKE, mock_user.id, mock_tweet.id, True)
+    write_behind.submit(write_behind.LIKE, mock_user.id, -1, True)
+    buffer.flush()
+    assert (buffer.flushed, buffer.failed) == (1, 1)
+    assert _session.query(Like).filter(Like.user_id == mock_user.id).count() == 1
+    cleanup(_session, mock_user)
@@ -0,0 +1,288 @@
+import datetime
+import heapq
+import os
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import select, tuple_, union, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.sql import Select
+
+from src.models import TWEET_PAGE_OPTIONS, Follow, TimelineEntry, Tweet, User, session
+
+FEED_MODE = os.environ.get("FEED_MODE", "read")
+CELEBRITY_THRESHOLD = int(os.environ.get("CELEBRITY_THRESHOLD", 10000))
+
+ENTRY_COLUMNS = ["user_id", "tweet_id", "author_id", "datetime"]
+
+
+def fanout_enabled() -> bool:
+    """
+    Функция для проверки, ведутся ли предрассчитанные ленты
+    (FEED_MODE=write или hybrid). В режиме read лента строится при чтении,
+    а функции записи ничего не делают
+    :return: bool
+    """
+    return FEED_MODE in ("write", "hybrid")
+
+
+def update_celebrities(user_ids: Optional[Iterable[int]] = None) -> List[int]:
+    """
+    Функция для пересчёта флага user.is_celebrity по follower_count
+    у пользователей user_ids (None - у всех) в режиме hybrid. Твиты авторов,
+    переставших быть знаменитостями, раскладываются по лентам их
+    подписчиков в той же транзакции, иначе они пропали бы из лент: при
+    чтении подмешиваются только твиты знаменитостей. Возвращает id
+    пользователей с изменившимся флагом
+    :param user_ids: Optional[Iterable[int]]
+    :return: List[int]
+    """
+    if FEED_MODE != "hybrid":
+        return []
+    is_celebrity = User.follower_count >= CELEBRITY_THRESHOLD
+    statement = (
+        update(User)
+        .where(User.is_celebrity != is_celebrity)
+        .values(is_celebrity=is_celebrity)
+        .returning(User.id, User.is_celebrity)
+        .execution_options(synchronize_session=False)
+    )
+    if user_ids is not None:
+        statement = statement.where(User.id.in_(sorted(set(user_ids))))
+    changed = session.execute(statement).all()
+    demoted = [user_id for user_id, celebrity in changed if not celebrity]
+    if demoted:
+        _insert_entries(_follower_entries(Tweet.user_id.in_(demoted)))
+    return [user_id for user_id, _ in changed]
+
+
+def _own_entries(*conditions) -> Select:
+    """
+    Функция для выборки записей ленты автора по его собственным твитам
+    :return: Select
+    """
+    return select(
+        Tweet.user_id, Tweet.id, Tweet.user_id.label("author_id"), Tweet.datetime
+    ).where(Tweet.deleted_at.is_(None), *conditions)
+
+
+def _follower_entries(*conditions) -> Select:
+    """
+    Функция для выборки записей лент подписчиков по твитам авторов,
+    кроме твитов знаменитостей в режиме hybrid
+    :return: Select
+    """
+    query = (
+        select(Follow.following_user_id, Tweet.id, Tweet.user_id, Tweet.datetime)
+        .join(Follow, Follow.followed_user_id == Tweet.user_id)
+        .where(Tweet.deleted_at.is_(None), *conditions)
+    )
+    if FEED_MODE == "hybrid":
+        query = query.join(User, User.id == Tweet.user_id).where(
+            User.is_celebrity.is_(False)
+        )
+    return query
+
+
+def _insert_entries(entries: Select) -> int:
+    """
+    Функция для вставки записей в ленты одним INSERT ... SELECT,
+    уже существующие записи пропускаются
+    :param entries: Select
+    :return: int
+    """
+    stmt = insert(TimelineEntry).from_select(ENTRY_COLUMNS, entries)
+    return session.execute(stmt.on_conflict_do_nothing()).rowcount
+
+
+def on_tweet_created(tweet: Tweet) -> None:
+    """
+    Функция для добавления нового твита в ленты автора и его подписчиков.
+    Вызывается после flush, в той же транзакции, что и создание твита
+    :param tweet: Tweet
+    :return: None
+    """
+    if not fanout_enabled():
+        return
+    if FEED_MODE == "hybrid":
+        # Блокировка строки автора упорядочивает твит с изменением его флага
+        # знаменитости: иначе твит, созданный во время пересчёта флага,
+        # не попал бы ни в ленты, ни в раскладку при понижении автора
+        session.execute(
+            select(User.id).where(User.id == tweet.user_id).with_for_update(read=True)
+        )
+    _insert_entries(
+        union(
+            _own_entries(Tweet.id == tweet.id), _follower_entries(Tweet.id == tweet.id)
+        )
+    )
+
+
+def on_follow(following_id: int, followed_id: int) -> None:
+    """
+    Функция для добавления в ленту подписчика всех твитов нового автора.
+    Вызывается после flush новой подписки
+    :param following_id: int
+    :param followed_id: int
+    :return: None
+    """
+    on_follows([(following_id, followed_id)])
+
+
+def on_follows(pairs: List[Tuple[int, int]]) -> None:
+    """
+    Функция для добавления в ленты твитов новых авторов по парам
+    (following_user_id, followed_user_id) одним запросом. Вызывается после
+    изменения счётчиков подписчиков: авторы, достигшие CELEBRITY_THRESHOLD,
+    сначала становятся знаменитостями
+    :param pairs: List[Tuple[int, int]]
+    :return: None
+    """
+    if not fanout_enabled() or not pairs:
+        return
+    update_celebrities(followed for _, followed in pairs)
+    _insert_entries(
+        _follower_entries(
+            tuple_(Follow.following_user_id, Follow.followed_user_id).in_(pairs)
+        )
+    )
+
+
+def on_unfollow(following_id: int, followed_id: int) -> None:
+    """
+    Функция для удаления из ленты подписчика твитов автора, от которого он
+    отписался. Записи удалённых твитов удаляет фоновая очистка (src/purge.py)
+    :param following_id: int
+    :param followed_id: int
+    :return: None
+    """
+    on_unfollows([(following_id, followed_id)])
+
+
+def on_unfollows(pairs: List[Tuple[int, int]]) -> None:
+    """
+    Функция для удаления из лент твитов авторов по парам
+    (following_user_id, followed_user_id) одним запросом, собственные твиты
+    пользователя не удаляются. Авторы, у которых подписчиков стало меньше
+    CELEBRITY_THRESHOLD, перестают быть знаменитостями
+    :param pairs: List[Tuple[int, int]]
+    :return: None
+    """
+    pairs = [
+        (following, followed) for following, followed in pairs if following != followed
+    ]
+    if not fanout_enabled() or not pairs:
+        return
+    session.query(TimelineEntry).filter(
+        tuple_(TimelineEntry.user_id, TimelineEntry.author_id).in_(pairs)
+    ).delete(synchronize_session=False)
+    update_celebrities(followed for _, followed in pairs)
+
+
+def rebuild_timelines() -> int:
+    """
+    Функция для полного пересчёта лент и флагов знаменитостей по таблицам
+    tweet и follow, используется при включении режима и для миграции существующих данных
+    :return: int
+    """
+    session.query(TimelineEntry).delete(synchronize_session=False)
+    update_celebrities()
+    count = _insert_entries(_own_entries())
+    count += _insert_entries(_follower_entries())
+    session.commit()
+    return count
+
+
+def timeline_query(
+    user_id: int, limit: int, position: Optional[Tuple[datetime.datetime, int]] = None
+) -> Select:
+    """
+    Функция для построения запроса страницы ленты по предрассчитанной
+    таблице timeline
+    :param user_id: int
+    :param limit: int
+    :param position: Tuple[datetime, int] | None
+    :return: Select
+    """
+    query = (
+        select(Tweet)
+        .options(*TWEET_PAGE_OPTIONS)
+        .join(TimelineEntry, TimelineEntry.tweet_id == Tweet.id)
+        .where(TimelineEntry.user_id == user_id, Tweet.deleted_at.is_(None))
+    )
+    if position:
+        query = query.where(
+            tuple_(TimelineEntry.datetime, TimelineEntry.tweet_id) < tuple_(*position)
+        )
+    return query.order_by(
+        TimelineEntry.datetime.desc(), TimelineEntry.tweet_id.desc()
+    ).limit(limit)
+
+
+def celebrity_query(
+    user_id: int, limit: int, position: Optional[Tuple[datetime.datetime, int]] = None
+) -> Select:
+    """
+    Функция для построения запроса страницы твитов всех знаменитостей,
+    на которых подписан пользователь, одним запросом в порядке ленты
+    :param user_id: int
+    :param limit: int
+    :param position: Tuple[datetime, int] | None
+    :return: Select
+    """
+    followed_celebrities = (
+        select(Follow.followed_user_id)
+        .join(User, User.id == Follow.followed_user_id)
+        .where(Follow.following_user_id == user_id, User.is_celebrity)
+    )
+    query = (
+        select(Tweet)
+        .options(*TWEET_PAGE_OPTIONS)
+        .where(Tweet.user_id.in_(followed_celebrities), Tweet.deleted_at.is_(None))
+    )
+    if position:
+        query = query.where(tuple_(Tweet.datetime, Tweet.id) < tuple_(*position))
+    return query.order_by(Tweet.datetime.desc(), Tweet.id.desc()).limit(limit)
+
+
+def merge_streams(streams: List[List[Tweet]], limit: int) -> List[Tweet]:
+    """
+    Функция для слияния отсортированных по (datetime, id) страниц ленты
+    без повторов
+    :param streams: List[List[Tweet]]
+    :param limit: int
+    :return: List[Tweet]
+    """
+    if len(streams) == 1:
+        return streams[0]
+    tweets = list()
+    seen = set()
+    merged = heapq.merge(*streams, key=lambda x: (x.datetime, x.id), reverse=True)
+    for tweet in merged:
+        if tweet.id not in seen:
+            seen.add(tweet.id)
+            tweets.append(tweet)
+        if len(tweets) == limit:
+            break
+    return tweets
+
+
+def home_tweets(
+    user_id: int, limit: int, position: Optional[Tuple[datetime.datetime, int]] = None
+) -> List[Tweet]:
+    """
+    Функция для получения страницы ленты из предрассчитанной таблицы.
+    В режиме hybrid твиты знаменитостей, на которых подписан пользователь,
+    загружаются одним запросом и подмешиваются слиянием по (datetime, id)
+    :param user_id: int
+    :param limit: int
+    :param position: Tuple[datetime, int] | None
+    :return: List[Tweet]
+    """
+    streams = [
+        session.execute(timeline_query(user_id, limit, position)).scalars().all()
+    ]
+    if FEED_MODE == "hybrid":
+        streams.append(
+            session.execute(celebrity_query(user_id, limit, position)).scalars().all()
+        )
+    return merge_streams(streams, limit)
@@ -0,0 +1,409 @@
+import atexit
+import datetime
+import hashlib
+import logging
+import mimetypes
+import multiprocessing
+import os
+import tempfile
+import time
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor
+from typing import BinaryIO, Dict, List, Optional
+
+from sqlalchemy import delete, exists, func, or_, select, update
+from werkzeug.exceptions import RequestEntityTooLarge
+
+from src.images import render_variants
+from src.models import Media, SessionLocal, TweetMedia, session
+
+MAX_CONTENT_LENGTH = int(os.environ.get("MAX_CONTENT_LENGTH", 16 * 1024 * 1024))
+ALLOWED_EXTENSIONS = frozenset(
+    os.environ.get("ALLOWED_EXTENSIONS", "png,jpg,jpeg").lower().split(",")
+)
+UPLOAD_CHUNK_SIZE = int(os.environ.get("UPLOAD_CHUNK_SIZE", 64 * 1024))
+MEDIA_GC_GRACE_HOURS = float(os.environ.get("MEDIA_GC_GRACE_HOURS", 24))
+MEDIA_GC_BATCH_SIZE = int(os.environ.get("MEDIA_GC_BATCH_SIZE", 1000))
+MEDIA_WORKERS = int(os.environ.get("MEDIA_WORKERS", 2))
+# Через сколько секунд захват записи без результата считается брошенным
+MEDIA_PROCESSING_TIMEOUT = int(os.environ.get("MEDIA_PROCESSING_TIMEOUT", 600))
+MEDIA_PROCESSING_ATTEMPTS = int(os.environ.get("MEDIA_PROCESSING_ATTEMPTS", 3))
+# Публичный префикс ссылок на файлы: /media/ за nginx или адрес CDN
+MEDIA_URL = os.environ.get("MEDIA_URL", "/media/")
+# Префикс internal location nginx для X-Accel-Redirect, пустое значение -
+# файл отдаёт само приложение (разработка и тесты без nginx)
+MEDIA_ACCEL_REDIRECT = os.environ.get("MEDIA_ACCEL_REDIRECT", "")
+# Имена файлов содержат хеш содержимого, поэтому ответ не устаревает
+MEDIA_MAX_AGE = int(os.environ.get("MEDIA_MAX_AGE", 365 * 24 * 3600))
+MEDIA_CACHE_CONTROL = f"private, max-age={MEDIA_MAX_AGE}, immutable"
+
+# В mimetypes до Python 3.11 нет WebP
+mimetypes.add_type("image/webp", ".webp")
+
+logger = logging.getLogger("twitter log")
+
+
+def check_extension(filename: Optional[str]) -> str:
+    """
+    Функция для проверки расширения загружаемого файла по ALLOWED_EXTENSIONS
+    :param filename: Optional[str]
+    :return: str
+    """
+    extension = os.path.splitext(filename or "")[1].lstrip(".").lower()
+    if extension not in ALLOWED_EXTENSIONS:
+        raise ValueError(
+            f"File extension is not allowed: {filename!r}, "
+            f"expected one of {', '.join(sorted(ALLOWED_EXTENSIONS))}"
+        )
+    return extension
+
+
+def media_path(folder: str, digest: str, extension: str) -> str:
+    """
+    Функция для получения пути файла по его хешу: файлы раскладываются
+    по двум уровням поддиректорий, чтобы в одной директории не было
+    слишком много файлов (media/ab/cd/abcd....png)
+    :param folder: str
+    :param digest: str
+    :param extension: str
+    :return: str
+    """
+    return os.path.join(folder, digest[:2], digest[2:4], f"{digest}.{extension}")
+
+
+def media_url(link: str, folder: str, prefix: str = MEDIA_URL) -> str:
+    """
+    Функция для получения ссылки на файл по его пути в folder:
+    media/ab/cd/<hash>.medium.webp -> /media/ab/cd/<hash>.medium.webp.
+    Содержимое по ссылке никогда не меняется, её можно кешировать навсегда
+    :param link: str
+    :param folder: str
+    :param prefix: str
+    :return: str
+    """
+    relative = os.path.relpath(link, folder).replace(os.sep, "/")
+    return f"{prefix.rstrip('/')}/{relative}"
+
+
+def media_headers(path: str, folder: str, accel_redirect: str) -> Dict[str, str]:
+    """
+    Функция для заголовков ответа с файлом медиа после проверки доступа.
+    При заданном accel_redirect тело не отправляется: nginx по заголовку
+    X-Accel-Redirect сам отдаёт файл из internal location
+    :param path: str
+    :param folder: str
+    :param accel_redirect: str
+    :return: Dict[str, str]
+    """
+    headers = {
+        "Content-Type": mimetypes.guess_type(path)[0] or "application/octet-stream",
+        "Cache-Control": MEDIA_CACHE_CONTROL,
+    }
+    if accel_redirect:
+        headers["X-Accel-Redirect"] = media_url(path, folder, accel_redirect)
+    return headers
+
+
+class StagedUpload:
+    """
+    Временный файл загрузки в UPLOAD_FOLDER, в который данные пишутся
+    по частям с подсчётом размера и SHA-256. Превышение MAX_CONTENT_LENGTH
+    прерывает загрузку, незафиксированный файл удаляется при закрытии
+    """
+
+    def __init__(self, folder: str, limit: int = MAX_CONTENT_LENGTH) -> None:
+        os.makedirs(folder, exist_ok=True)
+        self.limit = limit
+        self.size = 0
+        self.hash = hashlib.sha256()
+        self.file = tempfile.NamedTemporaryFile(
+            dir=folder, prefix=".upload-", delete=False
+        )
+        self.committed = False
+
+    def __getattr__(self, name: str):
+        return getattr(self.file, name)
+
+    def write(self, chunk: bytes) -> int:
+        """
+        Метод для записи очередной части файла
+        :param chunk: bytes
+        :return: int
+        """
+        self.size += len(chunk)
+        if self.size > self.limit:
+            self.close()
+            raise RequestEntityTooLarge(
+                f"File is larger than {self.limit} bytes allowed"
+            )
+        self.hash.update(chunk)
+        return self.file.write(chunk)
+
+    @property
+    def sha256(self) -> str:
+        return self.hash.hexdigest()
+
+    def commit(self, path: str) -> str:
+        """
+        Метод для атомарного переименования загруженного файла в path,
+        читатели никогда не видят недописанный файл
+        :param path: str
+        :return: str
+        """
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.file.close()
+        os.replace(self.file.name, path)
+        self.committed = True
+        return path
+
+    def close(self) -> None:
+        """
+        Метод для закрытия файла, незафиксированная загрузка удаляется
+        :return: None
+        """
+        self.file.close()
+        if not self.committed and os.path.exists(self.file.name):
+            os.remove(self.file.name)
+
+
+def stage_upload(
+    stream: BinaryIO, folder: str, limit: int = MAX_CONTENT_LENGTH
+) -> StagedUpload:
+    """
+    Функция для копирования потока во временный файл частями по
+    UPLOAD_CHUNK_SIZE байт, память не зависит от размера файла. Уже
+    записанная при разборе запроса загрузка возвращается как есть
+    :param stream: BinaryIO
+    :param folder: str
+    :param limit: int
+    :return: StagedUpload
+    """
+    if isinstance(stream, StagedUpload):
+        return stream
+    staged = StagedUpload(folder, limit)
+    try:
+        while True:
+            chunk = stream.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                return staged
+            staged.write(chunk)
+    except BaseException:
+        staged.close()
+        raise
+
+
+def unreferenced_media(grace_hours: float = MEDIA_GC_GRACE_HOURS) -> tuple:
+    """
+    Функция для условий выборки медиа, на которые не ссылается ни один
+    твит и которые загружались раньше, чем grace_hours часов назад. Повторная
+    загрузка обновляет uploaded_at, поэтому медиа, которое сейчас
+    прикрепляют к твиту, не удаляется
+    :param grace_hours: float
+    :return: tuple
+    """
+    return (
+        Media.uploaded_at < func.now() - datetime.timedelta(hours=grace_hours),
+        ~exists(select(TweetMedia.media_id).where(TweetMedia.media_id == Media.id)),
+    )
+
+
+def remove_media(conditions: tuple, batch_size: int = MEDIA_GC_BATCH_SIZE) -> int:
+    """
+    Функция для удаления медиа по условиям вместе с их файлами и вариантами.
+    Строки удаляются пачками по batch_size, файлы удаляются до фиксации
+    транзакции, поэтому одновременная повторная загрузка того же файла
+    дождётся удаления строки и запишет файл заново
+    :param conditions: tuple
+    :param batch_size: int
+    :return: int
+    """
+    removed = 0
+    while True:
+        batch = select(Media.id).where(*conditions).limit(batch_size)
+        rows = session.execute(
+            delete(Media)
+            .where(Media.id.in_(batch.scalar_subquery()), *conditions)
+            .returning(Media.link, Media.variants)
+            .execution_options(synchronize_session=False)
+        ).all()
+        for link, variants in rows:
+            paths = [link] + [
+                path
+                for formats in (variants or {}).values()
+                for path in formats.values()
+            ]
+            for path in paths:
+                if path and os.path.exists(path):
+                    os.remove(path)
+        session.commit()
+        removed += len(rows)
+        if len(rows) < batch_size:
+            return removed
+
+
+def collect_media_garbage(
+    folder: str,
+    grace_hours: float = MEDIA_GC_GRACE_HOURS,
+    batch_size: int = MEDIA_GC_BATCH_SIZE,
+) -> int:
+    """
+    Функция для удаления медиа, на которые не ссылается ни один твит и
+    которые загружались раньше, чем grace_hours часов назад, вместе с их
+    файлами и вариантами, а также брошенных временных файлов загрузок
+    :param folder: str
+    :param grace_hours: float
+    :param batch_size: int
+    :return: int
+    """
+    removed = remove_media(unreferenced_media(grace_hours), batch_size)
+    if os.path.isdir(folder):
+        stale = time.time() - grace_hours * 3600
+        for name in os.listdir(folder):
+            path = os.path.join(folder, name)
+            if name.startswith(".upload-") and os.path.getmtime(path) < stale:
+                os.remove(path)
+    return removed
+
+
+class MediaProcessor:
+    """
+    Пул процессов для создания вариантов изображений. Загрузка не ждёт
+    обработки: задача ставится в пул после фиксации записи Media, а
+    результат сохраняется в media.variants по её завершении. Задачу ставит
+    только тот, кто захватил запись (вставил её или отметил время захвата
+    в processing_started_at), поэтому одновременно запись обрабатывается
+    один раз. Захват снимается и после неудачи, чтобы запись можно было
+    обработать повторно (process_pending_media)
+    """
+
+    def __init__(self, workers: int = MEDIA_WORKERS) -> None:
+        self.workers = workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pid: Optional[int] = None
+
+    def _executor(self) -> ProcessPoolExecutor:
+        # Пул создаётся в каждом процессе при первой задаче, процессы
+        # запускаются через spawn, так как fork многопоточного воркера
+        # может унаследовать захваченные блокировки
+        if self._pool is None or self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._pool = ProcessPoolExecutor(
+                self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._pool
+
+    def submit(self, media_id: int, link: str) -> Future:
+        """
+        Метод для постановки захваченной записи Media в очередь обработки,
+        возвращаемый Future завершается после сохранения вариантов
+        :param media_id: int
+        :param link: str
+        :return: Future
+        """
+        saved: Future = Future()
+        rendered = self._executor().submit(render_variants, link)
+        rendered.add_done_callback(lambda done: self._save(media_id, done, saved))
+        return saved
+
+    @staticmethod
+    def _save(media_id: int, rendered: Future, saved: Future) -> None:
+        error: Optional[BaseException] = None
+        values: dict = {"processing_started_at": None}
+        try:
+            values["variants"] = rendered.result()
+        except (Exception, CancelledError) as exc:
+            error = exc
+            logger.error(f"Media (ID: {media_id}) processing failed: {exc}")
+        # Отдельная сессия: колбэк выполняется в потоке пула, а если
+        # обработка уже завершилась - в потоке, поставившем задачу, и не
+        # должен трогать его сессию
+        try:
+            with SessionLocal.begin() as db_session:
+                db_session.execute(
+                    update(Media)
+                    .where(Media.id == media_id)
+                    .values(**values)
+                    .execution_options(synchronize_session=False)
+                )
+        except Exception as exc:
+            logger.error(f"Media (ID: {media_id}) processing was not saved: {exc}")
+            error = error or exc
+        if error is None:
+            saved.set_result(media_id)
+        else:
+            saved.set_exception(error)
+
+    def close(self) -> None:
+        """
+        Метод для ожидания поставленных задач и остановки пула
+        :return: None
+        """
+        if self._pool is not None and self._pid == os.getpid():
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+
+media_processor = MediaProcessor()
+atexit.register(media_processor.close)
+
+
+def pending_media(timeout: int = MEDIA_PROCESSING_TIMEOUT) -> tuple:
+    """
+    Функция для условий выборки медиа, ожидающих обработки: варианты не
+    созданы, попытки не исчерпаны, запись не захвачена или захват старше
+    timeout секунд
+    :param timeout: int
+    :return: tuple
+    """
+    return (
+        Media.variants.is_(None),
+        Media.processing_attempts < MEDIA_PROCESSING_ATTEMPTS,
+        or_(
+            Media.processing_started_at.is_(None),
+            Media.processing_started_at
+            < func.now() - datetime.timedelta(seconds=timeout),
+        ),
+    )
+
+
+def process_pending_media(
+    batch_size: int = MEDIA_GC_BATCH_SIZE, timeout: int = MEDIA_PROCESSING_TIMEOUT
+) -> int:
+    """
+    Функция для создания вариантов медиа, загруженных до появления
+    обработки, а также брошенных или неудачных обработок: записи
+    захватываются пачками и обрабатываются пулом. Её удобно запускать
+    по расписанию
+    :param batch_size: int
+    :param timeout: int
+    :return: int
+    """
+    processed = 0
+    while True:
+        batch = (
+            select(Media.id)
+            .where(*pending_media(timeout))
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        claimed = session.execute(
+            update(Media)
+            .where(Media.id.in_(batch.scalar_subquery()), *pending_media(timeout))
+            .values(
+                processing_started_at=func.now(),
+                processing_attempts=Media.processing_attempts + 1,
+            )
+            .returning(Media.id, Media.link)
+            .execution_options(synchronize_session=False)
+        ).all()
+        session.commit()
+        futures: List[Future] = [
+            media_processor.submit(media_id, link)
+            for media_id, link in claimed
+            if link and os.path.exists(link)
+        ]
+        for future in futures:
+            future.exception()
+        processed += len(futures)
+        if len(claimed) < batch_size:
+            return processed
@@ -1,103 +1,529 @@
-from typing import Union
+import base64
+import datetime
+import os
+from collections import defaultdict
+from typing import BinaryIO, Dict, Iterable, List, Optional, Tuple, Union
 
-from sqlalchemy import and_, exc
+from sqlalchemy import (
+    Integer,
+    and_,
+    column,
+    event,
+    exc,
+    func,
+    inspect,
+    literal,
+    literal_column,
+    or_,
+    select,
+    true,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Query
+from sqlalchemy.sql import Select
 
-from src.models import Follow, Like, Media, Tweet, User, session
+from src import purge, search, tags, timeline, write_behind
+from src.cache import RedisTier, TieredCache, TTLCache, invalidate_on_commit
+from src.counters import write_follows, write_likes
+from src.images import MEDIA_FEED_FORMAT, feed_link
+from src.models import (
+    TWEET_PAGE_OPTIONS,
+    Follow,
+    Like,
+    Media,
+    Tweet,
+    TweetMedia,
+    User,
+    session,
+)
+from src.uploads import (
+    check_extension,
+    media_path,
+    media_processor,
+    media_url,
+    stage_upload,
+)
 
+FEED_PAGE_SIZE = int(os.environ.get("FEED_PAGE_SIZE", 50))
+FEED_MAX_PAGE_SIZE = int(os.environ.get("FEED_MAX_PAGE_SIZE", 200))
+FEED_ORDER = (Tweet.datetime.desc(), Tweet.id.desc())
+LIKES_SAMPLE_SIZE = int(os.environ.get("LIKES_SAMPLE_SIZE", 3))
+LIST_PAGE_SIZE = int(os.environ.get("LIST_PAGE_SIZE", 100))
+LIST_MAX_PAGE_SIZE = int(os.environ.get("LIST_MAX_PAGE_SIZE", 1000))
+UPLOAD_FOLDER = os.environ.get("UPLOAD_FOLDER", "media/")
+USER_CACHE_SIZE = int(os.environ.get("USER_CACHE_SIZE", 100000))
+USER_CACHE_TTL = int(os.environ.get("USER_CACHE_TTL", 60))
+USER_CACHE_REDIS_URL = os.environ.get("USER_CACHE_REDIS_URL")
+USER_CACHE_REDIS_TTL = int(os.environ.get("USER_CACHE_REDIS_TTL", 3600))
 
-def show_tweets(user_id: int) -> dict:
+user_cache = TieredCache(
+    TTLCache(maxsize=USER_CACHE_SIZE, ttl=USER_CACHE_TTL),
+    RedisTier(USER_CACHE_REDIS_URL, "user_name", USER_CACHE_REDIS_TTL)
+    if USER_CACHE_REDIS_URL
+    else None,
+)
+
+
+@event.listens_for(User, "after_update")
+def _invalidate_renamed_user(mapper, connection, target: User) -> None:
+    """
+    Функция для сброса кеша имени после фиксации переименования пользователя
+    """
+    state = inspect(target)
+    if state.attrs.name.history.has_changes():
+        invalidate_on_commit(state.session, user_cache, target.id)
+
+
+@event.listens_for(User, "after_delete")
+def _invalidate_deleted_user(mapper, connection, target: User) -> None:
+    """
+    Функция для сброса кеша имени после фиксации удаления пользователя
+    """
+    invalidate_on_commit(inspect(target).session, user_cache, target.id)
+
+
+def user_names(user_ids: Iterable[int]) -> Dict[int, str]:
+    """
+    Функция для получения имён пользователей по id через общий кеш,
+    недостающие имена загружаются одним запросом IN (...)
+    :param user_ids: Iterable[int]
+    :return: Dict[int, str]
+    """
+    user_ids = set(user_ids)
+    names = user_cache.get_many(user_ids)
+    missing = user_ids - names.keys()
+    if missing:
+        loaded = dict(
+            session.query(User.id, User.name).filter(User.id.in_(missing)).all()
+        )
+        user_cache.set_many(loaded)
+        names.update(loaded)
+    return names
+
+
+def encode_cursor(tweet: Tweet) -> str:
+    """
+    Функция для кодирования позиции твита в ленте в непрозрачный курсор
+    :param tweet: Tweet
+    :return: str
+    """
+    raw = f"{tweet.datetime.isoformat()}|{tweet.id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime.datetime, int]:
+    """
+    Функция для декодирования курсора ленты в пару (datetime, id)
+    :param cursor: str
+    :return: Tuple[datetime, int]
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        timestamp, tweet_id = raw.split("|")
+        return datetime.datetime.fromisoformat(timestamp), int(tweet_id)
+    except ValueError as exc:
+        raise ValueError(f"Invalid cursor: {cursor}") from exc
+
+
+def encode_id_cursor(id_: int) -> str:
     """
-    Функция для отобраджения информации твитов в ленте по user_id
+    Функция для кодирования id последней строки страницы в непрозрачный курсор
+    :param id_: int
+    :return: str
+    """
+    return base64.urlsafe_b64encode(str(id_).encode()).decode().rstrip("=")
+
+
+def decode_id_cursor(cursor: str) -> int:
+    """
+    Функция для декодирования курсора списка в id
+    :param cursor: str
+    :return: int
+    """
+    try:
+        return int(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError as exc:
+        raise ValueError(f"Invalid cursor: {cursor}") from exc
+
+
+def feed_conditions(
+    user_id: int, position: Optional[Tuple[datetime.datetime, int]] = None
+) -> list:
+    """
+    Функция для условий выборки ленты по user_id: твиты самого пользователя
+    и его подписок. Если передана позиция (datetime, id), выбираются только
+    более старые твиты
     :param user_id: int
-    :return: dict
+    :param position: Tuple[datetime, int] | None
+    :return: list
     """
-    followings = session.query(Follow).filter(Follow.following_user_id == user_id).all()
-    tweets_respond = list()
-    tweets = list()
-    my_tweets = session.query(Tweet).filter(Tweet.user_id == user_id).all()
-    tweets.extend(my_tweets)
-    if followings:
-        for follow in followings:
-            user_tweets = (
-                session.query(Tweet)
-                .filter(Tweet.user_id == follow.followed_user_id)
-                .all()
-            )
-            tweets.extend(user_tweets)
-    tweets = sorted(tweets, key=lambda x: x.datetime, reverse=True)
-    for tweet in tweets:
-        media_obj = list()
-        likes = list()
-        if tweet.media:
-            for media_id in tweet.media:
-                media_obj.append(session.query(Media).get(media_id))
-        else:
-            media_obj = []
-        like_query = session.query(Like).filter(Like.tweet_id == tweet.id).all()
-        if like_query:
-            for like in like_query:
-                likes.append(
-                    {
-                        "user_id": like.user_id,
-                        "name": session.query(User).get(like.user_id).name,
-                    }
-                )
-        else:
-            likes = []
-        resp = {
+    followed_ids = select(Follow.followed_user_id).where(
+        Follow.following_user_id == user_id
+    )
+    conditions = [
+        or_(Tweet.user_id == user_id, Tweet.user_id.in_(followed_ids)),
+        Tweet.deleted_at.is_(None),
+    ]
+    if position:
+        conditions.append(tuple_(Tweet.datetime, Tweet.id) < tuple_(*position))
+    return conditions
+
+
+def feed_query(
+    user_id: int, position: Optional[Tuple[datetime.datetime, int]] = None
+) -> Query:
+    """
+    Функция для построения запроса ленты по user_id одним запросом,
+    отсортированным на стороне БД
+    :param user_id: int
+    :param position: Tuple[datetime, int] | None
+    :return: Query
+    """
+    return (
+        session.query(Tweet)
+        .options(*TWEET_PAGE_OPTIONS)
+        .filter(*feed_conditions(user_id, position))
+        .order_by(*FEED_ORDER)
+    )
+
+
+def hydrate_tweets(tweets: List[Tweet]) -> List[dict]:
+    """
+    Функция для сборки ответа ленты по списку твитов, загруженных с
+    TWEET_PAGE_OPTIONS (автор и вложения). Последние лайкнувшие страницы
+    загружаются одним запросом независимо от количества лайков, их имена
+    берутся из общего кеша
+    :param tweets: List[Tweet]
+    :return: List[dict]
+    """
+    if not tweets:
+        return []
+    tweet_ids = [tweet.id for tweet in tweets]
+    likes = defaultdict(list)
+    for tweet_id, liker_id in session.execute(likes_sample(tweet_ids)):
+        likes[tweet_id].append(liker_id)
+    liker_ids = {liker_id for likers in likes.values() for liker_id in likers}
+    return serialize_tweets(tweets, likes, user_names(liker_ids))
+
+
+def media_links(media: Iterable[Media]) -> List[str]:
+    """
+    Функция для ссылок на вложения твита в ленте
+    :param media: Iterable[Media]
+    :return: List[str]
+    """
+    return [
+        media_url(feed_link(item.link, item.variants), UPLOAD_FOLDER) for item in media
+    ]
+
+
+def media_file(
+    media_id: int, variant: Optional[str] = None, fmt: Optional[str] = None
+) -> str:
+    """
+    Функция для получения пути к файлу медиа: исходного файла или
+    варианта variant в формате fmt
+    :param media_id: int
+    :param variant: Optional[str]
+    :param fmt: Optional[str]
+    :return: str
+    """
+    row = session.execute(
+        select(Media.link, Media.variants).where(Media.id == media_id)
+    ).first()
+    if row is None:
+        raise ValueError(f"Media (ID: {media_id}) not found")
+    link, variants = row
+    if variant is None:
+        return link
+    path = (variants or dict()).get(variant, dict()).get(fmt or MEDIA_FEED_FORMAT)
+    if path is None:
+        raise ValueError(f"Media (ID: {media_id}) has no variant {variant!r}")
+    return path
+
+
+def likes_sample(tweet_ids: List[int], with_names: bool = False) -> Select:
+    """
+    Функция для запроса последних LIKES_SAMPLE_SIZE лайкнувших по каждому
+    твиту: LATERAL подзапрос читает не больше LIKES_SAMPLE_SIZE строк индекса
+    на твит, сколько бы лайков у него ни было
+    :param tweet_ids: List[int]
+    :param with_names: bool
+    :return: Select
+    """
+    sample = select(Like.id, Like.user_id).where(Like.tweet_id == Tweet.id)
+    if with_names:
+        sample = sample.join(User, User.id == Like.user_id).add_columns(User.name)
+    sample = sample.order_by(Like.id.desc()).limit(LIKES_SAMPLE_SIZE).lateral()
+    columns = [Tweet.id, sample.c.user_id]
+    if with_names:
+        columns.append(sample.c.name)
+    return (
+        select(*columns)
+        .join(sample, true())
+        .where(Tweet.id.in_(tweet_ids))
+        .order_by(Tweet.id, sample.c.id.desc())
+    )
+
+
+def serialize_tweets(
+    tweets: List[Tweet],
+    likes: Dict[int, List[int]],
+    names: Dict[int, str],
+) -> List[dict]:
+    """
+    Функция для сборки словарей ответа ленты из загруженных данных
+    страницы: names - имена лайкнувших
+    :param tweets: List[Tweet]
+    :param likes: Dict[int, List[int]]
+    :param names: Dict[int, str]
+    :return: List[dict]
+    """
+    return [
+        {
             "id": tweet.id,
             "content": tweet.text,
-            "attachments": [
-                media.link if media is not None else None for media in media_obj
+            "attachments": media_links(tweet.media),
+            "author": {"id": tweet.user_id, "name": tweet.author.name},
+            "like_count": tweet.like_count,
+            "likes": [
+                {"user_id": liker_id, "name": names[liker_id]}
+                for liker_id in likes.get(tweet.id, [])
             ],
-            "author": {
-                "id": tweet.user_id,
-                "name": session.query(User).get(tweet.user_id).name,
-            },
-            "likes": likes,
         }
-        tweets_respond.append(resp)
+        for tweet in tweets
+    ]
+
+
+def show_tweets(
+    user_id: int, limit: int = FEED_PAGE_SIZE, cursor: Optional[str] = None
+) -> dict:
+    """
+    Функция для отобраджения информации твитов в ленте по user_id.
+    Лента разбита на страницы по ключу (datetime, id): курсор указывает
+    на последний твит предыдущей страницы
+    :param user_id: int
+    :param limit: int
+    :param cursor: str | None
+    :return: dict
+    """
+    limit = max(1, min(limit, FEED_MAX_PAGE_SIZE))
+    position = decode_cursor(cursor) if cursor else None
+    if timeline.fanout_enabled():
+        tweets = timeline.home_tweets(user_id, limit + 1, position)
+    else:
+        tweets = feed_query(user_id, position).limit(limit + 1).all()
+    return tweets_response(tweets, limit, hydrate_tweets(tweets[:limit]))
 
-    response = {"result": True, "tweets": tweets_respond}
+
+def tweets_response(tweets: List[Tweet], limit: int, tweets_respond: list) -> dict:
+    """
+    Функция для сборки ответа ленты: страница и курсор следующей страницы
+    :param tweets: List[Tweet]
+    :param limit: int
+    :param tweets_respond: list
+    :return: dict
+    """
+    next_cursor = encode_cursor(tweets[limit - 1]) if len(tweets) > limit else None
+    response = {"result": True, "tweets": tweets_respond, "next_cursor": next_cursor}
+    return response
+
+
+def search_position(
+    query: Optional[str], cursor: Optional[str]
+) -> Optional[search.Position]:
+    """
+    Функция для проверки поискового запроса и декодирования курсора поиска
+    :param query: str | None
+    :param cursor: str | None
+    :return: Position | None
+    """
+    if not query or not query.strip():
+        raise ValueError("Search query is empty")
+    return search.decode_search_cursor(cursor) if cursor else None
+
+
+def show_search(
+    query: Optional[str],
+    limit: int = search.SEARCH_PAGE_SIZE,
+    cursor: Optional[str] = None,
+) -> dict:
+    """
+    Функция для полнотекстового поиска твитов по query: результаты
+    отсортированы по релевантности, страницы разбиты по ключу (rank, id)
+    :param query: str | None
+    :param limit: int
+    :param cursor: str | None
+    :return: dict
+    """
+    limit = max(1, min(limit, search.SEARCH_MAX_PAGE_SIZE))
+    position = search_position(query, cursor)
+    found = search.find_tweets(query, limit + 1, position)
+    tweets = [tweet for tweet, _ in found[:limit]]
+    return search_response(found, limit, hydrate_tweets(tweets))
+
+
+def search_response(
+    found: List[Tuple[Tweet, float]], limit: int, tweets_respond: list
+) -> dict:
+    """
+    Функция для сборки ответа поиска: страница и курсор следующей страницы
+    :param found: List[Tuple[Tweet, float]]
+    :param limit: int
+    :param tweets_respond: list
+    :return: dict
+    """
+    next_cursor = None
+    if len(found) > limit:
+        tweet, rank = found[limit - 1]
+        next_cursor = search.encode_search_cursor(rank, tweet.id)
+    return {"result": True, "tweets": tweets_respond, "next_cursor": next_cursor}
+
+
+def likes_page(tweet_id: int, limit: int, before_id: Optional[int] = None) -> Select:
+    """
+    Функция для запроса страницы лайкнувших твит, от новых к старым,
+    с именами пользователей одним JOIN
+    :param tweet_id: int
+    :param limit: int
+    :param before_id: int | None
+    :return: Select
+    """
+    statement = (
+        select(Like.id, Like.user_id, User.name)
+        .join(User, User.id == Like.user_id)
+        .where(Like.tweet_id == tweet_id)
+    )
+    if before_id is not None:
+        statement = statement.where(Like.id < before_id)
+    return statement.order_by(Like.id.desc()).limit(limit + 1)
+
+
+def show_likes(
+    tweet_id: int, limit: int = LIST_PAGE_SIZE, cursor: Optional[str] = None
+) -> dict:
+    """
+    Функция для отображения полного списка лайкнувших твит по страницам
+    :param tweet_id: int
+    :param limit: int
+    :param cursor: str | None
+    :return: dict
+    """
+    limit = max(1, min(limit, LIST_MAX_PAGE_SIZE))
+    before_id = decode_id_cursor(cursor) if cursor else None
+    rows = session.execute(likes_page(tweet_id, limit, before_id)).all()
+    return likes_response(rows, limit)
+
+
+def likes_response(rows: List[Tuple[int, int, str]], limit: int) -> dict:
+    """
+    Функция для сборки ответа списка лайкнувших из строк (like_id, user_id,
+    name): страница и курсор следующей страницы
+    :param rows: List[Tuple[int, int, str]]
+    :param limit: int
+    :return: dict
+    """
+    next_cursor = encode_id_cursor(rows[limit - 1][0]) if len(rows) > limit else None
+    response = {
+        "result": True,
+        "likes": [
+            {"user_id": user_id, "name": name} for _, user_id, name in rows[:limit]
+        ],
+        "next_cursor": next_cursor,
+    }
+    return response
+
+
+def follows_page(
+    user_id: int, followers: bool, limit: int, before_id: Optional[int] = None
+) -> Select:
+    """
+    Функция для запроса страницы подписчиков (followers=True) или подписок
+    пользователя, от новых к старым, с именами одним JOIN
+    :param user_id: int
+    :param followers: bool
+    :param limit: int
+    :param before_id: int | None
+    :return: Select
+    """
+    if followers:
+        owner, other = Follow.followed_user_id, Follow.following_user_id
+    else:
+        owner, other = Follow.following_user_id, Follow.followed_user_id
+    statement = (
+        select(Follow.id, User.id, User.name)
+        .join(User, User.id == other)
+        .where(owner == user_id)
+    )
+    if before_id is not None:
+        statement = statement.where(Follow.id < before_id)
+    return statement.order_by(Follow.id.desc()).limit(limit + 1)
+
+
+def show_follows(
+    user_id: int,
+    followers: bool,
+    limit: int = LIST_PAGE_SIZE,
+    cursor: Optional[str] = None,
+) -> dict:
+    """
+    Функция для отображения подписчиков или подписок пользователя по страницам
+    :param user_id: int
+    :param followers: bool
+    :param limit: int
+    :param cursor: str | None
+    :return: dict
+    """
+    limit = max(1, min(limit, LIST_MAX_PAGE_SIZE))
+    before_id = decode_id_cursor(cursor) if cursor else None
+    rows = session.execute(follows_page(user_id, followers, limit, before_id)).all()
+    return follows_response(rows, limit)
+
+
+def follows_response(rows: List[Tuple[int, int, str]], limit: int) -> dict:
+    """
+    Функция для сборки ответа списка пользователей из строк (follow_id,
+    user_id, name): страница и курсор следующей страницы
+    :param rows: List[Tuple[int, int, str]]
+    :param limit: int
+    :return: dict
+    """
+    next_cursor = encode_id_cursor(rows[limit - 1][0]) if len(rows) > limit else None
+    response = {
+        "result": True,
+        "users": [{"id": user_id, "name": name} for _, user_id, name in rows[:limit]],
+        "next_cursor": next_cursor,
+    }
     return response
 
 
 def show_profile(user_id: int) -> dict:
     """
-    Функция для отобраджения информации профиля по user_id
+    Функция для отобраджения информации профиля по user_id, подписчики
+    и подписки доступны постранично через show_follows
     :param user_id: int
     :return: dict
     """
     user = session.query(User).filter(User.id == user_id).first()
-    followers_query = [
-        a.following_user_id
-        for a in session.query(Follow).filter(Follow.followed_user_id == user_id).all()
-    ]
-    followed_query = [
-        a.followed_user_id
-        for a in session.query(Follow).filter(Follow.following_user_id == user_id).all()
-    ]
-    if followers_query:
-        followers = list()
-        for follower_id in followers_query:
-            follower_user = session.query(User).get(follower_id)
-            followers.append({"id": follower_user.id, "name": follower_user.name})
-    else:
-        followers = []
-    if followed_query:
-        followed = list()
-        for followed_id in followed_query:
-            followed_user = session.query(User).get(followed_id)
-            followed.append({"id": followed_user.id, "name": followed_user.name})
-    else:
-        followed = []
+    return profile_response(user)
+
+
+def profile_response(user: User) -> dict:
+    """
+    Функция для сборки ответа профиля со счётчиками подписчиков и подписок
+    :param user: User
+    :return: dict
+    """
     response = {
         "result": True,
         "user": {
             "id": user.id,
             "name": user.name,
-            "followers": followers,
-            "following": followed,
+            "follower_count": user.follower_count,
+            "following_count": user.following_count,
         },
     }
     return response
@@ -140,3 +566,172 @@ def liked(user_id, tweet_id) -> Union[Like, bool]:
         )
     except exc.NoResultFound:
         return False
+
+
+def attach_media(tweet_id: int, media_ids: List[int]) -> None:
+    """
+    Функция для прикрепления медиа к твиту в порядке media_ids
+    :param tweet_id: int
+    :param media_ids: List[int]
+    :return: None
+    """
+    attached = values(
+        column("media_id", Integer), column("position", Integer), name="attached"
+    ).data([(media_id, position) for position, media_id in enumerate(media_ids, 1)])
+    session.execute(
+        insert(TweetMedia).from_select(
+            ["tweet_id", "position", "media_id"],
+            select(literal(tweet_id), attached.c.position, Media.id).join(
+                Media, Media.id == attached.c.media_id
+            ),
+        )
+    )
+
+
+def create_tweet(user_id: int, text: str, media_ids: Optional[List[int]]) -> Tweet:
+    """
+    Функция для создания твита. Вложения сохраняются в порядке media_ids
+    одним запросом, несуществующие id пропускаются
+    :param user_id: int
+    :param text: str
+    :param media_ids: List[int] | None
+    :return: Tweet
+    """
+    new_tweet = Tweet(user_id=user_id, text=text)
+    session.add(new_tweet)
+    session.flush()
+    if media_ids:
+        attach_media(new_tweet.id, media_ids)
+    timeline.on_tweet_created(new_tweet)
+    tags.on_tweet_created(new_tweet)
+    session.commit()
+    search.on_tweet_created(new_tweet)
+    purge.on_tweet_created()
+    return new_tweet
+
+
+def store_media(stream: BinaryIO, filename: str, folder: str = UPLOAD_FOLDER) -> int:
+    """
+    Функция для сохранения медиа файла из потока, возвращает id записи Media.
+    Файл хранится по хешу содержимого: при повторной загрузке того же файла
+    возвращается существующая запись, а временный файл удаляется. Превышение
+    MAX_CONTENT_LENGTH и расширение не из ALLOWED_EXTENSIONS отклоняются.
+    Варианты изображения для новой записи создаются пулом процессов после
+    ответа
+    :param stream: BinaryIO
+    :param filename: str
+    :param folder: str
+    :return: int
+    """
+    extension = check_extension(filename)
+    staged = stage_upload(stream, folder)
+    try:
+        digest = staged.sha256
+        # xmax = 0 только у вставленной строки: варианты ставит в очередь
+        # тот запрос, который создал запись
+        media_id, file_path, inserted = session.execute(
+            insert(Media)
+            .values(
+                hash=digest,
+                link=media_path(folder, digest, extension),
+                processing_started_at=func.now(),
+                processing_attempts=1,
+            )
+            .on_conflict_do_update(
+                index_elements=[Media.hash], set_={"uploaded_at": func.now()}
+            )
+            .returning(
+                Media.id, Media.link, (literal_column("xmax") == 0).label("inserted")
+            )
+        ).one()
+        session.commit()
+        # Файл переносится после фиксации записи: если фиксация не удалась,
+        # на диске не остаётся файла без записи Media, которого не увидит
+        # collect_media_garbage
+        if not os.path.exists(file_path):
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            staged.commit(file_path)
+    finally:
+        staged.close()
+    if inserted:
+        media_processor.submit(media_id, file_path)
+    return media_id
+
+
+def remove_tweet(tweet_id: int) -> None:
+    """
+    Функция для удаления твита одним UPDATE: твит помечается удалённым и
+    сразу пропадает из лент и поиска, а его лайки, записи лент и медиа
+    удаляет фоновая очистка. Время удаления не зависит от числа лайков,
+    повторное удаление ничего не делает
+    :param tweet_id: int
+    :return: None
+    """
+    deleted = session.execute(
+        update(Tweet)
+        .where(Tweet.id == tweet_id, Tweet.deleted_at.is_(None))
+        .values(deleted_at=func.now())
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    if deleted:
+        tags.on_tweet_deleted(tweet_id)
+    session.commit()
+    search.on_tweet_deleted(tweet_id)
+    purge.on_tweet_deleted(tweet_id)
+
+
+def add_like(user_id: int, tweet_id: int) -> None:
+    """
+    Функция для добавления лайка одним INSERT ... ON CONFLICT DO NOTHING
+    вместе с увеличением счётчика, повторный лайк игнорируется. В режиме
+    отложенной записи лайк ставится в очередь write_behind
+    :param user_id: int
+    :param tweet_id: int
+    :return: None
+    """
+    if write_behind.submit(write_behind.LIKE, user_id, tweet_id, True):
+        return
+    write_likes([(user_id, tweet_id)], True)
+    session.commit()
+
+
+def remove_like(user_id: int, tweet_id: int) -> None:
+    """
+    Функция для удаления лайка одним DELETE вместе с уменьшением счётчика
+    :param user_id: int
+    :param tweet_id: int
+    :return: None
+    """
+    if write_behind.submit(write_behind.LIKE, user_id, tweet_id, False):
+        return
+    write_likes([(user_id, tweet_id)], False)
+    session.commit()
+
+
+def add_follow(user_id: int, followed_id: int) -> None:
+    """
+    Функция для добавления подписки одним INSERT ... ON CONFLICT DO NOTHING
+    вместе с изменением счётчиков, повторная подписка игнорируется
+    :param user_id: int
+    :param followed_id: int
+    :return: None
+    """
+    if write_behind.submit(write_behind.FOLLOW, user_id, followed_id, True):
+        return
+    if write_follows([(user_id, followed_id)], True):
+        timeline.on_follow(user_id, followed_id)
+    session.commit()
+
+
+def remove_follow(user_id: int, followed_id: int) -> None:
+    """
+    Функция для удаления подписки одним DELETE вместе с изменением счётчиков
+    :param user_id: int
+    :param followed_id: int
+    :return: None
+    """
+    if write_behind.submit(write_behind.FOLLOW, user_id, followed_id, False):
+        return
+    if write_follows([(user_id, followed_id)], False):
+        timeline.on_unfollow(user_id, followed_id)
+    session.commit()
@@ -0,0 +1,300 @@
+import atexit
+import logging
+import os
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from sqlalchemy import exc
+
+from src import timeline
+from src.counters import write_follows, write_likes
+from src.models import session
+
+LIKE = "like"
+FOLLOW = "follow"
+
+WRITE_BEHIND = os.environ.get("WRITE_BEHIND", "")
+WRITE_BEHIND_FLUSH_MS = int(os.environ.get("WRITE_BEHIND_FLUSH_MS", 50))
+WRITE_BEHIND_BATCH_SIZE = int(os.environ.get("WRITE_BEHIND_BATCH_SIZE", 1000))
+WRITE_BEHIND_MAX_PENDING = int(
+    os.environ.get("WRITE_BEHIND_MAX_PENDING", 10 * WRITE_BEHIND_BATCH_SIZE)
+)
+
+logger = logging.getLogger("twitter log")
+
+Key = Tuple[str, int, int]
+
+
+def write_events(events: Dict[Key, bool]) -> None:
+    """
+    Функция для записи свёрнутых событий в БД: по одному многострочному
+    запросу на вставку и удаление лайков и подписок вместе со счётчиками.
+    Транзакция не фиксируется
+    :param events: Dict[Key, bool]
+    :return: None
+    """
+    groups: Dict[Tuple[str, bool], List[Tuple[int, int]]] = dict()
+    for (kind, first_id, second_id), present in events.items():
+        groups.setdefault((kind, present), list()).append((first_id, second_id))
+    write_likes(groups.get((LIKE, True), []), True)
+    write_likes(groups.get((LIKE, False), []), False)
+    follows = groups.get((FOLLOW, True), [])
+    unfollows = groups.get((FOLLOW, False), [])
+    write_follows(follows, True)
+    write_follows(unfollows, False)
+    timeline.on_follows(follows)
+    timeline.on_unfollows(unfollows)
+
+
+class WriteBehind:
+    """
+    Очередь отложенной записи лайков и подписок. События по одной паре
+    сворачиваются до последнего состояния (лайк и следующий за ним отказ
+    от лайка не дают вставки), фоновый поток записывает их пачкой каждые
+    flush_ms миллисекунд или при накоплении batch_size событий
+    """
+
+    def __init__(
+        self,
+        kinds: Set[str],
+        flush_ms: int = WRITE_BEHIND_FLUSH_MS,
+        batch_size: int = WRITE_BEHIND_BATCH_SIZE,
+        max_pending: int = WRITE_BEHIND_MAX_PENDING,
+    ) -> None:
+        self.kinds = frozenset(kinds)
+        self.flush_ms = flush_ms
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.submitted = 0
+        self.collapsed = 0
+        self.flushed = 0
+        self.flushes = 0
+        self.failed = 0
+        self._pending: Dict[Key, bool] = dict()
+        self._users: Set[int] = set()
+        self._flushing_users: Set[int] = set()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._flush_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._closed = False
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def submit(self, kind: str, user_id: int, target_id: int, present: bool) -> None:
+        """
+        Метод для постановки события в очередь, предыдущее событие по той же
+        паре заменяется. При переполнении очереди запись выполняется
+        в вызывающем потоке
+        :param kind: str
+        :param user_id: int
+        :param target_id: int
+        :param present: bool
+        :return: None
+        """
+        with self._lock:
+            self._ensure_worker()
+            key = (kind, user_id, target_id)
+            if key in self._pending:
+                self.collapsed += 1
+            self._pending[key] = present
+            self._users.add(user_id)
+            self.submitted += 1
+            size = len(self._pending)
+            if size >= self.batch_size:
+                self._wakeup.notify()
+        if size >= self.max_pending or self._closed:
+            self.flush()
+
+    def has_pending(self, user_id: int) -> bool:
+        """
+        Метод для проверки, есть ли у пользователя незаписанные события
+        :param user_id: int
+        :return: bool
+        """
+        with self._lock:
+            return user_id in self._users or user_id in self._flushing_users
+
+    def sync(self, user_id: int) -> None:
+        """
+        Метод для записи очереди перед чтением, если в ней есть события
+        пользователя, чтобы он видел свои изменения
+        :param user_id: int
+        :return: None
+        """
+        if self.has_pending(user_id):
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Метод для записи накопленных событий одной транзакцией. При нарушении
+        ограничений БД (например, твит уже удалён) события записываются
+        по одному и отбрасываются только ошибочные, при других ошибках
+        возвращаются в очередь
+        :return: int
+        """
+        with self._flush_lock:
+            with self._lock:
+                events, self._pending = self._pending, dict()
+                self._flushing_users, self._users = self._users, set()
+            try:
+                if events:
+                    self._write(events)
+                return len(events)
+            finally:
+                with self._lock:
+                    self._flushing_users = set()
+
+    def _write(self, events: Dict[Key, bool]) -> None:
+        failed = 0
+        try:
+            write_events(events)
+            session.commit()
+        except exc.IntegrityError:
+            session.rollback()
+            for key, present in events.items():
+                try:
+                    write_events({key: present})
+                    session.commit()
+                except exc.IntegrityError as error:
+                    session.rollback()
+                    failed += 1
+                    logger.warning(f"Dropped {key} ({present}): {error.orig}")
+        except Exception:
+            session.rollback()
+            with self._lock:
+                for key, present in events.items():
+                    self._pending.setdefault(key, present)
+                    self._users.add(key[1])
+            raise
+        self.flushed += len(events) - failed
+        self.failed += failed
+        self.flushes += 1
+
+    def _ensure_worker(self) -> None:
+        # Поток запускается при первом событии в каждом процессе, так как
+        # воркеры uwsgi создаются fork после импорта приложения
+        if self._closed or (self._thread is not None and self._pid == os.getpid()):
+            return
+        self._pid = os.getpid()
+        self._thread = threading.Thread(
+            target=self._run, name="write-behind", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if len(self._pending) < self.batch_size and not self._closed:
+                    self._wakeup.wait(self.flush_ms / 1000)
+                if self._closed:
+                    return
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Write-behind flush failed, retrying")
+                time.sleep(self.flush_ms / 1000)
+
+    def close(self) -> None:
+        """
+        Метод для остановки фонового потока и записи оставшихся событий,
+        вызывается при завершении процесса
+        :return: None
+        """
+        with self._lock:
+            self._closed = True
+            self._wakeup.notify()
+        if self._thread is not None and self._thread.is_alive():
+            self._thread.join()
+        self.flush()
+
+
+class WriteBehindCollector:
+    """
+    Коллектор Prometheus для размера очереди и числа записанных событий
+    """
+
+    def __init__(self, write_behind: WriteBehind) -> None:
+        self.write_behind = write_behind
+
+    def collect(self) -> Iterator:
+        for kind in ("submitted", "collapsed", "flushed", "flushes", "failed"):
+            yield CounterMetricFamily(
+                f"write_behind_{kind}",
+                f"Number of write-behind {kind}",
+                value=getattr(self.write_behind, kind),
+            )
+        yield GaugeMetricFamily(
+            "write_behind_pending",
+            "Number of pending write-behind events",
+            value=len(self.write_behind),
+        )
+
+
+buffer: Optional[WriteBehind] = None
+
+
+def configure(write_behind: Optional[WriteBehind]) -> None:
+    """
+    Функция для включения (или отключения при None) отложенной записи,
+    предыдущая очередь записывается и останавливается
+    :param write_behind: Optional[WriteBehind]
+    :return: None
+    """
+    global buffer
+    if buffer is not None:
+        buffer.close()
+    buffer = write_behind
+
+
+def submit(kind: str, user_id: int, target_id: int, present: bool) -> bool:
+    """
+    Функция для постановки события в очередь, если для этого вида событий
+    включена отложенная запись
+    :param kind: str
+    :param user_id: int
+    :param target_id: int
+    :param present: bool
+    :return: bool
+    """
+    if buffer is None or kind not in buffer.kinds:
+        return False
+    buffer.submit(kind, user_id, target_id, present)
+    return True
+
+
+def has_pending(user_id: int) -> bool:
+    """
+    Функция для проверки, есть ли у пользователя незаписанные события
+    :param user_id: int
+    :return: bool
+    """
+    return buffer is not None and buffer.has_pending(user_id)
+
+
+def sync(user_id: int) -> None:
+    """
+    Функция для записи очереди перед чтением пользователя
+    :param user_id: int
+    :return: None
+    """
+    if buffer is not None:
+        buffer.sync(user_id)
+
+
+def close() -> None:
+    """
+    Функция для записи оставшихся событий при завершении процесса
+    :return: None
+    """
+    if buffer is not None:
+        buffer.close()
+
+
+if WRITE_BEHIND:
+    configure(WriteBehind({kind.strip() for kind in WRITE_BEHIND.split(",")}))
+atexit.register(close)